@@ -0,0 +1,317 @@
+"""
+(参考) Sleator, Tarjan "A Data Structure for Dynamic Trees"
+辺の追加と削除ができる森を管理する Link-Cut Tree
+各頂点に値を持たせ、2 頂点を結ぶパス上の値の集約 (和、最大値など) を求められる。各操作はならし O(lgn)
+
+クエリ
+link(u, v) -> u と v (異なる木に属する) を辺で結ぶ。
+cut(u, v) -> 辺 u - v を削除する。
+connected(u, v) -> u と v が同じ木に属するか判定する。
+path_query(u, v) -> u - v パス上の頂点の値を func で集約した値を求める (非連結なら None)。
+find_root(u) -> u の属する木の (現在の) 根を求める。
+lca(u, v, root) -> root を根とした時の u と v の最小共通祖先を求める (非連結なら None)。
+get_value(u), set_value(u, value) -> 頂点 u の値を取得、変更する。
+add_node(value) -> 値 value の孤立した頂点を追加し、その番号を返す。
+
+link, cut などの操作の内部で木の根は付け替えられる (evert) ので、根付き木としての問い合わせ (lca) では根を毎回指定する。
+
+
+<algorithm>
+森を「優先パス」に分解し、各優先パスを根に近い順 (深さの昇順) を中序とする splay 木で管理する。
+splay 木の根は、その優先パスの最も根に近い頂点の親 (path-parent) を parent に持つ。
+(parent[x] の左右の子が x でなければ、x は splay 木の根で parent[x] は path-parent)
+    - access(x): x から根までのパスを一つの優先パスにし、x をその splay 木の根にする
+    - evert(x): access(x) の後に splay 木全体を反転 (遅延評価) し、x を木の根にする
+    - link(u, v): evert(u) して u の path-parent を v とする
+    - cut(u, v): evert(u), access(v) すると v の splay 木は u, v の 2 頂点だけになるので切り離す
+    - lca(u, v, root): evert(root), access(u) の後に access(v) で最後に path-parent を辿った先の頂点が u と v の分岐点、すなわち LCA
+    - path_query(u, v): evert(u), access(v) すると v の splay 木が u - v パスそのものになるので、その集約値を読む
+      (v を含む木の根を求めると同時に連結判定もできる。根 u が splay 木の根に来るので u の集約値を読めばよい)
+
+頂点ごとにオブジェクトを作ると属性アクセスとメモリが重いので、各フィールドを平行な配列で持つ。
+番号 0 は番兵 (null) とし、頂点 i は内部では i+1 番に置く (番兵の集約値を単位元にしておくと子の有無の分岐が要らない)。
+範囲外の頂点 (特に -1 は番兵を指してしまう) は公開メソッドで IndexError とする。
+"""
+
+
+from array import array
+from typing import Any, Callable, Optional, Sequence
+
+
+
+class LinkCutTree:
+    def __init__(self, n: int, values: Optional[Sequence[Any]]=None,
+                 func: Callable[[Any, Any], Any]=max, identity: Any=-float('inf')):
+        """
+        n 頂点 0, 1, ..., n-1 からなる辺のない森を作成する O(n)
+
+        Args:
+            values (list): 各頂点の初期値 (省略した場合は全て identity)
+            func (function): パス上の値を集約する、結合的かつ可換な二項演算
+            identity (object): func の単位元
+        """
+        self.func = func
+        self.identity = identity
+        self.left = array('i', [0]) * (n + 1)
+        self.right = array('i', [0]) * (n + 1)
+        self.parent = array('i', [0]) * (n + 1)    # splay 木での親、または splay 木の根なら path-parent
+        self.rev = bytearray(n + 1)    # rev[x] が 1 なら x の部分木の左右の反転が未反映
+        self.val = [identity] + (list(values) if values is not None else [identity] * n)
+        if len(self.val) != n + 1:
+            raise ValueError(f"LinkCutTree(): len(values) must be n = {n}")
+        self.agg = self.val[:]    # agg[x] は x を根とする splay 木の部分木の値の集約
+
+    def add_node(self, value: Any=None) -> int:
+        """ 値 value (省略した場合は単位元) の孤立した頂点を O(1) で追加し、その番号を返す """
+        if value is None:
+            value = self.identity
+        self.left.append(0)
+        self.right.append(0)
+        self.parent.append(0)
+        self.rev.append(0)
+        self.val.append(value)
+        self.agg.append(value)
+        return len(self.val) - 2
+
+    def _node(self, u: int, name: str) -> int:
+        """ 頂点 u の内部での番号 u+1 を返す。範囲外なら IndexError (u = -1 が番兵を指さないように) """
+        if not 0 <= u < len(self.val) - 1:
+            raise IndexError(f"LinkCutTree.{name}(): size is {len(self.val) - 1}. accessed [{u}]")
+        return u + 1
+
+    def _push(self, x: int) -> None:
+        """ x の反転フラグを子に伝播する """
+        if self.rev[x]:
+            l, r = self.left[x], self.right[x]
+            self.left[x], self.right[x] = r, l
+            self.rev[l] ^= 1
+            self.rev[r] ^= 1
+            self.rev[x] = 0
+
+    def _splay(self, x: int) -> None:
+        """ x をその splay 木の根にする (回転と集約値の更新は呼び出しのオーバーヘッドを避けるため展開している) """
+        left, right, parent, rev = self.left, self.right, self.parent, self.rev
+        agg, val, func = self.agg, self.val, self.func
+        p = parent[x]
+        if p == 0 or (left[p] != x and right[p] != x):
+            # 既に根 (access の中で頻繁に起こる)
+            if rev[x]:
+                l, r = left[x], right[x]
+                left[x], right[x] = r, l
+                rev[l] ^= 1
+                rev[r] ^= 1
+                rev[x] = 0
+            return
+        # 根から x までの反転フラグを上から順に伝播する
+        path = [x, p]
+        y = p
+        while True:
+            p = parent[y]
+            if p == 0 or (left[p] != y and right[p] != y):
+                break
+            path.append(p)
+            y = p
+        for y in reversed(path):
+            if rev[y]:
+                l, r = left[y], right[y]
+                left[y], right[y] = r, l
+                rev[l] ^= 1
+                rev[r] ^= 1
+                rev[y] = 0
+        while True:
+            p = parent[x]
+            if p == 0 or (left[p] != x and right[p] != x):
+                break
+            g = parent[p]
+            p_is_root = g == 0 or (left[g] != p and right[g] != p)
+            # zig-zig なら親を先に、zig-zag なら x を 2 回回転する
+            if p_is_root or (left[g] == p) != (left[p] == x):
+                rotations = (x, x) if not p_is_root else (x,)
+            else:
+                rotations = (p, x)
+            for y in rotations:
+                # y をその親 q の位置に持ち上げる
+                q = parent[y]
+                h = parent[q]
+                if left[q] == y:
+                    c = right[y]
+                    left[q] = c
+                    right[y] = q
+                else:
+                    c = left[y]
+                    right[q] = c
+                    left[y] = q
+                if c:
+                    parent[c] = q
+                # q が splay 木の根だった場合、h は path-parent なので子は付け替えない
+                if left[h] == q:
+                    left[h] = y
+                elif right[h] == q:
+                    right[h] = y
+                parent[y] = h
+                parent[q] = y
+                agg[q] = func(func(agg[left[q]], val[q]), agg[right[q]])
+            agg[x] = func(func(agg[left[x]], val[x]), agg[right[x]])
+
+    def _access(self, x: int) -> int:
+        """ x から根までを一つの優先パスとし x をその splay 木の根にする。最後に path-parent を辿った先の頂点を返す """
+        right, parent, agg, val, func = self.right, self.parent, self.agg, self.val, self.func
+        last = 0
+        y = x
+        while y:
+            self._splay(y)
+            right[y] = last    # y より深い部分を付け替える
+            agg[y] = func(func(agg[self.left[y]], val[y]), agg[last])
+            last = y
+            y = parent[y]
+        self._splay(x)
+        return last
+
+    def _evert(self, x: int) -> None:
+        """ x を木の根にする """
+        self._access(x)
+        self.rev[x] ^= 1
+
+    def _find_root(self, x: int) -> int:
+        self._access(x)
+        while True:
+            self._push(x)
+            if not self.left[x]:
+                break
+            x = self.left[x]
+        self._splay(x)
+        return x
+
+    def connected(self, u: int, v: int) -> bool:
+        """ u と v が同じ木に属するかならし O(lgn) で判定する """
+        x, y = self._node(u, 'connected'), self._node(v, 'connected')
+        self._evert(x)
+        return self._find_root(y) == x
+
+    def link(self, u: int, v: int) -> None:
+        """ 異なる木に属する u と v をならし O(lgn) で辺で結ぶ """
+        x, y = self._node(u, 'link'), self._node(v, 'link')
+        self._evert(x)
+        if self._find_root(y) == x:
+            raise ValueError(f"LinkCutTree.link(): {u} and {v} are already connected")
+        self.parent[x] = y    # x は自身の木の根かつ splay 木の根なので、path-parent を v とすればよい
+
+    def cut(self, u: int, v: int) -> None:
+        """ 辺 u - v をならし O(lgn) で削除する """
+        x, y = self._node(u, 'cut'), self._node(v, 'cut')
+        self._evert(x)
+        self._access(y)
+        # 辺 u - v があれば、y の splay 木は y と y の左の子 x のみとなっている
+        self._push(y)
+        if self.left[y] != x or self.right[x] or self.left[x]:
+            raise ValueError(f"LinkCutTree.cut(): edge {u} - {v} does not exist")
+        self.left[y] = 0
+        self.parent[x] = 0
+        self.agg[y] = self.func(self.func(self.agg[0], self.val[y]), self.agg[self.right[y]])
+
+    def path_query(self, u: int, v: int) -> Any:
+        """
+        u - v パス上の頂点の値を func で集約した値をならし O(lgn) で求める (u と v が異なる木に属する場合は None)
+        """
+        x, y = self._node(u, 'path_query'), self._node(v, 'path_query')
+        self._evert(x)
+        if self._find_root(y) != x:
+            return None
+        # x が u - v パスをなす splay 木の根になっている
+        return self.agg[x]
+
+    def find_root(self, u: int) -> int:
+        """ u の属する木の (現在の) 根をならし O(lgn) で求める """
+        return self._find_root(self._node(u, 'find_root')) - 1
+
+    def evert(self, u: int) -> None:
+        """ u をその木の根にする (ならし O(lgn)) """
+        self._evert(self._node(u, 'evert'))
+
+    def lca(self, u: int, v: int, root: int) -> Optional[int]:
+        """
+        root を根とした時の u と v の最小共通祖先をならし O(lgn) で求める
+        (u, v, root が同じ木に属さない場合は None)
+        """
+        x, y, r = self._node(u, 'lca'), self._node(v, 'lca'), self._node(root, 'lca')
+        self._evert(r)
+        if self._find_root(x) != r or self._find_root(y) != r:
+            return None
+        self._access(x)
+        return self._access(y) - 1
+
+    def get_value(self, u: int) -> Any:
+        """ 頂点 u の値を O(1) で取得する """
+        return self.val[self._node(u, 'get_value')]
+
+    def set_value(self, u: int, value: Any) -> None:
+        """ 頂点 u の値をならし O(lgn) で value に変更する """
+        x = self._node(u, 'set_value')
+        # x を splay 木の根にすれば、集約値を直すのは x だけでよい
+        self._access(x)
+        self.val[x] = value
+        self.agg[x] = self.func(self.func(self.agg[self.left[x]], value), self.agg[self.right[x]])
+
+
+
+
+if __name__ == "__main__":
+    """
+    0 - 1 - 2     5
+        |
+        3 - 4
+    """
+    lct = LinkCutTree(6, values=[5, 3, 8, 1, 7, 2])
+    for u, v in ((0, 1), (1, 2), (1, 3), (3, 4)):
+        lct.link(u, v)
+    assert(lct.connected(0, 4) and not lct.connected(0, 5))
+    assert(lct.path_query(0, 4) == 7)
+    assert(lct.path_query(2, 3) == 8)
+    lct.cut(1, 3)
+    assert(not lct.connected(0, 4))
+    lct.link(4, 5)
+    lct.link(2, 3)
+    assert(lct.path_query(0, 5) == 8)
+    """
+    0 - 1 - 2 - 3 - 4 - 5
+    """
+    assert(lct.lca(0, 4, root=5) == 4)
+    assert(lct.lca(0, 4, root=2) == 2)
+    assert(lct.lca(3, 3, root=0) == 3)
+    assert(lct.find_root(4) == 0)    # 直前の lca で 0 を根にした
+    lct.set_value(2, 0)
+    assert(lct.get_value(2) == 0 and lct.path_query(1, 3) == 3)
+    # パス上の和
+    lct_sum = LinkCutTree(6, values=[5, 3, 8, 1, 7, 2], func=lambda a, b: a + b, identity=0)
+    for u, v in ((0, 1), (1, 2), (1, 3), (3, 4)):
+        lct_sum.link(u, v)
+    assert(lct_sum.path_query(2, 4) == 8 + 3 + 1 + 7)
+    assert(lct_sum.path_query(2, 5) is None)
+    print(" * assertion test ok * ")
+
+    # ベンチマーク: 頂点数 N のランダムな木を作り、Q 回の操作 (辺を切ってランダムな頂点につなぎ直す、パスの和、LCA) を行う
+    import time
+    from random import randrange
+    for N, Q in ((10**5, 10**5), (10**5, 10**6)):
+        lct = LinkCutTree(N, values=list(range(N)), func=lambda a, b: a + b, identity=0)
+        parent = [-1] + [randrange(v) for v in range(1, N)]
+        t0 = time.perf_counter()
+        for v in range(1, N):
+            lct.link(v, parent[v])
+        t1 = time.perf_counter()
+        for q in range(Q):
+            v = randrange(1, N)
+            if q % 3 == 0:
+                # 0 を根とした時の v の親を、v の部分木に含まれない頂点につなぎ替える
+                lct.cut(v, parent[v])
+                p = randrange(N)
+                if lct.connected(p, v):
+                    p = parent[v]
+                lct.link(v, p)
+                parent[v] = p
+            elif q % 3 == 1:
+                lct.path_query(v, randrange(N))
+            else:
+                lct.lca(v, randrange(N), 0)
+        t2 = time.perf_counter()
+        print(f"N = {N}: {N - 1} links {t1 - t0:.2f} sec, {Q} mixed operations {t2 - t1:.2f} sec")
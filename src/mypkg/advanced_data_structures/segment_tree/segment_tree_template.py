@@ -20,7 +20,19 @@ class SegTree:
     @classmethod
     def _right(cls, k):
         return 2 * k + 1
-    
+
+    def build(self, L):
+        """
+        set a_1, ..., a_len(L) to L in O(size) (instead of calling update() one by one in O(size lg size))
+        Args:
+            L (sequence): values of a_1, a_2, ... (len(L) <= size)
+        """
+        if len(L) > self.size:
+            raise ValueError(f'len(L) should be less than or equals to size. got len(L)={len(L)} size={self.size}')
+        self.table[self.n0:self.n0 + len(L)] = L
+        for table_k in range(self.n0 - 1, 0, -1):
+            self.table[table_k] = self.func(self.table[SegTree._left(table_k)], self.table[SegTree._right(table_k)])
+
     def update(self, k, x):
         """
         update the value of a_k to x
@@ -73,8 +85,7 @@ if __name__ == "__main__":
         L = [randint(0, 10**3) for _ in range(NUM)]
 
         RMQ = SegTree(NUM, identity=float('inf'), func=min)
-        for i, num in enumerate(L):
-            RMQ.update(i+1, num)    # 1-index
+        RMQ.build(L)
         for _ in range(10**3):
             a = randint(1, NUM)
             b = randint(1, NUM)
@@ -13,14 +13,17 @@ Ford-Fulkerson 法を用いた最大フローの算出
       BFS              O(V+E) * O(VE) = O(VE^2) 
 前者を Ford-Fulkerson algorithm, 後者を Edmonds-Karp algorithm という。
 
+フローを流した後のネットワークに辺を追加したり容量を変更したりした場合、フローを 0 から流し直す必要はない。
+現在の残余グラフ上でさらに増加可能経路を探せば最大フローへと再最適化される。
+(容量を現在の流量より小さくした場合は、溢れた分をまず迂回させ、迂回できなかった分を start, goal 側へ押し戻してから再最適化する)
+
 verified @ABC010D
 """
 
 
 
 from collections import deque
-from copy import deepcopy
-from typing import Sequence, List, Union, Any, Optional
+from typing import List, Union, Optional
 
 Num = Union[int, float]
 
@@ -47,9 +50,12 @@ class FordFulkerson:
     ポイントはフローを流した際 '逆向きにどのくらい流せるか (押し戻しが許されるか)' も更新するところ。
     有向グラフについて。 capacity C で k だけ流したとして順流 / 逆流 = C/0 -> C-k/k と更新される。
     """
-    def __init__(self, num_of_v: int):
+    def __init__(self, num_of_v: int, verbose: bool=False):
         self.num_of_v = num_of_v    # 頂点数
         self.graph = [[] for _ in range(num_of_v)]   # 隣接する頂点のインデックスの代わりに Edge を収納した隣接リスト
+        self.verbose = verbose    # True の時は増加可能経路を発見するたびに経路と現在のフローを print する
+        self.edges = []    # add_edge() ではった順辺を、はった順に収納したリスト
+        self.capacities = []    # capacities[i] は edges[i] の初期容量
     
     def __repr__(self) -> str:
         return ', '.join([str(e) for i in range(self.num_of_v) for e in self.graph[i] if not e.is_rev])
@@ -69,25 +75,87 @@ class FordFulkerson:
             here (int)
             to (int)
             capacity (number)
+        Returns:
+            i (int): はった辺の番号 (何番目にはった辺か)。get_flow(), change_capacity() で用いる
         """
         forward = Edge(here, to, capacity, is_rev=False, rev_edge=None)
         backward = Edge(to, here, 0, is_rev=True, rev_edge=forward)
         forward.rev_edge = backward
         self.graph[here].append(forward)
         self.graph[to].append(backward)
+        self.edges.append(forward)
+        self.capacities.append(capacity)
+        return len(self.edges) - 1
+    
+    def reserve_state(self) -> List[Num]:
+        """
+        最大フローの計算では Edge の capacity は順次書き換えられる。後で現在の状態に戻す必要がある場合は予め各辺の容量のスナップショットを O(E) で取り出しておく。
+        (Edge オブジェクトごと deepcopy すると重いので、容量のみを flat なリストで保存する。[順辺 0, 逆辺 0, 順辺 1, 逆辺 1, ...] の順)
+        """
+        state = []
+        for e in self.edges:
+            state.append(e.capacity)
+            state.append(e.rev_edge.capacity)
+        return state
     
-    def reserve_state(self) -> None:
-        """最大フローの計算では Edge の capacity は順次書き換えられる。後で初期状態に戻す必要がある場合は予め self.graph のディープコピーを取り出しておく。"""
-        return deepcopy(self.graph)
+    def restore_state(self, state: List[Num]) -> None:
+        """ reserve_state() により取り出した state の状態へ、フローネットワークを O(E) で restore する。"""
+        for i, e in enumerate(self.edges):
+            e.capacity = state[2*i]
+            e.rev_edge.capacity = state[2*i+1]
     
-    def restore_state(self, graph_state) -> None:
-        """ reserve_state() により取り出した graph_state の状態へ、フローネットワークを restore する。"""
-        self.graph = graph_state
+    def reset(self) -> None:
+        """ O(E) で全ての辺の容量を add_edge() (または change_capacity()) で与えた初期容量に戻し、流量 0 の状態にする """
+        for e, c in zip(self.edges, self.capacities):
+            e.capacity = c
+            e.rev_edge.capacity = 0
+    
+    def get_flow(self, i: int) -> Num:
+        """ i 番目にはった辺に現在流れている流量を返す """
+        return self.edges[i].rev_edge.capacity
+    
+    def change_capacity(self, i: int, new_capacity: Num, start_ind: int, goal_ind: int) -> Num:
+        """
+        i 番目にはった辺の容量を new_capacity に変更する。start_ind から goal_ind へ流れている現在のフローはなるべく保たれる。
+        現在の流量が new_capacity を超えている場合、溢れた分を残余グラフ上で迂回させ、迂回できなかった分は start_ind, goal_ind 側へ押し戻す。
+        押し戻した (start_ind から goal_ind へのフローの値が減少した) 量を返す。
+        その後 ford_fulkerson() または edmonds_karp() を呼べば、現在のフローから再最適化した増加分が得られる。
+            flow = FF.ford_fulkerson(s, t)
+            flow -= FF.change_capacity(i, c, s, t)
+            flow += FF.ford_fulkerson(s, t)    # 容量変更後の最大フロー
+
+        Args:
+            i (int): add_edge() が返した辺の番号
+            new_capacity (number)
+            start_ind (int): 現在のフローの入口
+            goal_ind (int): 現在のフローの出口
+        Returns:
+            canceled (number): start_ind から goal_ind へのフローの値の減少量
+        """
+        e = self.edges[i]
+        self.capacities[i] = new_capacity
+        flow = e.rev_edge.capacity
+        if flow <= new_capacity:
+            e.capacity = new_capacity - flow
+            return 0
+        # 溢れた分 (e.here に余剰、e.to に不足が生じる) をまず e.here -> e.to の別経路に迂回させる
+        surplus = flow - new_capacity
+        e.capacity = 0
+        e.rev_edge.capacity = new_capacity
+        surplus -= self._push(e.here, e.to, surplus)
+        # 迂回できなかった分は e.here から start_ind へ、goal_ind から e.to へ押し戻す
+        if surplus > 0:
+            if e.here != start_ind:
+                self._push(e.here, start_ind, surplus)
+            if e.to != goal_ind:
+                self._push(goal_ind, e.to, surplus)
+        return surplus
     
     def ford_fulkerson(self, start_ind: int, goal_ind: int) -> Num:
         """
         増加可能経路を DFS により発見する。
         O(V+E) * O(|f*|) = O(E|f*|) (但し f* は最大フローの値) 
+        現在の残余グラフ上で増加させたフローの量を返す (流量 0 の状態から呼べば最大フローの値となる)
         """
         total_flow = 0
         while True:
@@ -96,12 +164,14 @@ class FordFulkerson:
                 return total_flow
             else:
                 total_flow += self._update_flow(p)
-                print(f"path: {[start_ind]+list(map(lambda x: x.to, p))}, current flow: {total_flow}")    # 提出時にはコメントアウトする
+                if self.verbose:
+                    print(f"path: {[start_ind]+list(map(lambda x: x.to, p))}, current flow: {total_flow}")
     
     def edmonds_karp(self, start_ind: int, goal_ind: int) -> Num:
         """
         増加可能経路を BFS により発見する。
         O(V+E) * O(VE) = O(VE^2) 
+        現在の残余グラフ上で増加させたフローの量を返す (流量 0 の状態から呼べば最大フローの値となる)
         """
         total_flow = 0
         while True:
@@ -110,7 +180,8 @@ class FordFulkerson:
                 return total_flow
             else:
                 total_flow += self._update_flow(p)
-                print(f"path: {[start_ind]+list(map(lambda x: x.to, p))}, current flow: {total_flow}")    # 提出時にはコメントアウトする
+                if self.verbose:
+                    print(f"path: {[start_ind]+list(map(lambda x: x.to, p))}, current flow: {total_flow}")
         
     def _dfs(self, start_ind: int, goal_ind: int) -> List[Edge]:
         """
@@ -162,9 +233,19 @@ class FordFulkerson:
                         q.append(e)
 
     
-    def _update_flow(self, path: List[Edge]) -> Num:
-        """ Edge のリストである path において、最大フローを流し capacity を更新する。流したフローを返す。 """
-        maximum_flow = float('inf')
+    def _push(self, start_ind: int, goal_ind: int, amount: Num) -> Num:
+        """ start_ind から goal_ind へ、BFS で発見した増加可能経路に沿って高々 amount だけ流す。流せた量を返す。 """
+        pushed = 0
+        while pushed < amount:
+            p = self._bfs(start_ind, goal_ind)
+            if not p:
+                break
+            pushed += self._update_flow(p, amount - pushed)
+        return pushed
+    
+    def _update_flow(self, path: List[Edge], limit: Num=float('inf')) -> Num:
+        """ Edge のリストである path において、(高々 limit の) 最大フローを流し capacity を更新する。流したフローを返す。 """
+        maximum_flow = limit
         for e in path:
             maximum_flow = min(maximum_flow, e.capacity)    # capacity のボトルネックを発見し更新する
         for e in path:
@@ -188,7 +269,7 @@ if __name__ == "__main__":
                        (tuple()))
     
     # 逆平行有向グラフの作成
-    FF = FordFulkerson(len(adj_with_weight))
+    FF = FordFulkerson(len(adj_with_weight), verbose=True)
     for i in range(len(adj_with_weight)):
         for j, cap in adj_with_weight[i]:
             FF.add_edge(i, j, cap)
@@ -201,7 +282,7 @@ if __name__ == "__main__":
     |8->7(20)|, |8->9(50)|    
     """
 
-    # 二回実験するのでグラフの初期状態を保存しておく
+    # 二回実験するのでグラフの初期状態を保存しておく (reset() でも初期状態に戻せる)
     g = FF.reserve_state()
 
     print("Ford-Fulkerson")
@@ -229,4 +310,17 @@ if __name__ == "__main__":
     path: [0, 3, 7, 6, 8], current flow: 50
     50
     """
-    
\ No newline at end of file
+    
+    # 容量の変更と辺の追加を行い、現在のフローから再最適化する
+    FF.reset()
+    FF.verbose = False
+    flow = FF.ford_fulkerson(0, 8)
+    assert(flow == 50)
+    flow -= FF.change_capacity(14, 0, 0, 8)    # |6->8(50)| を容量 0 にする
+    flow += FF.ford_fulkerson(0, 8)
+    assert(flow == 0)
+    FF.add_edge(6, 9, 100)
+    FF.add_edge(9, 8, 100)
+    flow += FF.ford_fulkerson(0, 8)
+    assert(flow == 60)
+    print(" * assertion test ok * ")
@@ -0,0 +1,195 @@
+"""
+(参考) 蟻本 p.206-207, e-maxx "Hungarian algorithm for solving the assignment problem"
+ハンガリアン法 (Kuhn-Munkres 法) による重み付き二部マッチング (割当問題) を O(n^2 m) で解く (n <= m)
+
+n 人の労働者と m 個の仕事があり、労働者 i に仕事 j を割り当てるコストが a[i][j] であるとする。
+各労働者に相異なる仕事を一つずつ割り当てる時、コストの総和の最小値とその割り当てを求める。
+(最小費用流でも解けるが、密な行列に対してはこちらの方が速い)
+
+
+<algorithm>
+LP 双対のポテンシャル u[i] (行), v[j] (列) を u[i] + v[j] <= a[i][j] を満たすように保つ。
+等号が成り立つ辺 (タイトな辺) のみからなるグラフ上で、行を一つずつ追加しながら増加路を探す。
+    - minv[j] = 今までに訪れた行 i から列 j へのタイトさの不足 a[i][j] - u[i] - v[j] の最小値
+    - 未訪問の列のうち minv が最小の列 j1 までの不足 delta だけポテンシャルを動かすと、j1 へのタイトな辺ができる
+      (訪問済みの行は u += delta, 訪問済みの列は v -= delta, 未訪問の列は minv -= delta)
+    - j1 が未マッチなら増加路が見つかったので way を辿ってマッチングを反転させる。マッチ済みならその相手の行を訪問済みにして続ける
+各行について高々 m 回の反復、各反復で O(m) なので全体で O(n^2 m)
+各反復の O(m) の処理 (minv, way の更新と最小値の探索、ポテンシャルの更新) は列についてのベクトル演算で書けるので、
+use_numpy=True とすると NumPy で処理する (Python のループは O(nm) 回のみとなる)
+
+n > m の場合は転置して解く (割り当てられない労働者が n - m 人出る)
+"""
+
+
+from typing import Sequence, List, Tuple, Union
+
+Num = Union[int, float]
+
+
+
+def _hungarian_python(a: Sequence[Sequence[Num]], n: int, m: int) -> List[int]:
+    """ n <= m なる n * m 行列 a について、各行に割り当てられる列のリストを返す """
+    inf = float('inf')
+    # 1-index で管理する。列 0 は番兵
+    u = [0] * (n + 1)
+    v = [0] * (m + 1)
+    p = [0] * (m + 1)    # p[j] は列 j にマッチしている行 (0 なら未マッチ)
+    way = [0] * (m + 1)    # way[j] は列 j に至る交互路上で一つ前の列
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = [inf] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            row = a[i0 - 1]
+            ui0 = u[i0]
+            delta = inf
+            j1 = -1
+            for j in range(1, m + 1):
+                if not used[j]:
+                    cur = row[j - 1] - ui0 - v[j]
+                    if cur < minv[j]:
+                        minv[j] = cur
+                        way[j] = j0
+                    if minv[j] < delta:
+                        delta = minv[j]
+                        j1 = j
+            for j in range(m + 1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        # 増加路に沿ってマッチングを反転させる
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+    assignment = [-1] * n
+    for j in range(1, m + 1):
+        if p[j]:
+            assignment[p[j] - 1] = j - 1
+    return assignment
+
+
+def _hungarian_numpy(a: 'np.ndarray', n: int, m: int) -> List[int]:
+    """ _hungarian_python() の各反復における列についての処理を NumPy でベクトル化したもの """
+    import numpy as np
+    inf = float('inf')
+    a = np.asarray(a, dtype=float)
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    p = np.zeros(m + 1, dtype=np.int64)
+    way = np.zeros(m + 1, dtype=np.int64)
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = np.full(m + 1, inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            cur = np.empty(m + 1)
+            cur[0] = inf
+            cur[1:] = a[i0 - 1] - u[i0] - v[1:]
+            update = (cur < minv) & ~used
+            minv[update] = cur[update]
+            way[update] = j0
+            j1 = int(np.argmin(np.where(used, inf, minv)))
+            delta = minv[j1]
+            u[p[used]] += delta
+            v[used] -= delta
+            minv[~used] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+    assignment = [-1] * n
+    for j in range(1, m + 1):
+        if p[j]:
+            assignment[p[j] - 1] = j - 1
+    return assignment
+
+
+
+def hungarian(cost_matrix: Sequence[Sequence[Num]], use_numpy: bool=False) -> Tuple[List[int], Num]:
+    """
+    ハンガリアン法で割当問題を O(n^2 m) で解く (n = min(行数, 列数), m = max(行数, 列数))
+    各行に相異なる列を一つずつ (行数 > 列数の場合は各列に相異なる行を一つずつ) 割り当てる時、コストの総和を最小化する
+
+    Args:
+        cost_matrix (list or ndarray): コスト行列 (長方形でも良い)。各要素は有限の値とする
+        use_numpy (bool): True の時は各反復の列についての処理を NumPy でベクトル化する
+    Returns:
+        assignment (list): assignment[i] は行 i に割り当てられた列 (割り当てられない場合は -1)
+        total_cost (number): 割り当てのコストの総和
+    """
+    n = len(cost_matrix)
+    m = len(cost_matrix[0]) if n else 0
+    if n == 0 or m == 0:
+        return [-1] * n, 0
+    transposed = n > m
+    if transposed:
+        a = [list(col) for col in zip(*cost_matrix)]
+        n, m = m, n
+    else:
+        a = cost_matrix
+    solver = _hungarian_numpy if use_numpy else _hungarian_python
+    col_of_row = solver(a, n, m)
+    if transposed:
+        assignment = [-1] * m
+        for j, i in enumerate(col_of_row):
+            assignment[i] = j
+    else:
+        assignment = col_of_row
+    total_cost = sum(cost_matrix[i][j] for i, j in enumerate(assignment) if j != -1)
+    return assignment, total_cost
+
+
+
+
+if __name__ == "__main__":
+    C = ((4, 1, 3),
+         (2, 0, 5),
+         (3, 2, 2))
+    assert(hungarian(C) == ([1, 0, 2], 5))
+    assert(hungarian(C, use_numpy=True) == ([1, 0, 2], 5))
+    # 長方形の場合
+    C2 = ((7, 2),
+          (1, 9),
+          (3, 3))
+    assert(hungarian(C2) == ([1, 0, -1], 3))
+    assert(hungarian(list(zip(*C2))) == ([1, 0], 3))
+    print(" * assertion test ok * ")
+
+    # ベンチマーク (scipy.optimize.linear_sum_assignment と比較)
+    import time
+    import numpy as np
+    from scipy.optimize import linear_sum_assignment
+    rng = np.random.default_rng(0)
+    for n, python_too in ((500, True), (1000, False), (2000, False)):
+        mat = rng.integers(0, 10**6, size=(n, n))
+        t0 = time.perf_counter()
+        _, cost_np = hungarian(mat, use_numpy=True)
+        t1 = time.perf_counter()
+        rows, cols = linear_sum_assignment(mat)
+        t2 = time.perf_counter()
+        assert(cost_np == mat[rows, cols].sum())
+        line = f"n = {n}: numpy {t1 - t0:.2f} sec, scipy {t2 - t1:.3f} sec"
+        if python_too:
+            lists = mat.tolist()
+            t3 = time.perf_counter()
+            _, cost_py = hungarian(lists)
+            t4 = time.perf_counter()
+            assert(cost_py == cost_np)
+            line += f", python {t4 - t3:.2f} sec"
+        print(line)
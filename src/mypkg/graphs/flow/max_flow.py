@@ -0,0 +1,249 @@
+"""
+(参考) <Algorithm Introduction vol.2 p.319-340>
+Dinic 法と push-relabel 法 (highest-label + gap heuristic) を用いた最大フローの算出
+
+残余グラフは Edge オブジェクトではなくフラットな配列で管理する。辺 e について
+    to[e]: 行き先の頂点
+    cap[e]: 残余容量
+    rev[e]: 逆辺のインデックス
+を持ち、graph[v] は v から出る辺のインデックスのリストである。(add_edge により順辺 e と逆辺 e+1 がペアで追加される)
+
+
+<algorithm>
+Dinic 法 (O(V^2 E), 単位容量のネットワークでは O(E min(V^(2/3), E^(1/2))))
+    1. 残余グラフ上で start から BFS を行い、各頂点に level (start からの距離) をふる
+    2. level が 1 ずつ増える辺のみを用いた level graph 上で、これ以上流せなくなるまで (blocking flow となるまで) DFS で増加パスを探して流す
+       各頂点について「次に調べる辺」(current arc) を覚えておくことで、行き止まりと判明した辺を二度と調べない
+    3. goal に到達できなくなるまで 1, 2 を繰り返す
+    再帰だと深いグラフでスタックオーバーフローするので、DFS は増加パスの辺を stack に積む反復版で書いている
+
+push-relabel 法 (highest-label の選択規則で O(V^2 E^(1/2)))
+    各頂点に高さ height と超過量 excess を持たせ、プリフローを流す
+    1. start から出る辺を全て飽和させる。height[start] = V, 他の頂点は goal からの残余グラフ上の距離で初期化する
+    2. 超過量をもつ頂点 (活性頂点) のうち最も高いものを選び、自分より 1 だけ低い頂点へ押し出す (push)
+       押し出せる辺がなくなったら、残余辺の行き先の高さの最小値 + 1 へと高さを上げる (relabel)
+    3. 活性頂点がなくなるまで 2 を繰り返す。このとき goal の excess が最大フローである
+    gap heuristic: ある高さ h < V の頂点が一つもなくなったら、高さ h より上 (V 未満) の頂点は goal へ到達できない。
+                   それらの高さを一気に V + 1 へ引き上げ、無駄な relabel を省く
+"""
+
+
+
+from collections import deque
+from typing import Tuple, Union
+
+Num = Union[int, float]
+
+
+
+class MaxFlow:
+    """
+    フラットな配列で残余グラフを管理する最大フローソルバ (逆平行辺、多重辺を含んでもよい)
+
+    Attributes:
+        num_of_v (int): 頂点数
+        graph (list): graph[v] は v から出る辺 (逆辺含む) のインデックスのリスト
+        to (list): to[e] は辺 e の行き先
+        cap (list): cap[e] は辺 e の残余容量
+        rev (list): rev[e] は辺 e の逆辺のインデックス
+    """
+    def __init__(self, num_of_v: int):
+        self.num_of_v = num_of_v
+        self.graph = [[] for _ in range(num_of_v)]
+        self.to = []
+        self.cap = []
+        self.rev = []
+
+    def __repr__(self) -> str:
+        return ', '.join([f"|{self.to[e+1]}->{self.to[e]}({self.cap[e]})|" for e in range(0, len(self.to), 2)])
+
+    def add_edge(self, here: int, to: int, capacity: Num) -> int:
+        """
+        here から to へ容量 capacity の有向辺をはる。その際、to から here への初期容量 0 の逆辺も同時にはる。
+        順辺のインデックスを返す (get_edge() で参照できる)
+        """
+        e = len(self.to)
+        self.graph[here].append(e)
+        self.graph[to].append(e + 1)
+        self.to.extend((to, here))
+        self.cap.extend((capacity, 0))
+        self.rev.extend((e + 1, e))
+        return e
+
+    def get_edge(self, e: int) -> Tuple[int, int, Num, Num]:
+        """ add_edge() が返した順辺 e について (here, to, capacity, flow) を返す """
+        flow = self.cap[self.rev[e]]
+        return self.to[self.rev[e]], self.to[e], self.cap[e] + flow, flow
+
+    def dinic(self, start_ind: int, goal_ind: int) -> Num:
+        """
+        Dinic 法 (level graph + current arc を用いた反復 DFS) で最大フローを求める。O(V^2 E)
+        """
+        to, cap, rev, graph = self.to, self.cap, self.rev, self.graph
+        if start_ind == goal_ind:
+            return 0
+        total_flow = 0
+        while True:
+            # level graph の構築
+            level = [-1] * self.num_of_v
+            level[start_ind] = 0
+            q = deque([start_ind])
+            while q:
+                u = q.popleft()
+                for e in graph[u]:
+                    if cap[e] > 0 and level[to[e]] < 0:
+                        level[to[e]] = level[u] + 1
+                        q.append(to[e])
+            if level[goal_ind] < 0:
+                return total_flow
+            # blocking flow を流す
+            it = [0] * self.num_of_v    # current arc
+            path = []    # start から現在地までの辺のインデックス
+            u = start_ind
+            while True:
+                if u == goal_ind:
+                    f = min(cap[e] for e in path)
+                    for e in path:
+                        cap[e] -= f
+                        cap[rev[e]] += f
+                    total_flow += f
+                    # 最初に飽和した辺の手前まで戻る
+                    for i, e in enumerate(path):
+                        if cap[e] == 0:
+                            break
+                    del path[i:]
+                    u = to[path[-1]] if path else start_ind
+                    continue
+                adj_u = graph[u]
+                while it[u] < len(adj_u):
+                    e = adj_u[it[u]]
+                    if cap[e] > 0 and level[to[e]] == level[u] + 1:
+                        break
+                    it[u] += 1
+                if it[u] < len(adj_u):
+                    path.append(e)
+                    u = to[e]
+                else:
+                    # 行き止まり。一つ戻って、その辺を二度と調べないようにする
+                    if u == start_ind:
+                        break
+                    level[u] = -1
+                    u = to[rev[path.pop()]]
+                    it[u] += 1
+
+    def push_relabel(self, start_ind: int, goal_ind: int) -> Num:
+        """
+        highest-label 規則と gap heuristic を用いた push-relabel 法で最大フローを求める。O(V^2 E^(1/2))
+        計算後の残余グラフは (プリフローではなく) 正しいフローに対応している
+        """
+        n = self.num_of_v
+        to, cap, rev, graph = self.to, self.cap, self.rev, self.graph
+        if start_ind == goal_ind:
+            return 0
+        # goal からの残余グラフ上の距離で高さを初期化する (goal に到達できない頂点は n)
+        height = [n] * n
+        height[goal_ind] = 0
+        q = deque([goal_ind])
+        while q:
+            v = q.popleft()
+            for e in graph[v]:
+                u = to[e]
+                if cap[rev[e]] > 0 and height[u] == n and u != start_ind:
+                    height[u] = height[v] + 1
+                    q.append(u)
+        height[start_ind] = n
+        count = [0] * (2 * n + 1)    # count[h] は高さ h の頂点数 (gap の検出用)
+        for v in range(n):
+            count[height[v]] += 1
+        excess = [0] * n
+        active = [[] for _ in range(2 * n + 1)]    # active[h] は高さ h の活性頂点
+        highest = 0
+        # start から出る辺を全て飽和させる
+        for e in graph[start_ind]:
+            f = cap[e]
+            if f > 0:
+                v = to[e]
+                cap[e] -= f
+                cap[rev[e]] += f
+                excess[start_ind] -= f
+                if excess[v] == 0 and v != goal_ind:
+                    active[height[v]].append(v)
+                    highest = max(highest, height[v])
+                excess[v] += f
+        it = [0] * n    # current arc
+        while highest >= 0:
+            if not active[highest]:
+                highest -= 1
+                continue
+            u = active[highest].pop()
+            # u の超過量がなくなるまで discharge する
+            adj_u = graph[u]
+            while excess[u] > 0:
+                if it[u] == len(adj_u):
+                    # relabel
+                    old = height[u]
+                    new = 2 * n
+                    for e in adj_u:
+                        if cap[e] > 0 and height[to[e]] + 1 < new:
+                            new = height[to[e]] + 1
+                    count[old] -= 1
+                    if count[old] == 0 and old < n:
+                        # gap heuristic
+                        for v in range(n):
+                            if old < height[v] < n:
+                                count[height[v]] -= 1
+                                height[v] = n + 1
+                                count[n + 1] += 1
+                                it[v] = 0
+                        new = max(new, n + 1)
+                    height[u] = new
+                    count[new] += 1
+                    it[u] = 0
+                    continue
+                e = adj_u[it[u]]
+                v = to[e]
+                if cap[e] > 0 and height[u] == height[v] + 1:
+                    # push
+                    f = excess[u] if excess[u] < cap[e] else cap[e]
+                    cap[e] -= f
+                    cap[rev[e]] += f
+                    excess[u] -= f
+                    if excess[v] == 0 and v != start_ind and v != goal_ind:
+                        active[height[v]].append(v)
+                        highest = max(highest, height[v])
+                    excess[v] += f
+                else:
+                    it[u] += 1
+        return excess[goal_ind]
+
+
+
+if __name__ == "__main__":
+    adj_with_weight = (((1, 50), (2, 20), (3, 30)),
+                       ((2, 10), (4, 10)),
+                       ((6, 40),),
+                       ((2, 10), (7, 20)),
+                       ((5, 10), (9, 20)),
+                       ((1, 30), (2, 20), (6, 10), (9, 10)),
+                       ((8, 50),),
+                       ((6, 10),),
+                       ((7, 20), (9, 50)),
+                       (tuple()))
+
+    mf = MaxFlow(len(adj_with_weight))
+    for i in range(len(adj_with_weight)):
+        for j, cap in adj_with_weight[i]:
+            mf.add_edge(i, j, cap)
+    cap_state = mf.cap[:]
+    assert(mf.dinic(0, 8) == 50)
+    assert(mf.get_edge(0) == (0, 1, 50, 10))
+    mf.cap = cap_state[:]
+    assert(mf.push_relabel(0, 8) == 50)
+    # 計算後はフロー保存則を満たしているか
+    balance = [0] * mf.num_of_v
+    for e in range(0, len(mf.to), 2):
+        here, to, _, flow = mf.get_edge(e)
+        balance[here] -= flow
+        balance[to] += flow
+    assert(balance == [-50, 0, 0, 0, 0, 0, 0, 0, 50, 0])
+    print(" * assertion test ok * ")
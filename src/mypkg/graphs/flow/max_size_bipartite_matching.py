@@ -13,12 +13,24 @@
 を解くことができる
 
 verified @AtCoder ABC091_C
+
+
+<Hopcroft-Karp algorithm> (O(E√V))
+フローネットワークを作らず、隣接リストとマッチング相手の配列 match のみで最大マッチングを求める
+    1. 未マッチの左側頂点全てを始点として、交互路 (左 -> 右は非マッチ辺、右 -> 左はマッチ辺) 上で BFS を行い、左側頂点に層 dist をふる
+    2. 層が 1 ずつ増える交互路のみを辿る DFS で、頂点素な増加路を可能な限り見つけ、それぞれに沿ってマッチングを反転させる
+    3. 増加路がなくなるまで 1, 2 を繰り返す。フェーズ数は O(√V) で抑えられる
+初期マッチングを貪欲に作っておくと (warm start) フェーズ数が減る
+
+König の定理: 二部グラフの最小点被覆のサイズは最大マッチングのサイズに等しい
+最大マッチングにおける未マッチの左側頂点から交互路で到達可能な頂点集合を Z とすると、
+(左側 - Z) ∪ (右側 ∩ Z) が最小点被覆、その補集合が最大独立集合 (最大安定集合) となる
 """
 
 
 from collections import deque
 from copy import deepcopy
-from typing import Sequence, List, Union, Any
+from typing import Sequence, List, Tuple, Union, Any, Optional
 from .ford_fulkerson import Edge, FordFulkerson
 
 Num = Union[int, float]
@@ -59,6 +71,149 @@ def bipartite_max_matching(adj_list: Sequence[Sequence[int]], left_indices: Sequ
 
 
 
+def _hopcroft_karp_match(adj_list: Sequence[Sequence[int]], left_indices: Sequence[int], greedy: bool=True) -> List[int]:
+    """
+    Hopcroft-Karp 法で最大マッチングを求め、match[v] = (v のマッチング相手, いなければ -1) なる配列を返す
+    """
+    n = len(adj_list)
+    match = [-1] * n
+    # 貪欲法による初期マッチング (warm start)
+    if greedy:
+        for u in left_indices:
+            for v in adj_list[u]:
+                if match[v] == -1:
+                    match[u], match[v] = v, u
+                    break
+    while True:
+        # 未マッチの左側頂点から交互路上で BFS して層をふる
+        dist = [-1] * n
+        q = deque()
+        for u in left_indices:
+            if match[u] == -1:
+                dist[u] = 0
+                q.append(u)
+        found = False
+        while q:
+            u = q.popleft()
+            for v in adj_list[u]:
+                w = match[v]
+                if w == -1:
+                    found = True
+                elif dist[w] == -1:
+                    dist[w] = dist[u] + 1
+                    q.append(w)
+        if not found:
+            return match
+        # 層が 1 ずつ増える交互路のみを辿る反復 DFS で増加路を探す
+        it = [0] * n    # current arc
+        for root in left_indices:
+            if match[root] != -1:
+                continue
+            stack = [root]    # 交互路上の左側頂点
+            via = []    # via[i] は stack[i] から stack[i+1] へ移る際に通った右側頂点
+            while stack:
+                u = stack[-1]
+                if it[u] == len(adj_list[u]):
+                    # 行き止まり。このフェーズでは二度と訪れない
+                    dist[u] = -1
+                    stack.pop()
+                    if via:
+                        via.pop()
+                    continue
+                v = adj_list[u][it[u]]
+                it[u] += 1
+                w = match[v]
+                if w == -1:
+                    # 増加路発見。経路に沿ってマッチングを反転させる
+                    via.append(v)
+                    for x, y in zip(stack, via):
+                        match[x], match[y] = y, x
+                    break
+                elif dist[w] == dist[u] + 1:
+                    stack.append(w)
+                    via.append(v)
+
+
+
+def hopcroft_karp(adj_list: Sequence[Sequence[int]], left_indices: Sequence[int], right_indices: Sequence[int], greedy: bool=True) -> List[Tuple[int, int]]:
+    """
+    [left_indices] + [right_indices] なる頂点集合で (無向) 二部グラフが構成されているとする
+    Hopcroft-Karp 法により O(E√V) で最大マッチングを求め、マッチした (左側頂点, 右側頂点) の組のリストを返す
+
+    Args:
+        adj_list (list): 隣接リスト
+        left_indices (list): (無向) 二部グラフの片側の頂点集合 (0-index 表記)
+        right_indices (list): (無向) 二部グラフのもう片側の頂点集合 (0-index 表記)
+        greedy (bool): True の時は貪欲法で求めた初期マッチングから始める (warm start)
+    Returns:
+        pairs (list): マッチした (left, right) のタプルのリスト。left の昇順
+    """
+    n, l, r = len(adj_list), len(left_indices), len(right_indices)
+    if n != l + r:
+        raise RuntimeError(f"hopcroft_karp(): the number of vertice mismatched. num of vertice: {n}, left: {l}, right: {r}")
+    match = _hopcroft_karp_match(adj_list, left_indices, greedy)
+    return [(u, match[u]) for u in sorted(left_indices) if match[u] != -1]
+
+
+
+def bipartite_vertex_cover(adj_list: Sequence[Sequence[int]], left_indices: Sequence[int], right_indices: Sequence[int], pairs: Optional[Sequence[Tuple[int, int]]]=None) -> List[int]:
+    """
+    König の定理を用いて、二部グラフの最小点被覆を O(E√V) で求める (そのサイズは最大マッチングのサイズに等しい)
+
+    Args:
+        adj_list (list): 隣接リスト
+        left_indices (list): (無向) 二部グラフの片側の頂点集合 (0-index 表記)
+        right_indices (list): (無向) 二部グラフのもう片側の頂点集合 (0-index 表記)
+        pairs (list): hopcroft_karp() で求めた最大マッチング。省略された場合はここで計算する
+    Returns:
+        cover (list): 最小点被覆をなす頂点のリスト (昇順)
+    """
+    if pairs is None:
+        pairs = hopcroft_karp(adj_list, left_indices, right_indices)
+    n = len(adj_list)
+    match = [-1] * n
+    for u, v in pairs:
+        match[u], match[v] = v, u
+    # 未マッチの左側頂点から交互路で到達可能な頂点集合 Z を求める
+    reached = [False] * n
+    stack = [u for u in left_indices if match[u] == -1]
+    for u in stack:
+        reached[u] = True
+    while stack:
+        u = stack.pop()
+        for v in adj_list[u]:
+            if not reached[v]:
+                reached[v] = True
+                w = match[v]
+                if w != -1 and not reached[w]:
+                    reached[w] = True
+                    stack.append(w)
+    is_left = [False] * n
+    for u in left_indices:
+        is_left[u] = True
+    return [v for v in range(n) if is_left[v] != reached[v]]
+
+
+
+def bipartite_independent_set(adj_list: Sequence[Sequence[int]], left_indices: Sequence[int], right_indices: Sequence[int], pairs: Optional[Sequence[Tuple[int, int]]]=None) -> List[int]:
+    """
+    二部グラフの最大独立集合 (最小点被覆の補集合) を O(E√V) で求める
+
+    Args:
+        adj_list (list): 隣接リスト
+        left_indices (list): (無向) 二部グラフの片側の頂点集合 (0-index 表記)
+        right_indices (list): (無向) 二部グラフのもう片側の頂点集合 (0-index 表記)
+        pairs (list): hopcroft_karp() で求めた最大マッチング。省略された場合はここで計算する
+    Returns:
+        independent (list): 最大独立集合をなす頂点のリスト (昇順)
+    """
+    in_cover = [False] * len(adj_list)
+    for v in bipartite_vertex_cover(adj_list, left_indices, right_indices, pairs):
+        in_cover[v] = True
+    return [v for v in range(len(adj_list)) if not in_cover[v]]
+
+
+
 
 if __name__ == "__main__":
     adjacent_list = ((1,),    # 0->
@@ -74,9 +229,14 @@ if __name__ == "__main__":
     max_match = bipartite_max_matching(adjacent_list, left_indices=(0,2,4,6,8), right_indices=(1,3,5,7,9))
     print(max_match)
     """
-    path: [0, 1], current flow: 1
-    path: [2, 9], current flow: 2
-    path: [4, 3], current flow: 3
-    path: [6, 5], current flow: 4
     4
     """
+    left, right = (0, 2, 4, 6, 8), (1, 3, 5, 7, 9)
+    pairs = hopcroft_karp(adjacent_list, left, right)
+    assert(len(pairs) == 4)
+    assert(hopcroft_karp(adjacent_list, left, right, greedy=False) == [(0, 1), (2, 9), (4, 3), (6, 5)])
+    cover = bipartite_vertex_cover(adjacent_list, left, right, pairs)
+    assert(len(cover) == 4)
+    assert(all(u in cover or v in cover for u in left for v in adjacent_list[u]))
+    assert(bipartite_independent_set(adjacent_list, left, right, pairs) == [v for v in range(10) if v not in cover])
+    print(" * assertion test ok * ")
@@ -0,0 +1,173 @@
+"""
+(参考) <Algorithm Introduction vol.2 p.341-347>, 蟻本 p.199-205
+最短路反復法 (primal-dual) による最小費用流 (O(F(E + V)lgV), F は流量)
+
+<algorithm>
+start から goal への残余グラフ上のコスト最小の経路に、流せるだけ流すことを繰り返す (successive shortest path)
+残余グラフには逆辺 (コスト -cost) が現れるため、そのままでは Dijkstra 法が使えない。
+各頂点にポテンシャル h(v) を持たせ、辺のコストを cost'(u, v) = cost(u, v) + h(u) - h(v) と付け替える (Johnson 法と同じ)
+h(v) を直前の最短距離とすれば、最短経路上の辺は cost' = 0 となり逆辺も cost' = 0 となるので、常に cost' >= 0 が保たれる。
+    - 初期状態で負のコストの辺がある場合は、最初のポテンシャルのみ SPFA (Bellman-Ford 法) で求める
+    - 流量を横軸、コストを縦軸にとると、最短路のコストは単調非減少なので、最小費用は流量に関する下に凸な折れ線となる。
+      slope() はこの折れ線の折れ点を返す
+
+残余グラフは max_flow.MaxFlow と同じフラットな配列 (to, cap, rev) で管理し、cost[e] を追加で持つ。
+"""
+
+
+
+from heapq import heappush, heappop
+from typing import List, Tuple, Union
+from .max_flow import MaxFlow
+from ..shortest_path.bellman_ford import NegativeCycleError, spfa
+
+Num = Union[int, float]
+
+
+
+class MinCostFlow(MaxFlow):
+    """
+    フラットな配列で残余グラフを管理する最小費用流ソルバ
+
+    Attributes:
+        num_of_v (int): 頂点数
+        graph (list): graph[v] は v から出る辺 (逆辺含む) のインデックスのリスト
+        to (list): to[e] は辺 e の行き先
+        cap (list): cap[e] は辺 e の残余容量
+        rev (list): rev[e] は辺 e の逆辺のインデックス
+        cost (list): cost[e] は辺 e に単位流量を流すコスト (逆辺は符号が反転している)
+    """
+    def __init__(self, num_of_v: int):
+        super().__init__(num_of_v)
+        self.cost = []
+
+    def add_edge(self, here: int, to: int, capacity: Num, cost: Num=0) -> int:
+        """
+        here から to へ容量 capacity, 単位流量あたりのコスト cost の有向辺をはる。
+        その際、to から here への初期容量 0, コスト -cost の逆辺も同時にはる。順辺のインデックスを返す
+        """
+        self.cost.extend((cost, -cost))
+        return super().add_edge(here, to, capacity)
+
+    def get_edge(self, e: int) -> Tuple[int, int, Num, Num, Num]:
+        """ add_edge() が返した順辺 e について (here, to, capacity, flow, cost) を返す """
+        return super().get_edge(e) + (self.cost[e],)
+
+    def _initial_potential(self, start_ind: int) -> List[Num]:
+        """ 負のコストの辺がなければ 0, あれば残余グラフ上で SPFA を行いポテンシャルの初期値を求める """
+        n = self.num_of_v
+        if all(c >= 0 for e, c in enumerate(self.cost) if self.cap[e] > 0):
+            return [0] * n
+        here, to, weight = [], [], []
+        for e in range(len(self.to)):
+            if self.cap[e] > 0:
+                here.append(self.to[self.rev[e]])
+                to.append(self.to[e])
+                weight.append(self.cost[e])
+        h, _, negative = spfa(here, to, weight, n, start_ind)
+        if negative:
+            raise NegativeCycleError
+        return [x if x != float('inf') else 0 for x in h]
+
+    def slope(self, start_ind: int, goal_ind: int, limit: Num=float('inf')) -> List[Tuple[Num, Num]]:
+        """
+        start_ind から goal_ind へ高々 limit だけ流す時の、流量とその最小費用の関係を表す折れ線の折れ点を返す。
+        (0, 0) から始まり、最後の点が (最大流量 (limit 以下), その最小費用) となる。隣り合う折れ点の間は線形補間すれば良い。
+
+        Args:
+            start_ind (int)
+            goal_ind (int)
+            limit (number): 流量の上限
+        Returns:
+            points (list): (flow, cost) のリスト。flow は狭義単調増加、傾き (単位流量あたりの費用) は狭義単調増加
+        """
+        n = self.num_of_v
+        to, cap, rev, cost, graph = self.to, self.cap, self.rev, self.cost, self.graph
+        inf = float('inf')
+        h = self._initial_potential(start_ind)
+        flow, total_cost = 0, 0
+        points = [(0, 0)]
+        prev_slope = None
+        while flow < limit:
+            # 付け替えたコストで Dijkstra 法
+            dist = [inf] * n
+            prev_edge = [-1] * n
+            dist[start_ind] = 0
+            pq = [(0, start_ind)]
+            while pq:
+                d, u = heappop(pq)
+                if dist[u] < d:
+                    continue
+                for e in graph[u]:
+                    if cap[e] > 0:
+                        v = to[e]
+                        nd = d + cost[e] + h[u] - h[v]
+                        if nd < dist[v]:
+                            dist[v] = nd
+                            prev_edge[v] = e
+                            heappush(pq, (nd, v))
+            if dist[goal_ind] == inf:
+                break
+            for v in range(n):
+                if dist[v] != inf:
+                    h[v] += dist[v]
+            # 最短路に沿って流せるだけ流す
+            f = limit - flow
+            v = goal_ind
+            while v != start_ind:
+                e = prev_edge[v]
+                f = min(f, cap[e])
+                v = to[rev[e]]
+            unit_cost = 0
+            v = goal_ind
+            while v != start_ind:
+                e = prev_edge[v]
+                cap[e] -= f
+                cap[rev[e]] += f
+                unit_cost += cost[e]
+                v = to[rev[e]]
+            flow += f
+            total_cost += f * unit_cost
+            # 傾きが変わらない場合は直前の折れ点を置き換える
+            if prev_slope == unit_cost:
+                points.pop()
+            points.append((flow, total_cost))
+            prev_slope = unit_cost
+        return points
+
+    def flow(self, start_ind: int, goal_ind: int, limit: Num=float('inf')) -> Tuple[Num, Num]:
+        """
+        start_ind から goal_ind へ高々 limit だけ流す時の最小費用流を求め、(流量, 費用) を返す。
+        limit を省略すると最大流を流した時の最小費用を求める。
+        """
+        return self.slope(start_ind, goal_ind, limit)[-1]
+
+
+
+if __name__ == "__main__":
+    # 蟻本 p.200 の例
+    mcf = MinCostFlow(5)
+    mcf.add_edge(0, 1, 10, 2)
+    mcf.add_edge(0, 2, 2, 4)
+    mcf.add_edge(1, 2, 6, 6)
+    mcf.add_edge(1, 3, 6, 2)
+    mcf.add_edge(2, 4, 5, 2)
+    mcf.add_edge(3, 2, 3, 3)
+    mcf.add_edge(3, 4, 8, 6)
+    cap_state = mcf.cap[:]
+    assert(mcf.flow(0, 4, 9) == (9, 80))
+    mcf.cap = cap_state[:]
+    assert(mcf.slope(0, 4) == [(0, 0), (2, 12), (5, 39), (8, 69), (11, 102)])
+
+    # 割当問題: 労働者 i (0...2) に仕事 j (3...5) を割り当てるコスト
+    C = ((4, 1, 3),
+         (2, 0, 5),
+         (3, 2, 2))
+    mcf = MinCostFlow(8)
+    for i in range(3):
+        mcf.add_edge(6, i, 1)
+        mcf.add_edge(i + 3, 7, 1)
+        for j in range(3):
+            mcf.add_edge(i, j + 3, 1, C[i][j])
+    assert(mcf.flow(6, 7) == (3, 5))
+    print(" * assertion test ok * ")
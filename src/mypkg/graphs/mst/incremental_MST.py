@@ -0,0 +1,131 @@
+"""
+(参考) Sleator, Tarjan "A Data Structure for Dynamic Trees"
+辺の追加に対して MST (最小全域森) を動的に管理する
+辺を追加するたびに Kruskal 法をやり直すと O(ElgE) かかるところを、ならし O(lgV) で更新する
+
+クエリ
+add_edge(u, v, w) -> 辺 u - v (重み w) を追加し、MST を更新する。辺の番号は追加した順に 0, 1, ... と振られる
+weight -> 現在の MST の重みの総和 (O(1))
+edges() -> 現在の MST に使われている辺の番号のリスト (MST の辺数 k に対し O(k lgk))
+in_mst(i) -> 辺 i が現在の MST に使われているか (O(1))
+
+
+<algorithm>
+辺 e = u - v (重み w) を追加する時
+    - u と v が MST で非連結なら、e をそのまま MST に加える
+    - 連結なら、MST 上の u - v パスと e は閉路をなす。閉路上で最も重い辺は (他の辺より真に重ければ) MST に含まれないので、
+      パス上の最大の辺 f の重みが w より大きければ f を削除して e を加え、そうでなければ e は使わない
+MST を Link-Cut Tree で管理し、辺も頂点として (u - e - v の形で) 持たせて値を (重み, 辺の番号) とすると、
+パス上の最大の辺が path_query (集約は max) で求まる。
+重みが等しい辺は番号が小さい方を軽いとみなす (kruskal_MST.kruskal_edges と同じ順序なので、同じ辺の集合が得られる)。
+MST から外れた辺の頂点は再利用するので、Link-Cut Tree の頂点数は高々 2V - 1 に保たれる。
+"""
+
+
+from typing import List, Set, Union
+from ...advanced_data_structures.link_cut_tree import LinkCutTree
+
+Num = Union[int, float]
+
+
+
+class IncrementalMST:
+    def __init__(self, n: int):
+        """
+        n 頂点 0, 1, ..., n-1 からなる辺のないグラフを作成する O(n)
+        """
+        self.n = n
+        self.weight = 0
+        self.us: List[int] = []
+        self.vs: List[int] = []
+        self.ws: List[Num] = []
+        NONE = (-float('inf'), -1)    # 元のグラフの頂点の値 (max の単位元)
+        self.lct = LinkCutTree(n, [NONE] * n, max, NONE)
+        self.node_of_edge: List[int] = []    # node_of_edge[i] は辺 i の Link-Cut Tree での頂点 (MST に使われていなければ -1)
+        self.free_nodes: List[int] = []    # MST から外れた辺の頂点 (再利用する)
+        self.mst_edges: Set[int] = set()    # 現在の MST に使われている辺の番号
+
+    def add_edge(self, u: int, v: int, w: Num) -> bool:
+        """
+        辺 u - v (重み w) をならし O(lgV) で追加し MST を更新する
+
+        Returns:
+            bool: 追加した辺が MST に使われたか
+        """
+        if not (0 <= u < self.n and 0 <= v < self.n):
+            raise IndexError(f"IncrementalMST.add_edge(): n is {self.n}. got edge {u} - {v}")
+        i = len(self.ws)
+        self.us.append(u)
+        self.vs.append(v)
+        self.ws.append(w)
+        self.node_of_edge.append(-1)
+        if u == v:
+            return False
+        lct = self.lct
+        path_max = lct.path_query(u, v)    # 非連結なら None
+        if path_max is not None:
+            max_w, j = path_max
+            if max_w <= w:    # (max_w, j) < (w, i) (j < i なので重みが等しければ既存の辺を残す)
+                return False
+            # 閉路上で最も重い辺 j を外す
+            x = self.node_of_edge[j]
+            lct.cut(self.us[j], x)
+            lct.cut(x, self.vs[j])
+            self.node_of_edge[j] = -1
+            self.free_nodes.append(x)
+            self.weight -= max_w
+            self.mst_edges.remove(j)
+        if self.free_nodes:
+            x = self.free_nodes.pop()
+            lct.set_value(x, (w, i))
+        else:
+            x = lct.add_node((w, i))
+        lct.link(u, x)
+        lct.link(x, v)
+        self.node_of_edge[i] = x
+        self.weight += w
+        self.mst_edges.add(i)
+        return True
+
+    def in_mst(self, i: int) -> bool:
+        """ 辺 i が現在の MST に使われているか O(1) で判定する """
+        return self.node_of_edge[i] != -1
+
+    def edges(self) -> List[int]:
+        """ 現在の MST に使われている辺の番号のリストを、MST の辺数 k に対し O(k lgk) で返す (番号の昇順) """
+        return sorted(self.mst_edges)
+
+
+
+
+if __name__ == "__main__":
+    edges = ((0, 1, 4), (0, 7, 8), (1, 2, 8), (1, 7, 11), (2, 3, 7), (2, 5, 4), (2, 8, 2),
+             (3, 4, 9), (3, 5, 14), (4, 5, 10), (5, 6, 2), (6, 7, 1), (6, 8, 6), (7, 8, 7))
+    mst = IncrementalMST(9)
+    for u, v, w in edges:
+        mst.add_edge(u, v, w)
+    assert(mst.weight == 37)
+    assert(len(mst.edges()) == 8)
+    assert(not mst.in_mst(3))    # 1 - 7 (重み 11)
+    # 軽い辺を追加すると閉路上の最も重い辺 3 - 4 (重み 9) と入れ替わる
+    assert(mst.add_edge(4, 8, 1))
+    assert(mst.weight == 37 - 9 + 1)
+    assert(not mst.in_mst(7))
+    assert(not mst.add_edge(0, 2, 100))
+    print(" * assertion test ok * ")
+
+    # ベンチマーク: 頂点数 10^4 に 10^5 本の辺を追加し、毎回 Kruskal 法をやり直す場合と比べる
+    import time
+    from random import randrange
+    from .kruskal_MST import kruskal_edges
+    N, M = 10**4, 10**5
+    edges = [(randrange(N), randrange(N), randrange(10**9)) for _ in range(M)]
+    t0 = time.perf_counter()
+    mst = IncrementalMST(N)
+    for u, v, w in edges:
+        mst.add_edge(u, v, w)
+    t1 = time.perf_counter()
+    us, vs, ws = zip(*edges)
+    assert(mst.edges() == sorted(kruskal_edges(N, us, vs, ws)))
+    t2 = time.perf_counter()
+    print(f"V = 10^4, 10^5 insertions: incremental {t1 - t0:.2f} sec (one Kruskal from scratch: {t2 - t1:.3f} sec)")
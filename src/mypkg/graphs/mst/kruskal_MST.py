@@ -1,36 +1,182 @@
 """
-(参考) <Algorithm Introduction vol.2 p.230-236>
+(参考) <Algorithm Introduction vol.2 p.230-236>, <Algorithm Introduction vol.2 p.242 (問題 23-2)>
 無向グラフに対する Kruskal 法による MST の構築 (O((V+E)lgV)
+および Borůvka 法による MST の構築 (O(ElgV))
+
+グラフは辺の配列 us, vs, ws (i 番目の辺は us[i] - vs[i] で重み ws[i]) で受け取り、MST に使う辺の添字のリストを返す
+(非連結なグラフに対しては最小全域森となる)
 
 <algorithm>
+Kruskal 法
 それぞれのノード単体からなる MST が V 個存在する
 これを成長連結させて一つの巨大な MST にする。
 成長させるための辺の選択は、まだ MST の内部に取り込まれていない辺のうち最小のものを選択するようにする。その結果必ず異なる 2 つのグループが 1 つに union される。
+辺そのものではなく辺の添字を重みでソートする (ws.__getitem__ をキーとした sorted、NumPy の argsort)。既にソート済みなら presorted=True で省略できる
+
+Borůvka 法
+各フェーズで、全ての連結成分について「その成分から出る最小の辺」を選び、それらを全て MST に加えて成分をまとめる。
+各成分が少なくとも一つの他の成分とまとまるので成分の数は毎フェーズ半分以下になり、フェーズ数は O(lgV) となる。
+重みが等しい辺は添字の小さい方を小さいとみなす (全順序にしておかないと閉路ができうる)。
+各成分の最小の辺を求める処理は辺ごとに独立なので、辺の配列を区間に分けてプロセスプールで並列に計算できる。
 
 verified @ABC065D
 """
 
 
-from typing import Sequence
+from array import array
+from typing import Sequence, List, Tuple, Optional, Union
 from ...advanced_data_structures.union_find_tree import UnionFindTree
 
+Num = Union[int, float]
+
 
 
 def kruskal(adj: Sequence[Sequence[int]]) -> int:
-    n = len(adj)
+    """
+    重みつき隣接リストで表された無向グラフの MST の重みの総和を Kruskal 法で求める
+    """
+    us, vs, ws = adj_to_edges(adj)
+    return sum(ws[i] for i in kruskal_edges(len(adj), us, vs, ws))
+
+
+def adj_to_edges(adj: Sequence[Sequence[Tuple[int, Num]]]) -> Tuple[array, array, list]:
+    """
+    重みつき隣接リスト (無向グラフなので各辺が両方向に現れる) を辺の配列 us, vs, ws に変換する (u < v の向きのみ)
+    """
+    us, vs, ws = array('i'), array('i'), []
+    for u, e in enumerate(adj):
+        for v, weight in e:
+            if u < v:
+                us.append(u)
+                vs.append(v)
+                ws.append(weight)
+    return us, vs, ws
+
+
+
+def kruskal_edges(n: int, us: Sequence[int], vs: Sequence[int], ws: Sequence[Num],
+                  presorted: bool=False, use_numpy: bool=False) -> List[int]:
+    """
+    辺の配列で表された無向グラフの MST (最小全域森) を Kruskal 法で O(ElgE) で求める
+
+    Args:
+        n (int): 頂点数
+        us, vs, ws: i 番目の辺は us[i] - vs[i] で重み ws[i]
+        presorted (bool): True の場合は辺が既に重みの昇順に並んでいるとみなしソートを省略する
+        use_numpy (bool): True の場合は辺の添字のソートに numpy.argsort を用いる
+    Returns:
+        mst (list): MST に使う辺の添字のリスト (重みの昇順)
+    """
+    m = len(ws)
+    if presorted:
+        order = range(m)
+    elif use_numpy:
+        import numpy as np
+        order = np.argsort(np.asarray(ws), kind='stable').tolist()
+    else:
+        order = sorted(range(m), key=ws.__getitem__)
     uf = UnionFindTree(n)
-    edges = []
-    total_cost = 0
-    for i, e in enumerate(adj):
-        for j, weight in e:
-            if i <= j:
-                edges.append((i, j, weight))
-    edges.sort(key=lambda x: x[2])
-    for edge in edges:
-        u, v, weight = edge
-        if uf.union(u, v):
-            total_cost += weight
-    return total_cost
+    mst = []
+    for i in order:
+        if uf.union(us[i], vs[i]):
+            mst.append(i)
+            if len(mst) == n - 1:
+                break
+    return mst
+
+
+
+def _cheapest_edges(us: Sequence[int], vs: Sequence[int], ws: Sequence[Num], comp: Sequence[int],
+                    k: int, edges: Sequence[int]) -> Tuple[array, array]:
+    """
+    edges (辺の添字の昇順) のうち、k 個の連結成分 (頂点 v の成分は comp[v]) の間をつなぐ辺について、
+    各成分から出る最小の辺の添字 (なければ -1) と、成分の間をつなぐ辺の添字のリストを返す
+    """
+    best = array('i', [-1]) * k
+    best_w = [float('inf')] * k
+    crossing = array('i')
+    append = crossing.append
+    for i in edges:
+        cu, cv = comp[us[i]], comp[vs[i]]
+        if cu != cv:
+            append(i)
+            w = ws[i]
+            # 添字の昇順に見ているので、重みが等しければ先に見た (添字の小さい) 辺が残る
+            if w < best_w[cu] or best[cu] == -1:
+                best[cu] = i
+                best_w[cu] = w
+            if w < best_w[cv] or best[cv] == -1:
+                best[cv] = i
+                best_w[cv] = w
+    return best, crossing
+
+
+# プロセスプールのワーカーに一度だけ渡す辺の配列 (タスクごとに pickle されるのを防ぐ)
+_worker_edges = None
+
+def _init_worker(us: Sequence[int], vs: Sequence[int], ws: Sequence[Num]) -> None:
+    global _worker_edges
+    _worker_edges = (us, vs, ws)
+
+def _worker_cheapest(task: Tuple[array, int, int, int]) -> array:
+    comp, k, lo, hi = task
+    us, vs, ws = _worker_edges
+    return _cheapest_edges(us, vs, ws, comp, k, range(lo, hi))[0]
+
+
+
+def boruvka(n: int, us: Sequence[int], vs: Sequence[int], ws: Sequence[Num], processes: Optional[int]=None) -> List[int]:
+    """
+    辺の配列で表された無向グラフの MST (最小全域森) を Borůvka 法で O(ElgV) で求める
+
+    Args:
+        n (int): 頂点数
+        us, vs, ws: i 番目の辺は us[i] - vs[i] で重み ws[i]
+        processes (int): 指定された場合、各フェーズの最小の辺の計算を辺の区間ごとに processes 個のプロセスで並列に行う
+    Returns:
+        mst (list): MST に使う辺の添字のリスト (添字の昇順)
+    """
+    m = len(ws)
+    comp = array('i', range(n))    # 頂点の属する連結成分の番号 (0, 1, ..., k-1)
+    k = n
+    mst = []
+    pool = None
+    if processes is not None and processes > 1 and m > 0:
+        from multiprocessing import Pool
+        pool = Pool(processes, initializer=_init_worker, initargs=(us, vs, ws))
+        chunk = (m + processes * 4 - 1) // (processes * 4)
+        ranges = [(lo, min(lo + chunk, m)) for lo in range(0, m, chunk)]
+    try:
+        edges = range(m)
+        while True:
+            if pool is None:
+                best, edges = _cheapest_edges(us, vs, ws, comp, k, edges)    # 成分の内部の辺は以後も不要なので捨てる
+            else:
+                best = array('i', [-1]) * k
+                for part in pool.map(_worker_cheapest, [(comp, k, lo, hi) for lo, hi in ranges]):
+                    for c, i in enumerate(part):
+                        if i != -1 and (best[c] == -1 or (ws[i], i) < (ws[best[c]], best[c])):
+                            best[c] = i
+            # 成分を頂点とみなした Union-Find で成分をまとめる
+            uf = UnionFindTree(k)
+            merged = False
+            for i in best:
+                if i != -1 and uf.union(comp[us[i]], comp[vs[i]]):
+                    mst.append(i)
+                    merged = True
+            if not merged:
+                break
+            # 成分の番号を振り直す
+            label = {}
+            relabel = [label.setdefault(uf._find_set(c), len(label)) for c in range(k)]
+            comp = array('i', [relabel[c] for c in comp])
+            k = len(label)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    mst.sort()
+    return mst
 
 
 
@@ -46,6 +192,25 @@ if __name__ == "__main__":
                     ((2, 2), (6, 6), (7, 7)))
     total = kruskal(adj_with_weight)
     assert(total == 37)
+    us, vs, ws = adj_to_edges(adj_with_weight)
+    mst = kruskal_edges(len(adj_with_weight), us, vs, ws)
+    assert(len(mst) == 8 and sum(ws[i] for i in mst) == 37)
+    assert(sorted(mst) == boruvka(len(adj_with_weight), us, vs, ws))
+    assert(boruvka(len(adj_with_weight), us, vs, ws, processes=2) == sorted(mst))
     print(" * assertion test ok * ")
 
+    # ベンチマーク: 頂点数 10^5, 辺数 10^6 のランダムなグラフ
+    import time
+    from random import randrange
+    N, M = 10**5, 10**6
+    us = array('i', (randrange(N) for _ in range(M)))
+    vs = array('i', (randrange(N) for _ in range(M)))
+    ws = [randrange(10**9) for _ in range(M)]
+    t0 = time.perf_counter()
+    mst = kruskal_edges(N, us, vs, ws)
+    t1 = time.perf_counter()
+    assert(sorted(mst) == boruvka(N, us, vs, ws))
+    t2 = time.perf_counter()
+    print(f"V = 10^5, E = 10^6: kruskal {t1 - t0:.2f} sec, boruvka {t2 - t1:.2f} sec")
+
 
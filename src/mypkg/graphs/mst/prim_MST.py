@@ -12,11 +12,21 @@ min pqueue には V-S の各頂点が、'それぞれの頂点と S の各頂点
 その際、接続先の頂点の情報も保持する。(MST に取り込まれたら、この頂点の親になる)
 V-S の各頂点について選択されうる S との接続辺の予選を行っておき min pqueue にぶち込んでおくイメージ
 決勝は extract の際よしなに min pqueue 側で選択される
+
+prim_mst はカットと交差する辺を全て pqueue に積むのでヒープに O(E) 個のエントリが入りうる。
+prim_mst_indexed は頂点 v の現在のキー key[v] とヒープ内での位置 pos[v] を配列で持つ indexed heap を用い、
+キーが小さくなったら v をその場で上に滑らせる (decrease-key) ので、ヒープには各頂点が高々 1 回しか入らない (O(V))。
+
+prim_mst_dense は距離行列で与えられた密なグラフ (完全グラフなど) に対する O(V^2) の実装。
+ヒープを使わず、毎回 V-S の頂点のキーの最小値を線形に探し、取り込んだ頂点の行でキーを更新する。
+E = Θ(V^2) なら O(ElgV) の実装より速い (例: 点集合のユークリッド距離による MST)。
+prim_mst_matrix は距離行列の密度 (E / V^2) を見て、prim_mst_dense と prim_mst_indexed を自動で使い分ける。
+(隣接リストから距離行列を作るのは O(V^2) の実装で得する以上に時間がかかるので、隣接リストには常に prim_mst_indexed を用いるとよい)
 """
 
 
 from heapq import heappush, heappop
-from typing import Sequence, List, Tuple, Union
+from typing import Sequence, List, Tuple, Union, Optional
 from ...basic_data_structures.priority_queue import PQueueMin
 
 Num = Union[int, float]
@@ -47,6 +57,153 @@ def prim_mst(adj: Sequence[Sequence[int]], start: int=0) -> Tuple[int, List[int]
 
 
 
+def prim_mst_indexed(adj: Sequence[Sequence[Tuple[int, Num]]], start: int=0) -> Tuple[Num, List[Optional[int]]]:
+    """
+    decrease-key のできる indexed heap を用いた Prim 法 O((V+E)lgV)。ヒープのサイズは O(V)
+
+    Returns:
+        total_cost: start を含む連結成分の MST の重みの総和
+        parent (list): parent[v] は MST における v の親 (start と、start から到達できない頂点は None)
+    """
+    n = len(adj)
+    INF = float('inf')
+    key = [INF] * n
+    parent = [None] * n
+    pos = [-1] * n    # pos[v] はヒープ内での v の位置 (-1: 未追加, -2: MST に取り込み済み)
+    heap = [start]    # key を優先度とする頂点の min heap
+    key[start] = 0
+    pos[start] = 0
+    total_cost = 0
+    while heap:
+        u = heap[0]
+        pos[u] = -2
+        total_cost += key[u]
+        # 末尾の頂点を根に置いて下へ滑らせる
+        last = heap.pop()
+        size = len(heap)
+        if size:
+            k = key[last]
+            i = 0
+            c = 1
+            while c < size:
+                if c + 1 < size and key[heap[c+1]] < key[heap[c]]:
+                    c += 1
+                if key[heap[c]] >= k:
+                    break
+                heap[i] = heap[c]
+                pos[heap[i]] = i
+                i = c
+                c = 2 * i + 1
+            heap[i] = last
+            pos[last] = i
+        for v, weight_uv in adj[u]:
+            if weight_uv < key[v] and pos[v] != -2:
+                # decrease-key: v を新たな位置 (未追加なら末尾) から上へ滑らせる
+                key[v] = weight_uv
+                parent[v] = u
+                i = pos[v]
+                if i == -1:
+                    i = len(heap)
+                    heap.append(v)
+                while i > 0:
+                    p = (i - 1) >> 1
+                    w = heap[p]
+                    if key[w] <= weight_uv:
+                        break
+                    heap[i] = w
+                    pos[w] = i
+                    i = p
+                heap[i] = v
+                pos[v] = i
+    return total_cost, parent
+
+
+
+def prim_mst_dense(mat: Sequence[Sequence[Num]], start: int=0, use_numpy: bool=False) -> Tuple[Num, List[Optional[int]]]:
+    """
+    距離行列で与えられた密なグラフに対する Prim 法 O(V^2)
+
+    Args:
+        mat (list, ndarray): mat[u][v] は辺 u - v の重み (辺がない場合は inf)。対称行列とする
+        use_numpy (bool): True の場合は各頂点を取り込んだ時のキーの更新と最小値の探索を NumPy でベクトル化する
+    Returns:
+        total_cost: start を含む連結成分の MST の重みの総和
+        parent (list): parent[v] は MST における v の親 (start と、start から到達できない頂点は None)
+    """
+    n = len(mat)
+    INF = float('inf')
+    if use_numpy:
+        import numpy as np
+        M = np.asarray(mat)
+        D = M.astype(np.float64)
+        key = np.full(n, INF)    # MST に取り込み済みの頂点は inf のままにして最小値の探索から除く
+        par = np.full(n, -1, dtype=np.int64)
+        done = np.zeros(n, dtype=bool)
+        key[start] = 0
+        for _ in range(n):
+            u = int(np.argmin(key))
+            if key[u] == INF:
+                break
+            key[u] = INF
+            done[u] = True
+            row = D[u]
+            update = (row < key) & ~done
+            key[update] = row[update]
+            par[update] = u
+        child = np.flatnonzero(par >= 0)
+        total_cost = M[par[child], child].sum().item() if child.size else 0    # 重みの型 (int, float) を保つ
+        return total_cost, [None if p == -1 else p for p in par.tolist()]
+    key = [INF] * n
+    parent = [None] * n
+    key[start] = 0
+    rest = list(range(n))    # まだ MST に取り込んでいない頂点
+    total_cost = 0
+    while rest:
+        u = min(rest, key=key.__getitem__)
+        if key[u] == INF:
+            break
+        total_cost += key[u]
+        rest.remove(u)
+        row = mat[u]
+        for v in rest:
+            if row[v] < key[v]:
+                key[v] = row[v]
+                parent[v] = u
+    return total_cost, parent
+
+
+
+# 距離行列の辺の本数 (非対角成分のうち inf でないものの個数) が V^2 / DENSE_THRESHOLD 以上なら密なグラフとみなす
+DENSE_THRESHOLD = 100
+
+def prim_mst_matrix(mat: Sequence[Sequence[Num]], start: int=0, use_numpy: bool=False) -> Tuple[Num, List[Optional[int]]]:
+    """
+    距離行列で与えられたグラフの MST を、密度に応じて prim_mst_dense (O(V^2)) と prim_mst_indexed (O(ElgV)) を使い分けて求める
+
+    Note:
+        use_numpy=True の場合は辺の本数を NumPy で数え、V^2 / DENSE_THRESHOLD 未満なら疎なグラフとみなして
+        非ゼロ要素から隣接リストを作り prim_mst_indexed を用いる (辺が 1% 未満なら速い)。
+        use_numpy=False の場合は、辺を数えるのにも隣接リストを作るのにも行列全体を Python で走査するので
+        その時点で O(V^2) の実装と同程度の時間がかかる。よって密度によらず prim_mst_dense を用いる
+    """
+    if not use_numpy:
+        return prim_mst_dense(mat, start)
+    import numpy as np
+    n = len(mat)
+    M = np.asarray(mat)
+    is_edge = M < float('inf')
+    np.fill_diagonal(is_edge, False)
+    if np.count_nonzero(is_edge) * DENSE_THRESHOLD >= n * n:
+        return prim_mst_dense(M, start, use_numpy=True)
+    us, vs = np.nonzero(is_edge)
+    head = np.searchsorted(us, np.arange(n + 1)).tolist()
+    vs, ws = vs.tolist(), M[us, vs].tolist()
+    adj = [list(zip(vs[head[u]:head[u+1]], ws[head[u]:head[u+1]])) for u in range(n)]
+    return prim_mst_indexed(adj, start)
+
+
+
+
 if __name__ == "__main__":
     adj_with_weight = (((1, 4), (7, 8)),
                        ((0, 4), (2, 8), (7, 11)),
@@ -60,5 +217,48 @@ if __name__ == "__main__":
     total, parent_list = prim_mst(adj_with_weight)
     assert(total == 37)
     assert(parent_list == [None, 0, 5, 2, 3, 6, 7, 0, 2])
+    assert(prim_mst_indexed(adj_with_weight) == (37, [None, 0, 5, 2, 3, 6, 7, 0, 2]))
+    n = len(adj_with_weight)
+    mat = [[float('inf')] * n for _ in range(n)]
+    for u, e in enumerate(adj_with_weight):
+        for v, weight in e:
+            mat[u][v] = weight
+    # 重み 8 の辺 0 - 7 と 1 - 2 のどちらを使うかは実装によって異なる
+    assert(prim_mst_dense(mat) == (37, [None, 0, 1, 2, 3, 2, 5, 6, 2]))
+    assert(prim_mst_dense(mat, use_numpy=True) == (37, [None, 0, 1, 2, 3, 2, 5, 6, 2]))
+    assert(prim_mst_matrix(mat, use_numpy=True)[0] == 37)
     print(" * assertion test ok * ")
 
+    # ベンチマーク 1: 頂点数 10^5, 辺数 10^6 のランダムな連結グラフ
+    import time
+    from random import randrange
+    N, M = 10**5, 10**6
+    adj = [[] for _ in range(N)]
+    for v in range(1, N):
+        u, w = randrange(v), randrange(10**9)
+        adj[u].append((v, w))
+        adj[v].append((u, w))
+    for _ in range(M - N + 1):
+        u, v, w = randrange(N), randrange(N), randrange(10**9)
+        adj[u].append((v, w))
+        adj[v].append((u, w))
+    t0 = time.perf_counter()
+    total, _ = prim_mst(adj)
+    t1 = time.perf_counter()
+    assert(prim_mst_indexed(adj)[0] == total)
+    t2 = time.perf_counter()
+    print(f"V = 10^5, E = 10^6: prim_mst {t1 - t0:.2f} sec, prim_mst_indexed {t2 - t1:.2f} sec")
+
+    # ベンチマーク 2: 平面上の 3000 点のユークリッド距離による MST (完全グラフ)
+    import numpy as np
+    P = np.random.rand(3000, 2)
+    D = np.sqrt(((P[:, None, :] - P[None, :, :]) ** 2).sum(axis=2))
+    t0 = time.perf_counter()
+    total, _ = prim_mst_dense(D, use_numpy=True)
+    t1 = time.perf_counter()
+    adj = [list(enumerate(row)) for row in D.tolist()]
+    t2 = time.perf_counter()
+    assert(abs(prim_mst_indexed(adj)[0] - total) < 1e-9)
+    t3 = time.perf_counter()
+    print(f"Euclidean MST of 3000 points: dense (numpy) {t1 - t0:.2f} sec, indexed heap {t3 - t2:.2f} sec")
+
@@ -0,0 +1,131 @@
+"""
+(参考) <Algorithm Introduction vol.2 p.289-293>
+Johnson 法 (O(VE + V(V+E)lgV))
+負辺を含みうる (負サイクルは含まない) 疎な重みつき有向グラフについて、全点対間の最短経路を求める
+疎グラフでは Warshall-Floyd 法 O(V^3) より高速
+
+
+<algorithm>
+1. 超頂点 s から全頂点へ重み 0 の辺をはったグラフで Bellman-Ford 法を行い、ポテンシャル h(v) = dist(s, v) を求める
+   (ここで負サイクルが見つかれば全点対最短経路は定義できない)
+2. 各辺の重みを w'(u, v) = w(u, v) + h(u) - h(v) と付け替える
+   三角不等式 h(v) <= h(u) + w(u, v) より w'(u, v) >= 0 となるため Dijkstra 法が使える
+   また任意の u~v パスについて w'(p) = w(p) + h(u) - h(v) であり、パスによらず一定の差しかないため最短経路は保存される
+3. 各頂点を始点として Dijkstra 法を行い dist'(u, v) を求め、dist(u, v) = dist'(u, v) - h(u) + h(v) と戻す
+
+3 の V 回の Dijkstra 法は始点ごとに独立なので、プロセスプールで並列に計算することもできる
+"""
+
+
+from typing import Sequence, List, Tuple, Optional, Union
+from .bellman_ford import NegativeCycleError, spfa
+from .dijkstra import dijkstra
+
+Num = Union[int, float]
+
+
+
+def _potential(adj_with_weight: Sequence[Sequence[Tuple[int, Num]]]) -> List[Num]:
+    """
+    超頂点 V から全頂点へ重み 0 の辺をはり、SPFA でポテンシャル h を求める
+    負サイクルが存在する場合 NegativeCycleError があげられる
+    """
+    V = len(adj_with_weight)
+    here, to, weight = [V] * V, list(range(V)), [0] * V
+    for u in range(V):
+        for v, w in adj_with_weight[u]:
+            here.append(u)
+            to.append(v)
+            weight.append(w)
+    h, _, negative = spfa(here, to, weight, V + 1, start=V)
+    if negative:
+        raise NegativeCycleError
+    return h[:V]
+
+
+def _reweight(adj_with_weight: Sequence[Sequence[Tuple[int, Num]]], h: Sequence[Num]) -> List[List[Tuple[int, Num]]]:
+    """ 各辺の重みを w(u, v) + h(u) - h(v) (>= 0) に付け替えた隣接リストを返す """
+    return [[(v, w + h[u] - h[v]) for v, w in adj_with_weight[u]] for u in range(len(adj_with_weight))]
+
+
+def _dijkstra_rows(adj_reweighted: Sequence[Sequence[Tuple[int, Num]]], h: Sequence[Num], sources: Sequence[int]) -> List[List[Num]]:
+    """ sources の各頂点を始点として Dijkstra 法を行い、重みを元に戻した最短距離の行を返す """
+    inf = float('inf')
+    rows = []
+    for u in sources:
+        cost = dijkstra(adj_reweighted, u)
+        rows.append([c - h[u] + h[v] if c != inf else inf for v, c in enumerate(cost)])
+    return rows
+
+
+# プロセスプールのワーカーに一度だけ渡すグラフ (タスクごとに pickle されるのを防ぐ)
+_worker_adj = None
+_worker_h = None
+
+def _init_worker(adj_reweighted: Sequence[Sequence[Tuple[int, Num]]], h: Sequence[Num]) -> None:
+    global _worker_adj, _worker_h
+    _worker_adj = adj_reweighted
+    _worker_h = h
+
+def _worker_rows(sources: Sequence[int]) -> List[List[Num]]:
+    return _dijkstra_rows(_worker_adj, _worker_h, sources)
+
+
+
+def johnson(adj_with_weight: Sequence[Sequence[Tuple[int, Num]]], processes: Optional[int]=None) -> List[List[Num]]:
+    """
+    Johnson 法 (O(VE + V(V+E)lgV)) で全点対間の最短コストを求める。辿り着けぬ場合は inf が入る。
+    負辺を含んでもよいが、負サイクルがある場合 NegativeCycleError があげられる
+
+    Args:
+        adj_with_weight (list): 重みつき隣接リスト。adj_with_weight[u] は (v, weight) のタプルの列
+        processes (int): 指定された場合、V 回の Dijkstra 法を processes 個のプロセスに始点ごとに分けて並列に計算する
+    Returns:
+        dist (list): dist[i][j] は i から j への最短コスト
+    """
+    V = len(adj_with_weight)
+    h = _potential(adj_with_weight)
+    adj_reweighted = _reweight(adj_with_weight, h)
+    if processes is None or processes <= 1 or V <= 1:
+        return _dijkstra_rows(adj_reweighted, h, range(V))
+    from multiprocessing import Pool
+    # 始点を processes * 4 程度のチャンクに分けて負荷を均す
+    chunk = max(1, V // (processes * 4))
+    chunks = [range(i, min(i + chunk, V)) for i in range(0, V, chunk)]
+    with Pool(processes, initializer=_init_worker, initargs=(adj_reweighted, h)) as pool:
+        dist = []
+        for rows in pool.map(_worker_rows, chunks):
+            dist.extend(rows)
+    return dist
+
+
+
+
+if __name__ == "__main__":
+    #                      to/weight
+    adj_with_weight = (((1, 3), (2, 8), (4, -4)),
+                       ((3, 1), (4, 7)),
+                       ((1, 4),),
+                       ((0, 2), (2, -5)),
+                       ((3, 6),))
+    inf = float('inf')
+    dist = johnson(adj_with_weight)
+    assert(dist == [[0, 1, -3, 2, -4],
+                    [3, 0, -4, 1, -1],
+                    [7, 4, 0, 5, 3],
+                    [2, -1, -5, 0, -2],
+                    [8, 5, 1, 6, 0]])
+    assert(johnson(adj_with_weight, processes=2) == dist)
+
+    # 3 -> 2 -> 1 -> 3 が負サイクル (重み -1) となるように変更
+    adj_negative = (((1, 3), (2, 8), (4, -4)),
+                    ((3, 1), (4, 7)),
+                    ((1, 3),),
+                    ((0, 2), (2, -5)),
+                    ((3, 6),))
+    try:
+        johnson(adj_negative)
+        assert(False)
+    except NegativeCycleError:
+        pass
+    print(" * assertion test ok * ")
@@ -19,6 +19,11 @@ dp[k+1][i][k+1] = min(dp[k][i][k+1], dp[k][i][k+1] + dp[k][k+1][k+1] (=0)))
 dp[k+1][k+1][j] = dp[k][k+1][j]
 つまり使い回しの結果 dp[k+1][i][k+1] がすでに dp[k][i][k+1] の参照場所を更新しようとしてしまっていても、実際に更新は行われない (値が等しいので)
 
+<NumPy による高速化>
+各 k について dp[i][j] = min(dp[i][j], dp[i][k]+dp[k][j]) の更新は i, j について独立に行える (上の議論より k 行 k 列は変化しない)
+よって dp = np.minimum(dp, dp[:, k, None] + dp[None, k, :]) と V * V の行列演算一発で書ける。
+Python のループは k についての V 回のみとなり、V~2000 程度まで現実的な時間で動く
+
 
 verified @ABC012D, ABC073D, ABC074D
 """
@@ -26,6 +31,7 @@ verified @ABC012D, ABC073D, ABC074D
 
 from copy import deepcopy
 from typing import Sequence, List
+from .bellman_ford import NegativeCycleError
 
 
 def warshall_floyd(adj_mat_with_weight: Sequence[Sequence[int]]) -> List[List[int]]:
@@ -57,6 +63,31 @@ def warshall_floyd(adj_mat_with_weight: Sequence[Sequence[int]]) -> List[List[in
 
 
 
+def warshall_floyd_np(adj_mat_with_weight: Sequence[Sequence[int]]) -> 'np.ndarray':
+    """
+    NumPy でベクトル化した Warshall-Floyd 法 (O(V^3) だが Python のループは V 回のみ)
+    各中継地点 k について dp = np.minimum(dp, dp[:, k, None] + dp[None, k, :]) と行列全体を一度に更新する
+
+    Args:
+        adj_mat_with_weight (list or ndarray): 重みを記録した隣接行列 (非接続頂点は inf)
+    Returns:
+        dp (ndarray): dp[i, j] を見れば全頂点を使用可能な時の i j 最短距離がわかる (dtype は float)
+    Raises:
+        NegativeCycleError: 負サイクルが存在する場合 (計算後に dp[i, i] < 0 となる i が存在する場合)
+    """
+    import numpy as np
+    dp = np.array(adj_mat_with_weight, dtype=float)
+    V = len(dp)
+    # 自己ループが負でなければ 0 で初期化 (負の自己ループは負サイクルとして検出させる)
+    np.fill_diagonal(dp, np.minimum(np.diagonal(dp), 0))
+    for k in range(V):
+        np.minimum(dp, dp[:, k, None] + dp[None, k, :], out=dp)
+    if (np.diagonal(dp) < 0).any():
+        raise NegativeCycleError
+    return dp
+
+
+
 if __name__ == "__main__":
     INF = float('inf')
     adj = [[INF, 5, 6, INF, INF, INF, INF, INF, INF, INF],
@@ -85,6 +116,7 @@ if __name__ == "__main__":
     [11, 6, 5, 7, 4, 1, 8, 11, 0, 1]
     [12, 7, 6, 8, 5, 2, 9, 12, 1, 0]
     """
+    assert(warshall_floyd_np(adj).tolist() == cost_ij)
 
     """
     - 引数として隣接行列 or CSR フォーマットの疎行列を渡して最短距離を計算させる
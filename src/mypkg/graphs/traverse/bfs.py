@@ -1,13 +1,26 @@
 """
-(参考) <Algorithm Introduction vol.2 p.200-p.207>
+(参考) <Algorithm Introduction vol.2 p.200-p.207>, Beamer, Asanović, Patterson "Direction-Optimizing Breadth-First Search"
 Breadth First Search
 - queue による実装
 - 単純な全点探索と、(経路内での重複を許さない) 全経路探索
+- CSR 形式のグラフに対する方向最適化 BFS (距離と BFS 木の親を求める。多始点、フロンティアごとの反復に対応)
 
 0-1 BFS では deque の特性を活かして重みが 0 なら deque の先頭に突っ込もう
+
+
+<algorithm>
+方向最適化 BFS (bfs_frontiers, bfs)
+同じ距離の頂点の集合 (フロンティア) ごとに次のフロンティアを求める。頂点は積む時に dist を埋めて訪問済みとするので重複して積まれない。
+    - top-down: フロンティアの各頂点の出辺を全て調べ、未訪問の行き先を次のフロンティアとする (フロンティアの出辺の本数 m_f に比例)
+    - bottom-up: 未訪問の各頂点の入辺を調べ、フロンティアの頂点が見つかった時点で打ち切る
+小直径のグラフでは中盤のフロンティアが巨大になり、top-down では既に訪問済みの頂点への辺を大量に調べてしまう。
+一方 bottom-up なら未訪問の頂点ごとにすぐに親が見つかって打ち切れるため、調べる辺が大幅に減る。
+m_f > m_u / alpha (m_u は未訪問の頂点の辺の本数) となったら bottom-up に切り替え、
+フロンティアの頂点数が n / beta を下回ったら top-down に戻す (alpha = 14, beta = 24 は論文の値)
 """
 
-from typing import List
+from array import array
+from typing import List, Sequence, Tuple, Iterator, Optional
 from collections import deque
 
 
@@ -53,6 +66,181 @@ def bfs_queue_path(start: int, goal: int) -> None:
 
 
 
+def adj_to_csr(adj: Sequence[Sequence[int]]) -> Tuple[array, array]:
+    """
+    隣接リストを CSR 形式に変換する。頂点 u の隣接頂点は to[head[u]:head[u+1]]
+
+    Returns:
+        head (array): 長さ V+1
+        to (array): 長さ E
+    """
+    head = array('i', [0])
+    to = array('i')
+    for vs in adj:
+        to.extend(vs)
+        head.append(len(to))
+    return head, to
+
+
+def bfs_frontiers(head: Sequence[int], to: Sequence[int], sources: Sequence[int], dist: array, parent: array,
+                  rhead: Optional[Sequence[int]]=None, rto: Optional[Sequence[int]]=None,
+                  direction_optimizing: bool=True, alpha: float=14, beta: float=24, use_numpy: bool=False) -> Iterator[List[int]]:
+    """
+    CSR 形式のグラフについて sources からの BFS を行い、フロンティア (同じ距離の頂点のリスト) を距離の昇順に一つずつ yield する
+    yield されたフロンティアの頂点について dist, parent は埋められている (呼び出し側はフロンティアごとに同期した処理を挟める)
+
+    Args:
+        head, to: CSR 形式のグラフ。頂点 u の出辺の行き先は to[head[u]:head[u+1]]
+        sources (list): 始点のリスト (距離 0 のフロンティア)
+        dist (array): 長さ V の配列で未訪問の頂点は -1 とする。訪問した頂点の距離が書き込まれる
+        parent (array): 長さ V の配列。訪問した頂点の BFS 木の親が書き込まれる (始点は -1)
+        rhead, rto: 逆辺の CSR 形式 (bottom-up で入辺を調べるのに用いる)。省略した場合は無向グラフとみなし head, to を用いる
+        direction_optimizing (bool): False の場合は常に top-down で探索する
+        alpha, beta (float): top-down と bottom-up を切り替える閾値のパラメータ
+        use_numpy (bool): True の場合は各ステップを NumPy でベクトル化する。dist, parent は NumPy の整数配列とし、フロンティアは ndarray となる
+    """
+    if rhead is None:
+        rhead, rto = head, to
+    if use_numpy:
+        yield from _bfs_frontiers_numpy(head, to, sources, dist, parent, rhead, rto, direction_optimizing, alpha, beta)
+        return
+    n = len(head) - 1
+    frontier = []
+    for s in sources:
+        if dist[s] == -1:
+            dist[s] = 0
+            parent[s] = -1
+            frontier.append(s)
+    edges_unexplored = len(to)    # m_u
+    unvisited = None    # bottom-up で調べる未訪問の頂点の候補
+    bottom_up = False
+    level = 0
+    while frontier:
+        yield frontier
+        edges_frontier = 0    # m_f
+        for u in frontier:
+            edges_frontier += head[u+1] - head[u]
+        if direction_optimizing:
+            if not bottom_up and edges_frontier > edges_unexplored / alpha:
+                bottom_up = True
+            elif bottom_up and len(frontier) < n / beta:
+                bottom_up = False
+        edges_unexplored -= edges_frontier
+        next_level = level + 1
+        next_frontier = []
+        if bottom_up:
+            if unvisited is None:
+                unvisited = [v for v in range(n) if dist[v] == -1]
+            remain = []
+            for v in unvisited:
+                if dist[v] != -1:
+                    continue
+                for u in rto[rhead[v]:rhead[v+1]]:
+                    if dist[u] == level:
+                        dist[v] = next_level
+                        parent[v] = u
+                        next_frontier.append(v)
+                        break
+                else:
+                    remain.append(v)
+            unvisited = remain
+        else:
+            for u in frontier:
+                for v in to[head[u]:head[u+1]]:
+                    if dist[v] == -1:
+                        dist[v] = next_level
+                        parent[v] = u
+                        next_frontier.append(v)
+        frontier = next_frontier
+        level = next_level
+
+
+def _bfs_frontiers_numpy(head, to, sources, dist, parent, rhead, rto, direction_optimizing, alpha, beta):
+    """
+    bfs_frontiers() の各ステップを NumPy でベクトル化したもの
+    bottom-up では未訪問の頂点の k 番目の入辺を全頂点まとめて調べることを k = 0, 1, ... と繰り返し、
+    フロンティアの頂点が見つかった頂点を次の k から除くことで打ち切りをベクトル化する
+    """
+    import numpy as np
+    head, to, rhead, rto = (np.asarray(x, dtype=np.int64) for x in (head, to, rhead, rto))
+    n = len(head) - 1
+    sources = np.unique(np.asarray(sources, dtype=np.int64))
+    frontier = sources[dist[sources] == -1]
+    dist[frontier] = 0
+    parent[frontier] = -1
+    edges_unexplored = len(to)
+    unvisited = None
+    bottom_up = False
+    level = 0
+    while frontier.size:
+        yield frontier
+        starts = head[frontier]
+        lens = head[frontier + 1] - starts
+        edges_frontier = int(lens.sum())
+        if direction_optimizing:
+            if not bottom_up and edges_frontier > edges_unexplored / alpha:
+                bottom_up = True
+            elif bottom_up and frontier.size < n / beta:
+                bottom_up = False
+        edges_unexplored -= edges_frontier
+        if bottom_up:
+            if unvisited is None:
+                unvisited = np.flatnonzero(dist == -1)
+            unvisited = unvisited[dist[unvisited] == -1]
+            base = rhead[unvisited]
+            deg = rhead[unvisited + 1] - base
+            keep = deg > 0
+            rest, base, deg = unvisited[keep], base[keep], deg[keep]
+            found = []
+            k = 0
+            while rest.size:
+                u = rto[base + k]
+                hit = dist[u] == level
+                if hit.any():
+                    v = rest[hit]
+                    dist[v] = level + 1
+                    parent[v] = u[hit]
+                    found.append(v)
+                keep = ~hit & (deg > k + 1)
+                rest, base, deg = rest[keep], base[keep], deg[keep]
+                k += 1
+            frontier = np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+        else:
+            # フロンティアの出辺を一括で列挙する
+            offsets = np.repeat(starts - np.cumsum(lens) + lens, lens) + np.arange(edges_frontier)
+            nbr = to[offsets]
+            par = np.repeat(frontier, lens)
+            mask = dist[nbr] == -1
+            frontier, first = np.unique(nbr[mask], return_index=True)
+            dist[frontier] = level + 1
+            parent[frontier] = par[mask][first]
+        level += 1
+
+
+def bfs(head: Sequence[int], to: Sequence[int], sources: Sequence[int],
+        rhead: Optional[Sequence[int]]=None, rto: Optional[Sequence[int]]=None,
+        direction_optimizing: bool=True, use_numpy: bool=False) -> Tuple[array, array]:
+    """
+    CSR 形式のグラフについて、sources (複数可) からの最短距離と BFS 木の親を O(V+E) で求める
+
+    Returns:
+        dist (array): dist[v] は最も近い始点からの距離 (到達不能なら -1)。use_numpy=True の場合は ndarray
+        parent (array): parent[v] は BFS 木における v の親 (始点と到達不能な頂点は -1)。use_numpy=True の場合は ndarray
+    """
+    n = len(head) - 1
+    if use_numpy:
+        import numpy as np
+        dist = np.full(n, -1, dtype=np.int64)
+        parent = np.full(n, -1, dtype=np.int64)
+    else:
+        dist = array('i', [-1]) * n
+        parent = array('i', [-1]) * n
+    for _ in bfs_frontiers(head, to, sources, dist, parent, rhead, rto, direction_optimizing, use_numpy=use_numpy):
+        pass
+    return dist, parent
+
+
+
 if __name__ == "__main__":
     """
     0--2--4--6
@@ -80,6 +268,20 @@ if __name__ == "__main__":
     assert all(visited)
 
 
+    head, to = adj_to_csr(adjacent_list)
+    dist, parent = bfs(head, to, [0])
+    assert(list(dist) == [0, 1, 1, 2, 2, 3, 3])
+    assert(list(parent) == [-1, 0, 0, 1, 2, 3, 4])
+    # 多始点
+    dist, _ = bfs(head, to, [5, 6])
+    assert(list(dist) == [3, 2, 2, 1, 1, 0, 0])
+    # フロンティアごとの反復
+    dist = array('i', [-1]) * len(adjacent_list)
+    parent = array('i', [-1]) * len(adjacent_list)
+    assert(list(bfs_frontiers(head, to, [0], dist, parent)) == [[0], [1, 2], [3, 4], [5, 6]])
+    dist, parent = bfs(head, to, [0], use_numpy=True)
+    assert(dist.tolist() == [0, 1, 1, 2, 2, 3, 3])
+
     bfs_queue_path(0, 6)
     """
     [0]
@@ -1,13 +1,30 @@
 """
-DFS を用いた彩色シミュレーションにより O(V+E) で二部グラフ判定を行う
+彩色シミュレーションにより O(V+E) で二部グラフ判定を行う
+    - bipartite_predicate: 判定のみ
+    - bipartite_coloring: 二部グラフなら 2 彩色を、そうでなければ奇閉路 (証拠) を返す
+    - BipartiteUnionFind: 辺を逐次追加しながら二部グラフであり続けているかを判定する (偶奇つき Union-Find)
+
+
+<algorithm>
+bipartite_coloring
+未彩色の頂点から BFS を行い、各連結成分を根からの距離の偶奇で 2 色に塗る。
+同じ色の頂点を結ぶ辺 (u, v) が見つかれば、BFS 木上の u -> LCA -> v のパスとその辺が奇閉路をなす
+(u, v の深さの偶奇が等しいので、閉路長 depth(u) + depth(v) - 2 depth(LCA) + 1 は奇数)
+
+BipartiteUnionFind
+各頂点について、属する木の親との色が異なるか (parity) を持つ Union-Find。根との色の差は根までの parity の xor で求まる。
+辺 (u, v) を追加する時、u, v が同じ集合で根との色の差が等しければ奇閉路ができる。
+別の集合なら、u, v の色が異なるように根同士の parity を決めて併合する。
 """
 
-from typing import Sequence
+from array import array
+from collections import deque
+from typing import Sequence, List, Tuple, Optional
 
 
 def bipartite_predicate(adj: Sequence[Sequence[int]]) -> bool:
     """
-    O(V+E) で二部グラフ判定をする
+    O(V+E) で (全ての連結成分について) 二部グラフ判定をする
 
     Args:
         adj (sequence): 隣接リスト
@@ -17,22 +34,110 @@ def bipartite_predicate(adj: Sequence[Sequence[int]]) -> bool:
         二色 (B, R とする) を用意。ある頂点を B に彩色し、隣接頂点は異なる色で彩色していく。
         探索途中で色が矛盾する場合は二部グラフでなく、矛盾しない場合は二部グラフとわかる。
     """
-    start = 0
-    color = [None] * len(adj)
-    color[start] = True
-    stack = [start]
-    while stack:
-        u = stack[-1]
-        for v in adj[u]:
-            if color[v] is None:
-                color[v] = not color[u]
-                stack.append(v)
-                break
-            elif color[v] == color[u]:
+    return bipartite_coloring(adj)[0]
+
+
+def bipartite_coloring(adj: Sequence[Sequence[int]]) -> Tuple[bool, List[int]]:
+    """
+    O(V+E) で全ての連結成分について BFS で 2 彩色を試みる
+
+    Args:
+        adj (sequence): 無向グラフの隣接リスト
+    Returns:
+        is_bipartite (bool)
+        color_or_cycle (list): 二部グラフの場合は各頂点の色 (0 or 1) のリスト、
+                               そうでない場合は奇閉路をなす頂点のリスト (隣り合う頂点および末尾と先頭の頂点が辺で結ばれている)
+    """
+    n = len(adj)
+    color = [-1] * n
+    parent = [-1] * n
+    for s in range(n):
+        if color[s] != -1:
+            continue
+        color[s] = 0
+        q = deque([s])
+        while q:
+            u = q.popleft()
+            for v in adj[u]:
+                if color[v] == -1:
+                    color[v] = color[u] ^ 1
+                    parent[v] = u
+                    q.append(v)
+                elif color[v] == color[u]:
+                    return False, _odd_cycle(parent, u, v)
+    return True, color
+
+
+def _odd_cycle(parent: Sequence[int], u: int, v: int) -> List[int]:
+    """ BFS 木上で同じ深さの偶奇をもつ u, v を結ぶ辺があるとき、u -> LCA -> v のパスを返す """
+    path_u = [u]
+    while parent[path_u[-1]] != -1:
+        path_u.append(parent[path_u[-1]])
+    ancestors_u = set(path_u)
+    path_v = [v]
+    while path_v[-1] not in ancestors_u:
+        path_v.append(parent[path_v[-1]])
+    lca = path_v.pop()
+    return path_u[:path_u.index(lca) + 1] + path_v[::-1]
+
+
+
+class BipartiteUnionFind:
+    """
+    偶奇つき Union-Find により、辺を逐次追加しながら二部グラフ判定を行う (各操作ならし O(α(n)))
+
+    Attributes:
+        n (int): 頂点数
+        is_bipartite (bool): これまでに追加された辺からなるグラフが二部グラフであるか
+    """
+    def __init__(self, n: int):
+        self.n = n
+        self.table = array('i', range(n))    # table[x] は x の親。table[x] == x の時 x は根
+        self.parity = bytearray(n)    # parity[x] は x と table[x] の色が異なれば 1
+        self.group_size = array('i', [1]) * n
+        self.is_bipartite = True
+
+    def _find_set(self, x: int) -> Tuple[int, int]:
+        """ x の属する集合の根と、x と根の色が異なるか (0 or 1) を求める。経路圧縮は非再帰で行う """
+        path = []
+        while self.table[x] != x:
+            path.append(x)
+            x = self.table[x]
+        root = x
+        # 根に近い方から parity を根との差に付け替える
+        for y in reversed(path):
+            p = self.table[y]
+            if p != root:
+                self.parity[y] ^= self.parity[p]
+                self.table[y] = root
+        return root, (self.parity[path[0]] if path else 0)
+
+    def add_edge(self, u: int, v: int) -> bool:
+        """
+        辺 (u, v) を追加する。この辺により奇閉路ができた (二部グラフでなくなった) 場合 False を返す
+        一度二部グラフでなくなると is_bipartite は False のままである
+        """
+        ru, pu = self._find_set(u)
+        rv, pv = self._find_set(v)
+        if ru == rv:
+            if pu == pv:
+                self.is_bipartite = False
                 return False
-        else:
-            stack.pop()
-    return True
+            return True
+        if self.group_size[ru] < self.group_size[rv]:
+            ru, rv = rv, ru
+        self.table[rv] = ru
+        self.parity[rv] = pu ^ pv ^ 1    # u と v の色が異なるように rv と ru の色の差を決める
+        self.group_size[ru] += self.group_size[rv]
+        return True
+
+    def same_color(self, u: int, v: int) -> Optional[bool]:
+        """ u, v が同じ連結成分に属するなら同じ色に塗られるかを返す。異なる連結成分なら None を返す """
+        ru, pu = self._find_set(u)
+        rv, pv = self._find_set(v)
+        if ru != rv:
+            return None
+        return pu == pv
 
 
 
@@ -77,6 +182,23 @@ if __name__ == "__main__":
     """
     assert(bipartite_predicate(adj_3) == True)
 
+    # 2 彩色と奇閉路
+    assert(bipartite_coloring(adj_1) == (True, [0, 1, 0, 1, 0, 1]))
+    is_bipartite, cycle = bipartite_coloring(adj_2)
+    assert(not is_bipartite and sorted(cycle) == [1, 2, 4])
+    # 頂点 0 を含まない連結成分も調べる
+    assert(bipartite_predicate(((), (2, 3), (1, 3), (1, 2))) == False)
+
+    # 辺の逐次追加
+    uf = BipartiteUnionFind(5)
+    for u, v in ((0, 1), (1, 2), (2, 4), (0, 3)):
+        assert(uf.add_edge(u, v))
+    assert(uf.same_color(0, 2) == True)
+    assert(uf.same_color(3, 4) == True)
+    assert(uf.add_edge(3, 2) == True)
+    assert(uf.add_edge(1, 3) == False)    # 0 - 1 - 3 - 0 が奇閉路
+    assert(uf.is_bipartite == False)
+
     print(" * assertion test ok * ")
 
 
@@ -19,12 +19,12 @@ lowlink[u] は u から 1. DFS 木の辺を根から葉へ 0 回以上進む 2.
     v から u 側の DFS 部分木へ後退辺が伸びていれば uv は橋ではない
     lowlink(v) は v から後退辺による接続を許した時たどりつける一番根に近い頂点の order を表しているので、lowlink(v) <= order(u) なら後退辺接続されている
     故に order(u) < lowlink(v) で橋の判定が可能
-ある点 u (根以外) が関節点 <=> for any v adjacent to u order(u) <= lowlink(v)
-    根の場合子供が複数いたら関節点
+ある点 u (根以外) が関節点 <=> for any v (DFS 木における u の子) order(u) <= lowlink(v)
+    根の場合 DFS 木における子供が複数いたら関節点
     それ以外の頂点の場合、子供 v が後退辺により u の先祖と接続していたら u を削除しても到達可能である
-    全ての子供についてこれが成立していれば関節点
-    故に all v adjacent to u lowlink(v) < order(u)
-    逆に any v adjacent to u order(u) <= lowlink(v) で関節点の判定が可能
+    全ての子供についてこれが成立していれば関節点でない
+    故に all v (u の子) lowlink(v) < order(u) なら関節点でなく
+    逆に any v (u の子) order(u) <= lowlink(v) で関節点の判定が可能
 
 
 
@@ -32,8 +32,22 @@ lowlink[u] は u から 1. DFS 木の辺を根から葉へ 0 回以上進む 2.
 橋以外のエッジでつながっている頂点グループをひとかたまりと見た縮約グラフを考える。
 もとのグラフの橋のみが縮約グラフにおけるエッジとなる。
 二重連結成分分解後は木構造となる。
+
+
+LowlinkDecomposition
+辺の配列 (us[i] - vs[i]) を受け取り、非再帰の DFS 1 回で全ての連結成分を巡って以下を求める (多重辺、自己ループ可)
+    - 橋、関節点
+    - 二重辺連結成分 (2-edge-connected component): 橋を取り除いた時の連結成分。縮約すると橋を辺とする森 (bridge tree) となる
+    - ブロック (二重頂点連結成分、biconnected component): 辺の同値類であって、異なる 2 辺が同じブロックに属する <=> その 2 辺を含む単純閉路がある
+      ブロックと関節点を頂点とし、関節点とそれを含むブロックを辺で結ぶと森 (block-cut tree) となる
+辺を番号で区別するので、DFS 木の親への辺は「来た辺と同じ番号か」で判定する (多重辺の 2 本目は後退辺として扱われ、橋とならない)
+二重辺連結成分: 頂点を訪問順にスタックに積み、帰りがけに lowlink(u) == order(u) (親への辺が橋、あるいは u が根) なら
+              u までの頂点を取り出して 1 つの成分とする (強連結成分分解の Tarjan 法と同じ)
+ブロック: 木の辺と祖先への後退辺を辿った順にスタックに積み、帰りがけに親 p について order(p) <= lowlink(u) なら
+         辺 p - u までの辺を取り出して 1 つのブロックとする
 """
 
+from array import array
 from typing import Sequence, Set, List, Tuple
 
 
@@ -52,33 +66,48 @@ def bridge_detect(adj: Sequence[Sequence[int]], start: int=0) -> Tuple[List[List
     n = len(adj)
     order = [-1] * n
     lowlink = [-1] * n
-    cnt = -1
     bridge = []
     cycle_graph = [set() for _ in range(n)]
-    def dfs(u, parent=-1):
-        nonlocal cnt    # order をふる用。再起呼び出しでのインクリメントが呼び出しもとでも反映されて欲しい
-        cnt += 1
-        order[u] = cnt
-        lowlink[u] = cnt
-        for v in adj[u]:
+    def check(u, v):
+        # bridge detection
+        if order[u] < lowlink[v]:
+            bridge.append((u, v))
+        # for bi-connected components decomposition
+        else:
+            cycle_graph[u].add(v)
+            cycle_graph[v].add(u)
+    # 再帰だと長いパスを含むグラフで RecursionError となるため、明示的な stack で DFS する
+    parent = [-1] * n
+    it = [0] * n    # it[u] は adj[u] のうち次に調べる辺のインデックス
+    cnt = 0
+    order[start] = lowlink[start] = cnt
+    stack = [start]
+    while stack:
+        u = stack[-1]
+        if it[u] < len(adj[u]):
+            v = adj[u][it[u]]
+            it[u] += 1
             # 親
-            if v == parent:
+            if v == parent[u]:
                 continue
-            # 未訪問
+            # 未訪問。v の探索が終わってから check する
             if order[v] == -1:
-                dfs(v, parent=u)
-                lowlink[u] = min(lowlink[u], lowlink[v])
+                parent[v] = u
+                cnt += 1
+                order[v] = lowlink[v] = cnt
+                stack.append(v)
+                continue
             # v は訪問ずみだが、DFS 木の親でない。uv は後退辺
             else:
                 lowlink[u] = min(lowlink[u], order[v])
-            # bridge detection
-            if order[u] < lowlink[v]:
-                bridge.append((u, v))
-            # for bi-connected components decomposition
-            else:
-                cycle_graph[u].add(v)
-                cycle_graph[v].add(u)
-    dfs(start)
+            check(u, v)
+        else:
+            # u の探索が終わったので DFS 木の親へ戻る
+            stack.pop()
+            if stack:
+                p = stack[-1]
+                lowlink[p] = min(lowlink[p], lowlink[u])
+                check(p, u)
     return bridge, cycle_graph
     
 
@@ -96,30 +125,46 @@ def articulation_detect(adj: Sequence[Sequence[int]], start: int=0) -> List[int]
     n = len(adj)
     order = [-1] * n
     lowlink = [-1] * n
-    cnt = -1
     articulation = []
-    def dfs(u, parent=-1):
-        nonlocal cnt    # order をふる用。再起呼び出しでのインクリメントが呼び出しもとでも反映されて欲しい
-        cnt += 1
-        order[u] = cnt
-        lowlink[u] = cnt
-        for v in adj[u]:
+    children = [0] * n    # DFS 木における子の数
+    is_articulation = [False] * n    # DFS 木の子 v であって order(u) <= lowlink(v) なるものが存在するか
+    # 再帰だと長いパスを含むグラフで RecursionError となるため、明示的な stack で DFS する
+    parent = [-1] * n
+    it = [0] * n    # it[u] は adj[u] のうち次に調べる辺のインデックス
+    cnt = 0
+    order[start] = lowlink[start] = cnt
+    stack = [start]
+    while stack:
+        u = stack[-1]
+        if it[u] < len(adj[u]):
+            v = adj[u][it[u]]
+            it[u] += 1
             # 親
-            if v == parent:
+            if v == parent[u]:
                 continue
             # 未訪問
             if order[v] == -1:
-                dfs(v, parent=u)
-                lowlink[u] = min(lowlink[u], lowlink[v])
+                parent[v] = u
+                cnt += 1
+                order[v] = lowlink[v] = cnt
+                stack.append(v)
             # v は訪問ずみだが、DFS 木の親でない。uv は後退辺
             else:
                 lowlink[u] = min(lowlink[u], order[v])
-        # articulation detection
-        if u == start and len(adj[u]) > 1:
-            articulation.append(u)
-        elif any(map(lambda v: order[u] <= lowlink[v], filter(lambda x: x!=parent, adj[u]))):
-            articulation.append(u)
-    dfs(start)
+        else:
+            stack.pop()
+            # articulation detection
+            if u == start and children[u] > 1:
+                articulation.append(u)
+            elif u != start and is_articulation[u]:
+                articulation.append(u)
+            # DFS 木の親へ戻る
+            if stack:
+                p = stack[-1]
+                lowlink[p] = min(lowlink[p], lowlink[u])
+                children[p] += 1
+                if order[p] <= lowlink[u]:
+                    is_articulation[p] = True
     return articulation
 
 
@@ -138,19 +183,21 @@ def contract_from_cycle(bridge: List[List[int]], cycle_graph: List[Set[int]]) ->
     n = len(cycle_graph)
     visited = [False] * n
     vertex_to_group_num = [-1] * n
-    def dfs(u, group_num):
-        ' u と同じ二重連結成分に属する頂点全てに num なるグルーピングを施す。'
-        visited[u] = True
-        vertex_to_group_num[u] = group_num
-        for v in cycle_graph[u]:
-            if not visited[v]:
-                dfs(v, group_num)
     # 実際に二重連結成分単位でグルーピング
+    # u と同じ二重連結成分に属する頂点全てに cnt なるグルーピングを施す。(長いパスでも動くよう stack で探索する)
     cnt = -1 
     for u in range(n):
         if not visited[u]:
             cnt += 1
-            dfs(u, cnt)
+            visited[u] = True
+            stack = [u]
+            while stack:
+                x = stack.pop()
+                vertex_to_group_num[x] = cnt
+                for y in cycle_graph[x]:
+                    if not visited[y]:
+                        visited[y] = True
+                        stack.append(y)
     # そのグループ番号を新たなノードだとみなしたときの隣接リストを作る
     bi_connected = [[] for _ in range(cnt + 1)]
     for u, v in bridge:
@@ -160,6 +207,188 @@ def contract_from_cycle(bridge: List[List[int]], cycle_graph: List[Set[int]]) ->
     
 
 
+def _csr(N: int, a: Sequence[int], b: Sequence[int]) -> Tuple[array, array]:
+    """ 無向辺 a[i] - b[i] からなる N 頂点のグラフを CSR 形式 (head, adj) にする """
+    head = array('i', [0]) * (N + 1)
+    for x in a:
+        head[x+1] += 1
+    for y in b:
+        head[y+1] += 1
+    for x in range(N):
+        head[x+1] += head[x]
+    pos = head[:-1]
+    adj = array('i', [0]) * head[N]
+    for x, y in zip(a, b):
+        adj[pos[x]] = y
+        pos[x] += 1
+        adj[pos[y]] = x
+        pos[y] += 1
+    return head, adj
+
+
+
+class LowlinkDecomposition:
+    def __init__(self, n: int, us: Sequence[int], vs: Sequence[int]):
+        """
+        頂点 0, 1, ..., n-1 と辺 i = us[i] - vs[i] からなる無向グラフ (非連結、多重辺、自己ループ可) を
+        非再帰の DFS 1 回で分解する O(V+E)。全ての結果は array('i') で保持する
+
+        Attributes:
+            bridges (array): 橋である辺の番号 (昇順)
+            articulation (array): 関節点 (昇順)
+            two_edge_count (int): 二重辺連結成分の数
+            two_edge_id (array): two_edge_id[v] は頂点 v の属する二重辺連結成分の番号
+            block_count (int): ブロックの数
+            block_id (array): block_id[i] は辺 i の属するブロックの番号 (自己ループは -1)
+            bridge_tree_head, bridge_tree_adj (array): 二重辺連結成分を頂点、橋を辺とする森 (CSR 形式)。
+                成分 c に隣接する成分は bridge_tree_adj[bridge_tree_head[c]:bridge_tree_head[c+1]]
+            block_cut_head, block_cut_adj (array): block-cut tree (CSR 形式)。
+                頂点 0, ..., block_count-1 がブロック、block_count + k が関節点 articulation[k] を表す
+            vertex_node (array): vertex_node[v] は頂点 v を表す block-cut tree の頂点
+                (関節点ならそれ自身、そうでなければ v を含む唯一のブロック、自己ループ以外の辺を持たなければ -1)
+        """
+        m = len(us)
+        if len(vs) != m:
+            raise ValueError(f"LowlinkDecomposition(): us and vs must have the same length, got {m} and {len(vs)}")
+        # 自己ループを除いて CSR 形式の隣接リスト (行き先と辺の番号) を作る
+        start = array('i', [0]) * (n + 1)
+        for i in range(m):
+            if us[i] != vs[i]:
+                start[us[i]+1] += 1
+                start[vs[i]+1] += 1
+        for x in range(n):
+            start[x+1] += start[x]
+        pos = start[:-1]
+        to = array('i', [0]) * start[n]
+        eid = array('i', [0]) * start[n]
+        for i in range(m):
+            u, v = us[i], vs[i]
+            if u != v:
+                to[pos[u]] = v
+                eid[pos[u]] = i
+                pos[u] += 1
+                to[pos[v]] = u
+                eid[pos[v]] = i
+                pos[v] += 1
+
+        order = array('i', [-1]) * n
+        lowlink = array('i', [0]) * n
+        parent_edge = array('i', [-1]) * n    # DFS 木の親への辺の番号 (根は -1)
+        it = start[:-1]    # it[u] は u の隣接のうち次に調べる位置
+        is_articulation = bytearray(n)
+        is_bridge = bytearray(m)
+        two_edge_id = array('i', [-1]) * n
+        block_id = array('i', [-1]) * m
+        vertex_stack = []    # 二重辺連結成分が確定していない訪問済みの頂点
+        edge_stack = []    # ブロックが確定していない辺
+        t = 0
+        two_edge_count = 0
+        block_count = 0
+        for root in range(n):
+            if order[root] != -1:
+                continue
+            order[root] = lowlink[root] = t
+            t += 1
+            vertex_stack.append(root)
+            root_children = 0
+            call = [root]    # DFS の呼び出しスタック
+            while call:
+                u = call[-1]
+                k = it[u]
+                if k < start[u+1]:
+                    it[u] = k + 1
+                    i = eid[k]
+                    if i == parent_edge[u]:
+                        continue
+                    v = to[k]
+                    if order[v] == -1:
+                        # 木の辺
+                        order[v] = lowlink[v] = t
+                        t += 1
+                        parent_edge[v] = i
+                        vertex_stack.append(v)
+                        edge_stack.append(i)
+                        call.append(v)
+                        if u == root:
+                            root_children += 1
+                    elif order[v] < order[u]:
+                        # 祖先への後退辺 (子孫からの後退辺は子孫の側で処理ずみ)
+                        edge_stack.append(i)
+                        if order[v] < lowlink[u]:
+                            lowlink[u] = order[v]
+                    continue
+                call.pop()
+                if lowlink[u] == order[u]:
+                    # 親への辺は橋 (あるいは u は根)。u までの頂点が二重辺連結成分をなす
+                    if call:
+                        is_bridge[parent_edge[u]] = 1
+                    while True:
+                        w = vertex_stack.pop()
+                        two_edge_id[w] = two_edge_count
+                        if w == u:
+                            break
+                    two_edge_count += 1
+                if call:
+                    p = call[-1]
+                    if lowlink[u] < lowlink[p]:
+                        lowlink[p] = lowlink[u]
+                    if order[p] <= lowlink[u]:
+                        # p - u 以降に積まれた辺が 1 つのブロックをなす
+                        if p != root:
+                            is_articulation[p] = 1
+                        pe = parent_edge[u]
+                        while True:
+                            i = edge_stack.pop()
+                            block_id[i] = block_count
+                            if i == pe:
+                                break
+                        block_count += 1
+            if root_children > 1:
+                is_articulation[root] = 1
+
+        self.bridges = array('i', (i for i in range(m) if is_bridge[i]))
+        self.articulation = array('i', (v for v in range(n) if is_articulation[v]))
+        self.two_edge_count = two_edge_count
+        self.two_edge_id = two_edge_id
+        self.block_count = block_count
+        self.block_id = block_id
+        self.bridge_tree_head, self.bridge_tree_adj = _csr(two_edge_count, [two_edge_id[us[i]] for i in self.bridges], [two_edge_id[vs[i]] for i in self.bridges])
+
+        # block-cut tree: ブロックごとに辺を見て、含まれる関節点と結ぶ (mark で重複を除く)
+        vertex_node = array('i', [-1]) * n
+        for k, v in enumerate(self.articulation):
+            vertex_node[v] = block_count + k
+        block_head = array('i', [0]) * (block_count + 1)
+        for b in block_id:
+            if b != -1:
+                block_head[b+1] += 1
+        for b in range(block_count):
+            block_head[b+1] += block_head[b]
+        pos = block_head[:-1]
+        block_edges = array('i', [0]) * block_head[block_count]
+        for i in range(m):
+            b = block_id[i]
+            if b != -1:
+                block_edges[pos[b]] = i
+                pos[b] += 1
+        mark = array('i', [-1]) * n    # mark[v] == b なら v はブロック b について処理ずみ
+        tree_a, tree_b = [], []
+        for b in range(block_count):
+            for k in range(block_head[b], block_head[b+1]):
+                i = block_edges[k]
+                for v in (us[i], vs[i]):
+                    if mark[v] != b:
+                        mark[v] = b
+                        if is_articulation[v]:
+                            tree_a.append(b)
+                            tree_b.append(vertex_node[v])
+                        else:
+                            vertex_node[v] = b
+        self.vertex_node = vertex_node
+        self.block_cut_head, self.block_cut_adj = _csr(block_count + len(self.articulation), tree_a, tree_b)
+
+
+
 if __name__ == "__main__":
     adjacent_list = ((1, 5),
                     (0, 2, 3, 4),
@@ -180,4 +409,38 @@ if __name__ == "__main__":
     assert(bi_connected == [[1, 3], [2, 0], [1], [4, 0], [3]])
     articulation = articulation_detect(adjacent_list, start=0)
     assert(articulation == [1, 6, 5, 0])
-    print(" * assertion test ok * ")
\ No newline at end of file
+    # 上のグラフに 多重辺 10 - 11 と自己ループ 12 - 12 を加え、全ての連結成分を一度に分解する
+    edges = [(u, v) for u in range(10) for v in adjacent_list[u] if u < v] + [(10, 11), (11, 10), (12, 12)]
+    us, vs = zip(*edges)
+    d = LowlinkDecomposition(13, us, vs)
+    assert([edges[i] for i in d.bridges] == [(0, 1), (0, 5), (1, 2), (6, 7)])
+    assert(list(d.articulation) == [0, 1, 5, 6])
+    assert(d.two_edge_count == 7)
+    assert(list(d.two_edge_id) == [4, 1, 0, 1, 1, 3, 3, 2, 3, 3, 5, 5, 6])
+    assert(d.block_count == 7)
+    assert(list(d.block_id) == [2, 5, 0, 1, 1, 1, 4, 4, 3, 4, 4, 6, 6, -1])
+    # block-cut tree の頂点 7, 8, 9, 10 は関節点 0, 1, 5, 6
+    assert(list(d.vertex_node) == [7, 8, 0, 1, 1, 9, 10, 3, 4, 4, 6, 6, -1])
+    assert(sorted(d.block_cut_adj[d.block_cut_head[8]:d.block_cut_head[9]]) == [0, 1, 2])
+    print(" * assertion test ok * ")
+
+    # ベンチマーク: 頂点数 10^5 の連結なグラフで bridge_detect + contract_from_cycle + articulation_detect と比べる
+    import time
+    from random import randrange
+    N, M = 10**5, 3 * 10**5
+    us = [randrange(v) for v in range(1, N)] + [randrange(N) for _ in range(M - N + 1)]
+    vs = list(range(1, N)) + [randrange(N) for _ in range(M - N + 1)]
+    adj = [[] for _ in range(N)]
+    for u, v in zip(us, vs):
+        if u != v:
+            adj[u].append(v)
+            adj[v].append(u)
+    t0 = time.perf_counter()
+    bridge, cycle_graph = bridge_detect(adj)
+    contract_from_cycle(bridge, cycle_graph)
+    articulation = articulation_detect(adj)
+    t1 = time.perf_counter()
+    d = LowlinkDecomposition(N, us, vs)
+    t2 = time.perf_counter()
+    assert(sorted(articulation) == list(d.articulation))
+    print(f"V = 10^5, E = 3*10^5: bridge_detect + contract_from_cycle + articulation_detect {t1 - t0:.2f} sec, LowlinkDecomposition {t2 - t1:.2f} sec")
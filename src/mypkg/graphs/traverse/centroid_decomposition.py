@@ -0,0 +1,207 @@
+"""
+(参考) 蟻本 p.360-363 (重心分解)
+重心分解 (centroid decomposition) による木の距離に関するクエリ (前処理 O(nlgn))
+    - mark(v), nearest_marked(v): 頂点に印をつけ、最も近い印つきの頂点までの距離を求める (各 O(lgn))
+    - count_within(v, d): v からの距離が d 以下の頂点数を求める (O(lg^2 n))
+クエリごとに BFS を行うと O(n) かかるのに対し、大量のクエリに向く。
+
+
+<algorithm>
+木の重心 (取り除くと残る各部分木のサイズが元の半分以下となる頂点) c を取り除き、残った各部分木について再帰的に重心を求める。
+c を残った部分木の重心たちの親とすると、重心の木 (centroid tree) ができ、その深さは O(lgn) である。
+任意の 2 頂点 u, v 間のパスは、centroid tree 上での u, v の LCA にあたる重心 c を必ず通るので dist(u, v) = dist(u, c) + dist(c, v)
+よって各頂点 v から centroid tree 上の祖先 (高々 O(lgn) 個) の重心 c について dist(v, c) を前計算しておけば
+    - nearest_marked: best[c] = c の担当する部分木内の印つきの頂点との距離の最小値 とすれば、min_c (best[c] + dist(v, c))
+    - count_within: c の担当する部分木内の頂点の c からの距離をソートしておけば、二分探索で dist(v, c) + dist(c, u) <= d なる u を数えられる。
+      ただし v と同じ子の部分木 (centroid tree 上で v 側の子 child) 内の u は c を通らないので、
+      child の部分木内の頂点の c からの距離もソートしておき、その分を差し引く
+距離は重心の深さ (level) ごとに長さ n の array('i') に、dist[level][v] = dist(v, level が level の v の祖先の重心) として持つ。
+
+構築は再帰を用いず、(部分木の根, 親の重心) のタスクを stack で管理する。
+重心 c からの BFS 木は、c を除いて残る各部分木をその根 (c の子) から BFS した木にもなっているので、
+BFS の逆順で求めた部分木のサイズをそのまま子のタスクの重心探索に使い、部分木の走査を重心ごとに一回で済ませている。
+"""
+
+
+from array import array
+from bisect import bisect_right
+from typing import Sequence, Union
+
+Num = Union[int, float]
+
+
+
+class CentroidDecomposition:
+    """
+    重心分解された木
+
+    Attributes:
+        size (int): 頂点数
+        centroid_parent (array): centroid_parent[c] は centroid tree 上での c の親の重心 (根の重心は -1)
+        level (array): level[c] は centroid tree 上での c の深さ
+        dist (list): dist[k][v] は v と、centroid tree 上で v の祖先 (v 自身を含む) のうち深さ k の重心との距離
+        sorted_dist (list): sorted_dist[c] は c の担当する部分木内の頂点の c からの距離を昇順に並べた array
+        sorted_dist_to_parent (list): sorted_dist_to_parent[c] は c の担当する部分木内の頂点の centroid_parent[c] からの距離を昇順に並べた array
+    """
+    def __init__(self, adj: Sequence[Sequence[int]]):
+        self.size = n = len(adj)
+        self.centroid_parent = array('i', [-1]) * n
+        self.level = array('i', [-1]) * n
+        self.dist = []
+        self.sorted_dist = [None] * n
+        self.sorted_dist_to_parent = [None] * n
+        self.best = [float('inf')] * n    # best[c] は c の担当する部分木内の印つきの頂点の c からの距離の最小値
+        self._build(adj)
+
+    def _build(self, adj: Sequence[Sequence[int]]) -> None:
+        """ O(nlgn) で重心分解を行う """
+        n = self.size
+        removed = bytearray(n)
+        prev = array('i', [-1]) * n    # 走査中の部分木における親
+        subtree_size = array('i', [1]) * n
+        if n == 0:
+            return
+        # 最初の部分木 (木全体) を頂点 0 を根として走査し、サイズを求めておく
+        order = [0]
+        for u in order:
+            for v in adj[u]:
+                if v != prev[u]:
+                    prev[v] = u
+                    order.append(v)
+        for u in reversed(order[1:]):
+            subtree_size[prev[u]] += subtree_size[u]
+        # タスク (s, 親の重心): s を根とする部分木について prev と subtree_size は計算済みとする
+        tasks = [(0, -1)]
+        while tasks:
+            s, parent_centroid = tasks.pop()
+            # サイズが半分を超える子がある限りそちらへ進むと重心に着く
+            total = subtree_size[s]
+            c = s
+            while True:
+                for v in adj[c]:
+                    if v != prev[c] and not removed[v] and 2 * subtree_size[v] > total:
+                        c = v
+                        break
+                else:
+                    break
+            lv = self.level[parent_centroid] + 1 if parent_centroid != -1 else 0
+            self.level[c] = lv
+            self.centroid_parent[c] = parent_centroid
+            if len(self.dist) == lv:
+                self.dist.append(array('i', [-1]) * n)
+            dist = self.dist[lv]
+            # c から BFS して距離を求める (BFS 順なので距離は昇順に並ぶ)
+            prev[c] = -1
+            dist[c] = 0
+            bfs = [c]
+            for u in bfs:
+                for v in adj[u]:
+                    if v != prev[u] and not removed[v]:
+                        prev[v] = u
+                        dist[v] = dist[u] + 1
+                        bfs.append(v)
+            self.sorted_dist[c] = array('i', [dist[u] for u in bfs])
+            if parent_centroid != -1:
+                parent_dist = self.dist[lv - 1]
+                self.sorted_dist_to_parent[c] = array('i', sorted([parent_dist[u] for u in bfs]))
+            # c を根とした BFS 木でサイズを求め直すと、c を除いて残る各部分木 (c の子 v を根とする) の prev と subtree_size が得られる
+            for u in bfs:
+                subtree_size[u] = 1
+            for u in reversed(bfs[1:]):
+                subtree_size[prev[u]] += subtree_size[u]
+            removed[c] = 1
+            for v in adj[c]:
+                if not removed[v]:
+                    tasks.append((v, c))
+
+    def distance(self, u: int, v: int) -> int:
+        """ O(lgn) で u, v 間の距離を求める (centroid tree 上の共通祖先のうち最も深い重心を経由する) """
+        level, parent = self.level, self.centroid_parent
+        a, b = u, v
+        while a != b:
+            if level[a] < level[b]:
+                b = parent[b]
+            else:
+                a = parent[a]
+        k = level[a]
+        return self.dist[k][u] + self.dist[k][v]
+
+    def mark(self, v: int) -> None:
+        """ O(lgn) で頂点 v に印をつける """
+        c = v
+        while c != -1:
+            d = self.dist[self.level[c]][v]
+            if d < self.best[c]:
+                self.best[c] = d
+            c = self.centroid_parent[c]
+
+    def nearest_marked(self, v: int) -> Num:
+        """ O(lgn) で頂点 v から最も近い印つきの頂点までの距離を求める。印つきの頂点がなければ inf を返す """
+        ans = float('inf')
+        c = v
+        while c != -1:
+            d = self.best[c] + self.dist[self.level[c]][v]
+            if d < ans:
+                ans = d
+            c = self.centroid_parent[c]
+        return ans
+
+    def count_within(self, v: int, d: int) -> int:
+        """ O(lg^2 n) で頂点 v からの距離が d 以下の頂点 (v 自身を含む) の数を求める """
+        count = 0
+        c = v
+        child = -1
+        while c != -1:
+            r = d - self.dist[self.level[c]][v]
+            if r >= 0:
+                count += bisect_right(self.sorted_dist[c], r)
+                if child != -1:
+                    # child 側の部分木内の頂点は c を経由しないので除く
+                    count -= bisect_right(self.sorted_dist_to_parent[child], r)
+            child = c
+            c = self.centroid_parent[c]
+        return count
+
+
+
+
+if __name__ == "__main__":
+    """
+                0
+        1               2
+    3               4   5   6
+     7             8 9     10
+      11          12  13
+                        14
+    という木を仮定する。(diameter_of_trees.py と同じ)
+    """
+    adjacent_list = ((1, 2),
+                     (0, 3),
+                     (0, 4, 5, 6),
+                     (1, 7),
+                     (2, 8, 9),
+                     (2,),
+                     (2, 10),
+                     (3, 11),
+                     (4, 12),
+                     (4, 13),
+                     (6,),
+                     (7,),
+                     (8,),
+                     (9, 14),
+                     (13,))
+    cd = CentroidDecomposition(adjacent_list)
+    # centroid tree の深さは O(lgn)
+    assert(max(cd.level) <= len(adjacent_list).bit_length())
+    assert(cd.distance(14, 11) == 9)
+    assert(cd.distance(12, 10) == 5)
+    assert(cd.nearest_marked(0) == float('inf'))
+    cd.mark(11)
+    assert(cd.nearest_marked(14) == 9)
+    cd.mark(5)
+    assert(cd.nearest_marked(14) == 5)
+    assert(cd.nearest_marked(5) == 0)
+    assert(cd.count_within(0, 1) == 3)
+    assert(cd.count_within(2, 2) == 9)    # 2 自身と 0, 4, 5, 6, 1, 8, 9, 10
+    assert(cd.count_within(14, 9) == 15)
+    print(" * assertion test ok * ")
@@ -24,22 +24,24 @@ def diameter_of_tree(adj: Sequence[Sequence[int]], root: int) -> Tuple[Tuple[int
         2. u から DFS を行い、最遠点 v を求める
         3. diameter = dist(u, v)
     """
-    def dfs(u, previous=-1, dist=0):
-        nonlocal max_dist    # ここに最遠距離をメモ
-        nonlocal most_remote_point    # ここに最遠点をメモ
-        if max_dist < dist:
-            max_dist = dist
-            most_remote_point = u
-        for v in adj[u]:
+    def dfs(start):
+        """ start から (木なので) 行きがけの順に探索し、最遠点とその距離を返す。長いパスでも動くよう stack で実装する """
+        max_dist = 0
+        most_remote_point = start
+        stack = [(start, -1, 0)]    # (現在地, 一つ前の頂点, 距離)
+        while stack:
+            u, previous, dist = stack.pop()
+            if max_dist < dist:
+                max_dist = dist
+                most_remote_point = u
             # 木の場合は visited 判定がいらない。自分自身を探索範囲から除けばそれらは全て未探索である。
-            if v != previous:
-                dfs(v, previous=u, dist=dist+1)
-    max_dist = 0
-    most_remote_point = -1                
-    dfs(root)
-    max_dist = 0
-    end_point_1 = most_remote_point
-    dfs(most_remote_point)
+            # 隣接リストの前の方から訪れるよう逆順に積む
+            for v in reversed(adj[u]):
+                if v != previous:
+                    stack.append((v, u, dist+1))
+        return most_remote_point, max_dist
+    end_point_1, _ = dfs(root)
+    most_remote_point, max_dist = dfs(end_point_1)
     return (end_point_1, most_remote_point), max_dist
 
 
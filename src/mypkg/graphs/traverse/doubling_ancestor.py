@@ -11,62 +11,73 @@ Q 個のクエリが飛んでくるとすると O(Q) * O(k) であった時間
 ...
 depth 個先の祖先
 を知っているように前処理を行う。(上から順に上の結果を利用していけば O(n) + O(n) + ... O(n) (depth 個) = O(nlgn) となる)
+各段は長さ n+1 の array('i') 一本で持ち (末尾は -1 の番兵)、最小共通祖先 calc_LCA() も提供する (lca_doubling.py も本モジュールの DoublingTree を用いる)
 
 
 verified @ABC014D
 """
 
 
+from array import array
 from collections import deque
-from typing import Sequence
+from typing import Sequence, List, Union
 
 
 class DoublingTree:
     """
     ダブリングにより 2^k 個先の祖先の情報を獲得した根付き木
 
+    各段 up[level] は長さ size + 1 の array('i') で、up[level][i] は頂点 i の 2^level 個先の祖先 (存在しない場合 -1) である。
+    末尾の up[level][size] は番兵で常に -1 とする。Python の配列 (と NumPy の配列) では添字 -1 が末尾を指すので、
+    up[level][-1] == -1 となり、祖先が存在するかの分岐なしに up[level][up[level][i]] と引ける。
+    これにより各段は一つ前の段から up[level] = up[level-1][up[level-1]] の一括の gather で作れる。
+
     Attributes:
-        adj (list): 隣接リスト
         size (int): 頂点数
         root (int): 根のインデックス
-        children (list): children[i] = (頂点 i の子のインデックスのリスト)
-        ancestors (list): ancestors[i][level] = (頂点 i の 2^level 個先の祖先). level は 0 から lgN - 1 まで存在し、そのような祖先が存在しない場合 -1 が入る
+        dist_from_root (array): dist_from_root[i] は根から頂点 i までの距離
+        up (list): up[level][i] = (頂点 i の 2^level 個先の祖先). level は 0 から lg(N-1) まで存在し、そのような祖先が存在しない場合 -1 が入る
     """
-    def __init__(self, adj: Sequence[Sequence[int]], root: int):
-        self.adj = adj
-        self.size = len(adj)
+    def __init__(self, adj: Sequence[Sequence[int]], root: int, use_numpy: bool=False):
+        self.size = n = len(adj)
         self.root = root
-        self.children = [[] for _ in range(self.size)]
-        self.ancestors = [[-1] * self.size.bit_length() for _ in range(self.size)]
-        self._build_rooted_tree()
-        self._doubling_ancestors()
-    
-    def _build_rooted_tree(self) -> None:
+        self.dist_from_root = array('i', [-1]) * n
+        parent = array('i', [-1]) * (n + 1)
+        self._build_rooted_tree(adj, parent)
+        self.up = [parent]
+        self._doubling_ancestors(use_numpy)
+
+    def _build_rooted_tree(self, adj: Sequence[Sequence[int]], parent: array) -> None:
         """
-        O(N) で隣接リストと根をもとに self.children および self.ancestors の親のスロットを記載する
+        O(N) で隣接リストと根をもとに BFS を行い、各頂点の親 parent と self.dist_from_root を記録する
         """
-        visited = [False] * self.size
-        q = deque()
-        q.append(self.root)
+        dist = self.dist_from_root
+        dist[self.root] = 0
+        q = deque([self.root])
         while q:
             u = q.popleft()
-            if not visited[u]:
-                visited[u] = True
-                for v in self.adj[u]:
-                    if not visited[v]:
-                        self.children[u].append(v)
-                        self.ancestors[v][0] = u
-                        q.append(v)
-    
-    def _doubling_ancestors(self) -> None:
+            for v in adj[u]:
+                if dist[v] < 0:
+                    dist[v] = dist[u] + 1
+                    parent[v] = u
+                    q.append(v)
+
+    def _doubling_ancestors(self, use_numpy: bool=False) -> None:
         """
-        O(NlgN) で各ノードの self.ancestors[i][level] のスロットを記載する。
-        なお、_build_rooted_tree() により self.ancestors[i][0] は登記済みであるとする。
+        O(NlgN) で self.up[level] (level >= 1) を一つ前の段からの gather で作る。
+        use_numpy=True の時は NumPy の fancy indexing で行う
         """
-        for level in range(1, self.size.bit_length()):
-            for i in range(self.size):
-                if self.ancestors[i][level-1] >= 0:
-                    self.ancestors[i][level] = self.ancestors[self.ancestors[i][level-1]][level-1]
+        levels = max(1, (self.size - 1).bit_length())
+        if use_numpy:
+            import numpy as np
+            prev = np.frombuffer(self.up[0], dtype=np.int32)
+            for _ in range(1, levels):
+                prev = prev[prev]
+                self.up.append(array('i', prev.tobytes()))
+        else:
+            for _ in range(1, levels):
+                prev = self.up[-1]
+                self.up.append(array('i', [prev[p] for p in prev]))
 
     def kth_ancestor(self, i: int, k: int) -> int:
         """
@@ -75,15 +86,63 @@ class DoublingTree:
         """
         if k >= self.size:
             raise ValueError(f"DoublingTree.kth_ancestor(): k shoule be lt num of vertices. got i: {i}, k: {k} (tree size = {self.size})")
-        node_ind = i
-        flag_bit = 1
-        for level in range(k.bit_length()):
-            if node_ind < 0:
-                break
-            if k & flag_bit:
-                node_ind = self.ancestors[node_ind][level]
-            flag_bit <<= 1
-        return node_ind
+        level = 0
+        while k:
+            if k & 1:
+                i = self.up[level][i]
+            k >>= 1
+            level += 1
+        return i
+
+    def kth_ancestor_batch(self, nodes: Sequence[int], ks: Sequence[int], use_numpy: bool=False) -> Union[List[int], 'np.ndarray']:
+        """
+        (nodes[j], ks[j]) の各組について kth_ancestor(nodes[j], ks[j]) を求める (O(Q lgN))
+        use_numpy=True の時は段ごとに全クエリを NumPy の配列で一括に gather して一段ずつ遡り、ndarray を返す
+        """
+        if any(k >= self.size for k in ks):
+            raise ValueError(f"DoublingTree.kth_ancestor_batch(): k shoule be lt num of vertices (tree size = {self.size})")
+        if use_numpy:
+            import numpy as np
+            cur = np.array(nodes, dtype=np.int32)
+            ks = np.asarray(ks)
+            for level, up in enumerate(self.up):
+                mask = (ks >> level) & 1 == 1
+                cur[mask] = np.frombuffer(up, dtype=np.int32)[cur[mask]]
+            return cur
+        # Python のリストで段ごとに全クエリを走査すると不要な段も見るため、クエリごとに立っているビットのみ辿る
+        up = self.up
+        res = []
+        for i, k in zip(nodes, ks):
+            level = 0
+            while k:
+                if k & 1:
+                    i = up[level][i]
+                k >>= 1
+                level += 1
+            res.append(i)
+        return res
+
+    def calc_LCA(self, u: int, v: int) -> int:
+        """
+        2 つの node を受け取り、その最小共通祖先を O(lgn) で求める。
+        深い方を同じ深さまで持ち上げた後、2^level 個先の祖先が一致しない限り両方を遡ることを level の大きい順に行う
+        Args:
+            u, v (int)
+        Returns:
+            lca (int)
+        """
+        dist = self.dist_from_root
+        # u は v と同じ深さかより深いノードとする
+        if dist[u] < dist[v]:
+            u, v = v, u
+        u = self.kth_ancestor(u, dist[u] - dist[v])
+        # そもそも同じ枝に乗っていた場合、深さを合わせるだけで一致する
+        if u == v:
+            return u
+        for up in reversed(self.up):
+            if up[u] != up[v]:
+                u, v = up[u], up[v]
+        return self.up[0][u]
 
 
 
@@ -106,22 +165,11 @@ if __name__ == "__main__":
     # ===================================
 
     doubling_tree = DoublingTree(adj, 0)
-    assert (doubling_tree.children == [[1, 2], [3, 4], [5, 6], [7, 8], [9, 10], [11, 12], [13, 14], [], [], [], [], [], [], [], []])
-    assert(doubling_tree.ancestors == [[-1, -1, -1, -1],
-                                       [0, -1, -1, -1],
-                                       [0, -1, -1, -1],
-                                       [1, 0, -1, -1],
-                                       [1, 0, -1, -1],
-                                       [2, 0, -1, -1],
-                                       [2, 0, -1, -1],
-                                       [3, 1, -1, -1],
-                                       [3, 1, -1, -1],
-                                       [4, 1, -1, -1],
-                                       [4, 1, -1, -1],
-                                       [5, 2, -1, -1],
-                                       [5, 2, -1, -1],
-                                       [6, 2, -1, -1],
-                                       [6, 2, -1, -1]])
+    assert(doubling_tree.up == [array('i', [-1, 0, 0, 1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6, -1]),
+                                array('i', [-1, -1, -1, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, -1]),
+                                array('i', [-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1]),
+                                array('i', [-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1])])
+    assert(DoublingTree(adj, 0, use_numpy=True).up == doubling_tree.up)
     
     # 1 段目 (最初)
     assert(doubling_tree.kth_ancestor(0, 0) == 0)
@@ -146,6 +194,12 @@ if __name__ == "__main__":
     assert(doubling_tree.kth_ancestor(14, 2) == 2)
     assert(doubling_tree.kth_ancestor(14, 3) == 0)
     assert(doubling_tree.kth_ancestor(14, 4) == -1)
+    # まとめて求める
+    nodes, ks = (0, 1, 9, 9, 14, 14), (0, 1, 2, 4, 3, 1)
+    assert(doubling_tree.kth_ancestor_batch(nodes, ks) == [0, 0, 1, -1, 0, 6])
+    assert(doubling_tree.kth_ancestor_batch(nodes, ks, use_numpy=True).tolist() == [0, 0, 1, -1, 0, 6])
+    assert(doubling_tree.calc_LCA(9, 12) == 0)
+    assert(doubling_tree.calc_LCA(7, 10) == 1)
 
     print(" * assertion test ok * ")
 
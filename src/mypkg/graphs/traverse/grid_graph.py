@@ -0,0 +1,376 @@
+"""
+(参考) グリッドグラフ上の探索
+H×W のグリッドを隣接リストに変換せず、平坦化した 1 次元の bytearray / array のまま BFS, 0-1 BFS, Dijkstra 法, 連結成分のラベリングを行う
+(マスごとに隣接頂点のリストやタプルを作ると、それだけで大量のメモリと時間を使ってしまう)
+
+- マス (r, c) は添字 i = r * W + c で表す。sources や戻り値の配列もこの添字に従う
+- neighborhood = 4 なら上下左右、8 なら斜めも含めた 8 近傍に移動できる
+- is_wall(値) が True となるマスには入れない (省略した場合は壁なし)。grid が bytes, bytearray なら 256 通りの値の表を作り bytes.translate で一括判定する
+
+
+<algorithm>
+周囲を壁で 1 マスずつ埋めた (H+2)×(W+2) のグリッドを作ると、添字 p の隣は p ± 1, p ± (W+2), p ± (W+2) ± 1 となり、
+範囲外の判定なしに添字の足し算だけで隣接マスを列挙できる。各関数の内部ではこの添字で探索し、最後に元の添字に戻す。
+通れるかどうかを表す bytearray は探索中に訪問済みの印としても使う (訪問したら 0 にする) ので、判定が 1 回で済む。
+
+連結成分のラベリングの NumPy 版 (use_numpy=True) は、隣り合う通れるマスの組を辺として全て列挙し、
+「辺の両端の根が異なれば大きい方の根を小さい方の根につなぐ」「根まで pointer jumping で経路圧縮する」を一括で行うことを繰り返す。
+根を持つ木が他の木と隣り合っていれば毎回少なくとも一つの木とまとまるので、木の数は毎回半分以下になり O(lg(HW)) 回で終わる。
+"""
+
+
+from array import array
+from heapq import heappush, heappop
+from typing import Sequence, List, Tuple, Callable, Optional, Union
+
+Num = Union[int, float]
+
+
+
+def flatten_grid(rows: Sequence[Union[str, bytes]]) -> Tuple[bytearray, int, int]:
+    """
+    "#..#" のような文字列 (または bytes) の行のリストを平坦な bytearray のグリッドに変換する
+
+    Returns:
+        grid (bytearray): grid[r * W + c] は r 行 c 列の文字の値
+        H, W (int): 行数と列数
+    """
+    H = len(rows)
+    W = len(rows[0]) if H else 0
+    grid = bytearray()
+    for row in rows:
+        if len(row) != W:
+            raise ValueError("flatten_grid(): all rows must have the same length")
+        grid += row.encode() if isinstance(row, str) else row
+    return grid, H, W
+
+
+def _offsets(W: int, neighborhood: int) -> Tuple[int, ...]:
+    """ 周囲を埋めたグリッド (幅 W+2) における隣接マスへの添字の差 """
+    Wp = W + 2
+    if neighborhood == 4:
+        return (1, -1, Wp, -Wp)
+    if neighborhood == 8:
+        return (1, -1, Wp, -Wp, Wp + 1, Wp - 1, -Wp + 1, -Wp - 1)
+    raise ValueError(f"grid: neighborhood must be 4 or 8, got {neighborhood}")
+
+
+def _padded_passable(grid: Sequence[int], H: int, W: int, is_wall: Optional[Callable[[int], bool]]) -> bytearray:
+    """ 周囲を壁で埋めたグリッドについて、通れるマスを 1, 壁を 0 とした bytearray """
+    if len(grid) != H * W:
+        raise ValueError(f"grid: len(grid) must be H * W = {H * W}, got {len(grid)}")
+    if is_wall is None:
+        passable = b'\x01' * (H * W)
+    elif isinstance(grid, (bytes, bytearray)):
+        passable = grid.translate(bytes(0 if is_wall(c) else 1 for c in range(256)))
+    else:
+        passable = bytes(0 if is_wall(c) else 1 for c in grid)
+    Wp = W + 2
+    pad = bytearray(Wp * (H + 2))
+    for r in range(H):
+        p = (r + 1) * Wp + 1
+        pad[p:p+W] = passable[r*W:(r+1)*W]
+    return pad
+
+
+def _padded_values(values: Sequence, H: int, W: int, fill) -> list:
+    """ values (長さ H*W) の周囲を fill で埋めたリスト """
+    Wp = W + 2
+    pad = [fill] * (Wp * (H + 2))
+    for r in range(H):
+        p = (r + 1) * Wp + 1
+        pad[p:p+W] = values[r*W:(r+1)*W]
+    return pad
+
+
+def _to_padded(i: int, W: int) -> int:
+    return i + W + 3 + 2 * (i // W)
+
+
+def _unpad(pad, H: int, W: int):
+    """ 周囲を埋めたグリッド上の配列から元のグリッドの部分を取り出す (array, list のどちらでもよい) """
+    Wp = W + 2
+    out = pad[:0]
+    for r in range(H):
+        p = (r + 1) * Wp + 1
+        out += pad[p:p+W]
+    return out
+
+
+def _padded_sources(sources: Sequence[int], H: int, W: int, passable: bytearray, name: str) -> List[int]:
+    """ 始点を周囲を埋めたグリッドの添字にする。壁のマスの始点は除く (範囲外なら ValueError) """
+    padded = []
+    for s in sources:
+        if not 0 <= s < H * W:
+            raise ValueError(f"{name}(): source {s} is out of the {H}x{W} grid")
+        p = _to_padded(s, W)
+        if passable[p]:
+            padded.append(p)
+    return padded
+
+
+def _padded_cost(grid: Sequence[int], H: int, W: int, cost: Callable[[int], Num]) -> list:
+    if isinstance(grid, (bytes, bytearray)):
+        table = [cost(c) for c in range(256)]
+        costs = [table[c] for c in grid]
+    else:
+        costs = [cost(c) for c in grid]
+    return _padded_values(costs, H, W, 0)
+
+
+
+def grid_bfs(grid: Sequence[int], H: int, W: int, sources: Sequence[int],
+             is_wall: Optional[Callable[[int], bool]]=None, neighborhood: int=4) -> array:
+    """
+    グリッド上で sources (複数可) からの最短距離 (移動回数) を BFS で O(HW) で求める
+
+    Args:
+        grid (bytearray, array): 長さ H*W の平坦なグリッド
+        sources (list): 始点の添字 r * W + c のリスト (壁のマスは始点としない。グリッドの範囲外なら ValueError)
+        is_wall (function): is_wall(grid[i]) が True となるマスには入れない
+        neighborhood (int): 4 近傍なら 4, 8 近傍なら 8
+    Returns:
+        dist (array): dist[i] は最も近い始点からの距離 (到達不能なマスや壁は -1)
+    """
+    offsets = _offsets(W, neighborhood)
+    passable = _padded_passable(grid, H, W, is_wall)
+    dist = array('i', [-1]) * len(passable)
+    q = []
+    for p in _padded_sources(sources, H, W, passable, 'grid_bfs'):
+        if dist[p] == -1:
+            passable[p] = 0
+            dist[p] = 0
+            q.append(p)
+    for u in q:
+        d = dist[u] + 1
+        for off in offsets:
+            v = u + off
+            if passable[v]:
+                passable[v] = 0
+                dist[v] = d
+                q.append(v)
+    return _unpad(dist, H, W)
+
+
+
+def grid_01bfs(grid: Sequence[int], H: int, W: int, sources: Sequence[int], cost: Callable[[int], int],
+               is_wall: Optional[Callable[[int], bool]]=None, neighborhood: int=4) -> array:
+    """
+    グリッド上で、マス i に入るコストが cost(grid[i]) ∈ {0, 1} である時の sources からの最短コストを 0-1 BFS で O(HW) で求める
+    (例: 壁を壊しながら進む時に壊す回数の最小値は is_wall=None, cost=lambda c: c == ord('#'))
+
+    Returns:
+        dist (array): dist[i] は最も近い始点からの最短コスト (到達不能なマスや壁は -1)
+    """
+    offsets = _offsets(W, neighborhood)
+    passable = _padded_passable(grid, H, W, is_wall)
+    costs = _padded_cost(grid, H, W, cost)
+    if any(c != 0 and c != 1 for c in costs):
+        raise ValueError("grid_01bfs(): cost must return 0 or 1")
+    INF = 1 << 30
+    dist = array('i', [INF]) * len(passable)
+    # 現在のコストのマスと次のコストのマスのリストを交互に処理する (deque の代わり)
+    cur = []
+    for p in _padded_sources(sources, H, W, passable, 'grid_01bfs'):
+        if dist[p] != 0:
+            dist[p] = 0
+            cur.append(p)
+    d = 0
+    while cur:
+        nxt = []
+        for u in cur:
+            if dist[u] != d:
+                continue    # より小さいコストで確定済み
+            passable[u] = 0
+            for off in offsets:
+                v = u + off
+                if passable[v]:
+                    nd = d + costs[v]
+                    if nd < dist[v]:
+                        dist[v] = nd
+                        if nd == d:
+                            cur.append(v)
+                        else:
+                            nxt.append(v)
+        cur = nxt
+        d += 1
+    dist = _unpad(dist, H, W)
+    for i in range(H * W):
+        if dist[i] == INF:
+            dist[i] = -1
+    return dist
+
+
+
+def grid_dijkstra(grid: Sequence[int], H: int, W: int, sources: Sequence[int], cost: Callable[[int], Num],
+                  is_wall: Optional[Callable[[int], bool]]=None, neighborhood: int=4) -> List[Num]:
+    """
+    グリッド上で、マス i に入るコストが cost(grid[i]) (非負) である時の sources からの最短コストを Dijkstra 法で O(HW lg(HW)) で求める
+
+    Returns:
+        cost (list): cost[i] は最も近い始点からの最短コスト (到達不能なマスや壁は inf)
+    """
+    offsets = _offsets(W, neighborhood)
+    passable = _padded_passable(grid, H, W, is_wall)
+    costs = _padded_cost(grid, H, W, cost)
+    if any(c < 0 for c in costs):
+        raise ValueError("grid_dijkstra(): cost must be non-negative")
+    dist = [float('inf')] * len(passable)
+    pq = []
+    for p in _padded_sources(sources, H, W, passable, 'grid_dijkstra'):
+        if dist[p] != 0:
+            dist[p] = 0
+            heappush(pq, (0, p))
+    while pq:
+        d, u = heappop(pq)
+        if d > dist[u]:
+            continue
+        passable[u] = 0    # 確定
+        for off in offsets:
+            v = u + off
+            if passable[v]:
+                nd = d + costs[v]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    heappush(pq, (nd, v))
+    return _unpad(dist, H, W)
+
+
+
+def grid_connected_components(grid: Sequence[int], H: int, W: int, is_wall: Optional[Callable[[int], bool]]=None,
+                              neighborhood: int=4, use_numpy: bool=False) -> Tuple[int, array]:
+    """
+    グリッドの壁でないマスを連結成分に分け、各マスに連結成分の番号を振る O(HW)
+    連結成分の番号は、成分内で添字が最小のマスの添字の昇順に 0, 1, ... と振る (use_numpy によらず同じ結果となる)
+
+    Args:
+        use_numpy (bool): True の場合は NumPy でベクトル化した union-find (hooking + pointer jumping) でラベリングする
+    Returns:
+        count (int): 連結成分の個数
+        label (array): label[i] はマス i の連結成分の番号 (壁は -1)。use_numpy=True の場合は ndarray
+    """
+    offsets = _offsets(W, neighborhood)
+    passable = _padded_passable(grid, H, W, is_wall)
+    if use_numpy:
+        return _grid_connected_components_numpy(passable, H, W, offsets)
+    label = array('i', [-1]) * len(passable)
+    count = 0
+    p = passable.find(1)
+    while p != -1:
+        # 未ラベルの通れるマスのうち添字最小のものから BFS
+        passable[p] = 0
+        label[p] = count
+        q = [p]
+        for u in q:
+            for off in offsets:
+                v = u + off
+                if passable[v]:
+                    passable[v] = 0
+                    label[v] = count
+                    q.append(v)
+        count += 1
+        p = passable.find(1, p)
+    return count, _unpad(label, H, W)
+
+
+def _grid_connected_components_numpy(passable, H, W, offsets):
+    import numpy as np
+    Wp = W + 2
+    P = np.frombuffer(bytes(passable), dtype=np.uint8).astype(bool)
+    cells = np.flatnonzero(P)
+    # 各辺を片方向だけ列挙する (offsets の正のもの)
+    us, vs = [], []
+    for off in offsets:
+        if off > 0:
+            u = cells[P[cells + off]]
+            us.append(u)
+            vs.append(u + off)
+    u = np.concatenate(us) if us else np.empty(0, dtype=np.int64)
+    v = np.concatenate(vs) if vs else np.empty(0, dtype=np.int64)
+    parent = np.arange(len(P))
+    while True:
+        pu, pv = parent[u], parent[v]
+        diff = pu != pv
+        if not diff.any():
+            break
+        # 両端の根が異なる辺だけ残す (同じ木に入った辺は以後も同じ木)
+        u, v, pu, pv = u[diff], v[diff], pu[diff], pv[diff]
+        # 大きい方の根を小さい方の根につなぐ (書き込みが衝突してもどれか一つが残り、添字が減る向きなので閉路はできない)
+        parent[np.maximum(pu, pv)] = np.minimum(pu, pv)
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent = grand
+    roots, inverse = np.unique(parent[cells], return_inverse=True)
+    label = np.full(H * W, -1, dtype=np.int64)
+    label[(cells // Wp - 1) * W + cells % Wp - 1] = inverse.reshape(-1)
+    return len(roots), label
+
+
+
+
+
+
+if __name__ == "__main__":
+    rows = ["S..#....",
+            ".#.#.##.",
+            ".#...#..",
+            ".####.#.",
+            "......#G"]
+    grid, H, W = flatten_grid(rows)
+    S, G = grid.index(b'S'), grid.index(b'G')
+    wall = lambda c: c == ord('#')
+
+    dist = grid_bfs(grid, H, W, [S], wall)
+    assert(dist[G] == 15)
+    assert(dist[3] == -1)    # 壁
+    assert(grid_bfs(grid, H, W, [S], wall, neighborhood=8)[G] == 8)
+    # 壁を壊す回数の最小値
+    broken = grid_01bfs(grid, H, W, [S], lambda c: c == ord('#'))
+    assert(broken[G] == 0 and broken[3] == 1 and broken[3 * W + 3] == 1)
+    # 数字のマスに入るのにその数字だけかかる
+    digits, h, w = flatten_grid(["1911",
+                                 "1919",
+                                 "1119"])
+    cost = grid_dijkstra(digits, h, w, [0], lambda c: c - ord('0'))
+    assert(cost[h * w - 1] == 4 + 9)
+    assert(cost[3] == 7)    # 9 のマスを避けて回り込む
+
+    islands, h, w = flatten_grid(["##..#",
+                                  "#..##",
+                                  "...#.",
+                                  "#.#.#"])
+    # '#' の島を数える ('.' を壁とみなす)
+    sea = lambda c: c == ord('.')
+    count, label = grid_connected_components(islands, h, w, is_wall=sea)
+    assert(count == 5)
+    assert(list(label[:5]) == [0, 0, -1, -1, 1])
+    count, label_np = grid_connected_components(islands, h, w, is_wall=sea, use_numpy=True)
+    assert(count == 5 and label_np.tolist() == list(label))
+    assert(grid_connected_components(islands, h, w, is_wall=sea, neighborhood=8)[0] == 3)
+    # 壁のマスは始点とならない
+    assert(grid_bfs(grid, H, W, [3], wall) == array('i', [-1]) * (H * W))
+    print(" * assertion test ok * ")
+
+    # ベンチマーク: 1000×1000 のランダムな迷路 (壁 30%)
+    import time
+    from random import random
+    N = 1000
+    maze = bytearray(35 if random() < 0.3 else 46 for _ in range(N * N))    # '#', '.'
+    # 始点は最大の連結成分 (ほぼ全ての通れるマスを含む) のマスとする
+    count, label = grid_connected_components(maze, N, N, is_wall=wall)
+    sizes = [0] * count
+    for k in label:
+        if k != -1:
+            sizes[k] += 1
+    start = label.index(sizes.index(max(sizes)))
+    t0 = time.perf_counter()
+    dist = grid_bfs(maze, N, N, [start], is_wall=wall)
+    t1 = time.perf_counter()
+    grid_connected_components(maze, N, N, is_wall=wall)
+    t2 = time.perf_counter()
+    grid_connected_components(maze, N, N, is_wall=wall, use_numpy=True)
+    t3 = time.perf_counter()
+    reached = sum(1 for d in dist if d != -1)
+    print(f"1000x1000: bfs {t1 - t0:.2f} sec ({reached} cells reached), labelling {t2 - t1:.2f} sec (numpy: {t3 - t2:.2f} sec)")
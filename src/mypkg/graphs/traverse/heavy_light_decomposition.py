@@ -0,0 +1,215 @@
+"""
+(参考) Sleator, Tarjan "A data structure for dynamic trees" (heavy path の概念)
+HL 分解 (heavy-light decomposition) による木のパスクエリ (前処理 O(n), パスの分解 O(lgn))
+
+木の頂点を一列に並べ、任意の u-v パスを O(lgn) 個の連続区間に、任意の部分木を 1 個の連続区間に対応させる。
+列に対するセグメント木と組み合わせると、パス上・部分木内の頂点の値の総和や最大値を O(lg^2 n) で求められる。
+
+
+<algorithm>
+各頂点 u について、部分木のサイズが最大の子を heavy な子とし、u から heavy な子への辺を heavy edge, それ以外を light edge とする。
+heavy edge のみを辿ってできるパス (heavy path) で木を分解する。
+    - light edge を下ると部分木のサイズが半分以下になるので、根から任意の頂点へのパスが通る light edge は高々 lgn 本
+      よって任意のパスは O(lgn) 本の heavy path の一部に分解できる
+    - DFS の行きがけ順で頂点に番号 pos をふる際、heavy な子を最初に訪れると、各 heavy path は pos の連続区間となる
+      (行きがけ順なので、部分木 u も区間 [pos[u], pos[u] + size[u]) となる)
+    - u-v パスは、head[u] (u の属する heavy path の最も浅い頂点) が深い方を head の親へ持ち上げることを
+      両者が同じ heavy path に乗るまで繰り返して区間に分解する
+
+構築は再帰を用いず、stack による行きがけ順 -> その逆順で部分木のサイズと heavy な子 -> heavy な子を最後に積む stack で pos をふる、の順で行う。
+
+HLDSegTree は頂点の値を pos の順にならべた segment_tree_template.SegTree を持ち、path_query, path_update, subtree_query を提供する。
+(このリポジトリには遅延伝播セグメント木がないため、path_update はパス上の各頂点を一点更新する O(パス長 lgn) の実装である)
+"""
+
+
+from array import array
+from typing import Sequence, List, Tuple, Callable, Any
+from ...advanced_data_structures.segment_tree.segment_tree_template import SegTree
+
+
+
+class HeavyLightDecomposition:
+    """
+    HL 分解された根付き木
+
+    Attributes:
+        size (int): 頂点数
+        root (int): 根のインデックス
+        parent (array): parent[u] は u の親 (根は -1)
+        depth (array): depth[u] は根からの深さ
+        subtree_size (array): subtree_size[u] は u の部分木の頂点数
+        heavy (array): heavy[u] は u の heavy な子 (葉は -1)
+        head (array): head[u] は u の属する heavy path の最も浅い頂点
+        pos (array): pos[u] は u の列上の位置 (heavy な子を優先した行きがけ順)
+        order (array): order[i] は列上の位置が i の頂点 (pos の逆写像)
+    """
+    def __init__(self, adj: Sequence[Sequence[int]], root: int):
+        self.size = n = len(adj)
+        self.root = root
+        parent = self.parent = array('i', [-1]) * n
+        depth = self.depth = array('i', bytes(4 * n))
+        # 行きがけ順と親、深さ
+        preorder = []
+        parent[root] = root
+        stack = [root]
+        while stack:
+            u = stack.pop()
+            preorder.append(u)
+            for v in adj[u]:
+                if parent[v] == -1:
+                    parent[v] = u
+                    depth[v] = depth[u] + 1
+                    stack.append(v)
+        parent[root] = -1
+        # 帰りがけ順 (行きがけ順の逆順) で部分木のサイズと heavy な子
+        subtree_size = self.subtree_size = array('i', [1]) * n
+        heavy = self.heavy = array('i', [-1]) * n
+        for u in reversed(preorder):
+            p = parent[u]
+            if p != -1:
+                subtree_size[p] += subtree_size[u]
+                if heavy[p] == -1 or subtree_size[heavy[p]] < subtree_size[u]:
+                    heavy[p] = u
+        # heavy な子を最後に積んで最初に訪れるようにし、pos をふる
+        head = self.head = array('i', bytes(4 * n))
+        pos = self.pos = array('i', bytes(4 * n))
+        order = self.order = array('i', bytes(4 * n))
+        head[root] = root
+        stack = [root]
+        t = 0
+        while stack:
+            u = stack.pop()
+            pos[u] = t
+            order[t] = u
+            t += 1
+            h = heavy[u]
+            for v in adj[u]:
+                if v != parent[u] and v != h:
+                    head[v] = v
+                    stack.append(v)
+            if h != -1:
+                head[h] = head[u]
+                stack.append(h)
+
+    def calc_LCA(self, u: int, v: int) -> int:
+        """ O(lgn) で u, v の最小共通祖先を求める """
+        head, pos, parent = self.head, self.pos, self.parent
+        while head[u] != head[v]:
+            if pos[head[u]] > pos[head[v]]:
+                u = parent[head[u]]
+            else:
+                v = parent[head[v]]
+        return u if pos[u] < pos[v] else v
+
+    def path_ranges(self, u: int, v: int, edge: bool=False) -> List[Tuple[int, int]]:
+        """
+        u-v パス上の頂点に対応する列上の区間 [l, r) のリストを O(lgn) で求める
+
+        Args:
+            u, v (int)
+            edge (bool): True の場合、LCA を除く (辺の値を子の頂点に持たせている場合に、パス上の辺に対応する区間となる)
+        Returns:
+            ranges (list): 区間 (l, r) のリスト。区間の順序は不定である
+        """
+        head, pos, parent = self.head, self.pos, self.parent
+        ranges = []
+        while head[u] != head[v]:
+            if pos[head[u]] < pos[head[v]]:
+                u, v = v, u
+            ranges.append((pos[head[u]], pos[u] + 1))
+            u = parent[head[u]]
+        l, r = pos[u], pos[v]
+        if l > r:
+            l, r = r, l
+        if edge:
+            l += 1
+        if l <= r:
+            ranges.append((l, r + 1))
+        return ranges
+
+    def subtree_range(self, u: int) -> Tuple[int, int]:
+        """ u の部分木に対応する列上の区間 [l, r) を返す """
+        return self.pos[u], self.pos[u] + self.subtree_size[u]
+
+
+
+class HLDSegTree(HeavyLightDecomposition):
+    """
+    頂点に値を持つ HL 分解された根付き木。値は列上の位置の順に SegTree で管理する
+    func は結合的かつ可換な演算とする (SegTree.query の結合順序および、パスの区間の順序が不定であるため)
+
+    Attributes:
+        seg (SegTree): seg の a_(pos[u]+1) が頂点 u の値
+    """
+    def __init__(self, adj: Sequence[Sequence[int]], root: int, values: Sequence[Any], identity: Any, func: Callable[[Any, Any], Any]):
+        super().__init__(adj, root)
+        self.identity = identity
+        self.func = func
+        self.seg = SegTree(self.size, identity, func)
+        self.seg.build([values[u] for u in self.order])
+
+    def get(self, u: int) -> Any:
+        """ 頂点 u の値を返す """
+        return self.seg.table[self.seg.n0 + self.pos[u]]
+
+    def update(self, u: int, x: Any) -> None:
+        """ O(lgn) で頂点 u の値を x にする """
+        self.seg.update(self.pos[u] + 1, x)
+
+    def path_query(self, u: int, v: int, edge: bool=False) -> Any:
+        """ O(lg^2 n) で u-v パス上の頂点の値を func で畳み込んだ値を求める (edge=True の場合 LCA を除く) """
+        ans = self.identity
+        for l, r in self.path_ranges(u, v, edge):
+            ans = self.func(ans, self.seg.query(l + 1, r))
+        return ans
+
+    def path_update(self, u: int, v: int, x: Any, edge: bool=False) -> None:
+        """ u-v パス上の頂点の値を全て x にする (edge=True の場合 LCA を除く)。O(パス長 lgn) """
+        for l, r in self.path_ranges(u, v, edge):
+            for i in range(l + 1, r + 1):
+                self.seg.update(i, x)
+
+    def subtree_query(self, u: int) -> Any:
+        """ O(lgn) で u の部分木内の頂点の値を func で畳み込んだ値を求める """
+        l, r = self.subtree_range(u)
+        return self.seg.query(l + 1, r)
+
+
+
+
+if __name__ == "__main__":
+    """
+              0
+          1       2
+        3   4       5
+       6   7 8
+    という木を想定する。
+    """
+    n = 9
+    adj = [[] for _ in range(n)]
+    for p, c in ((0, 1), (0, 2), (1, 3), (1, 4), (2, 5), (3, 6), (4, 7), (4, 8)):
+        adj[p].append(c)
+        adj[c].append(p)
+    hld = HeavyLightDecomposition(adj, 0)
+    assert(hld.calc_LCA(6, 8) == 1)
+    assert(hld.calc_LCA(7, 5) == 0)
+    assert(hld.calc_LCA(4, 8) == 4)
+    # パスの区間の頂点数の総和はパスの頂点数と一致する
+    assert(sum(r - l for l, r in hld.path_ranges(6, 5)) == 6)
+    assert(sum(r - l for l, r in hld.path_ranges(6, 5, edge=True)) == 5)
+    assert(sorted(hld.order[i] for i in range(*hld.subtree_range(1))) == [1, 3, 4, 6, 7, 8])
+
+    values = [10, 1, 2, 3, 4, 5, 6, 7, 8]
+    import operator as op
+    path_sum = HLDSegTree(adj, 0, values, 0, op.add)
+    assert(path_sum.path_query(6, 5) == 6 + 3 + 1 + 10 + 2 + 5)
+    assert(path_sum.path_query(7, 8) == 7 + 4 + 8)
+    assert(path_sum.subtree_query(1) == 1 + 3 + 4 + 6 + 7 + 8)
+    path_sum.path_update(7, 2, 0)    # 7, 4, 1, 0, 2 の値を 0 にする
+    assert(path_sum.subtree_query(0) == 3 + 5 + 6 + 8)
+    path_max = HLDSegTree(adj, 0, values, float('-inf'), max)
+    assert(path_max.path_query(6, 8) == 8)
+    assert(path_max.path_query(6, 8, edge=True) == 8)
+    assert(path_max.path_query(3, 1, edge=True) == 3)
+    print(" * assertion test ok * ")
@@ -10,6 +10,7 @@ LCA を求めるノードのペア u, v とする (dist(u) >= dist (v)) とす
 |dist(u)-dist(v)| だけ u は親を遡ることにより dist(u1) = dist(v) なる u1 を発見可能。v はそのままでこれを v1 とする。
 u1, v1 の ancestors を見るとあるところまでは不一致だがあるところから一致するはずである (branch は合流するので)。不一致しているところまで遡る。
 u2, v2 についても同様に処理を行う。ancestors[0] が一致してしまうような u, v になった場合その親が最小共通祖先である。
+(level の大きい順に「2^level 個先の祖先が一致しなければ両方遡る」を一度ずつ行えば、この処理は O(lgn) で済む)
 
 
 verified @ABC014D
@@ -17,105 +18,7 @@ verified @ABC014D
 
 
 
-from collections import deque
-from typing import Sequence, List
-
-
-class DoublingTree:
-    """
-    ダブリングにより 2^k 個先の祖先の情報を獲得した根付き木
-
-    Attributes:
-        adj (list): 隣接リスト
-        size (int): 頂点数
-        root (int): 根のインデックス
-        children (list): children[i] = (頂点 i の子のインデックスのリスト)
-        ancestors (list): ancestors[i][level] = (頂点 i の 2^level 個先の祖先). level は 0 から lgN - 1 まで存在し、そのような祖先が存在しない場合 -1 が入る
-    """
-    def __init__(self, adj: Sequence[Sequence[int]], root: int):
-        self.adj = adj
-        self.size = len(adj)
-        self.root = root
-        self.children = [[] for _ in range(self.size)]
-        self.ancestors = [[-1] * self.size.bit_length() for _ in range(self.size)]
-        self.dist_from_root = [-1] * self.size
-        self._build_rooted_tree()
-        self._doubling_ancestors()
-    
-    def _build_rooted_tree(self) -> None:
-        """
-        O(N) で隣接リストと根をもとに self.children および self.ancestors の親のスロットを記載する
-        self.dist_from_root を記録する
-        """
-        q = deque()
-        q.append((self.root, 0))
-        while q:
-            u, dist = q.popleft()
-            if self.dist_from_root[u] < 0:
-                self.dist_from_root[u] = dist
-                for v in self.adj[u]:
-                    if self.dist_from_root[v] < 0:
-                        self.children[u].append(v)
-                        self.ancestors[v][0] = u
-                        q.append((v, dist+1))
-    
-    def _doubling_ancestors(self) -> None:
-        """
-        O(NlgN) で各ノードの self.ancestors[i][level] のスロットを記載する。
-        なお、_build_rooted_tree() により self.ancestors[i][0] は登記済みであるとする。
-        """
-        for level in range(1, self.size.bit_length()):
-            for i in range(self.size):
-                if self.ancestors[i][level-1] >= 0:
-                    self.ancestors[i][level] = self.ancestors[self.ancestors[i][level-1]][level-1]
-
-    def kth_ancestor(self, i: int, k: int) -> int:
-        """
-        O(lgk) でノード i の k 個先の祖先のノード番号を求める (k = 0 の場合自身 i となる)
-        そのような祖先がいない場合 -1 を返す
-        """
-        if k >= self.size:
-            raise ValueError(f"DoublingTree.kth_ancestor(): k shoule be lt num of vertices. got i: {i}, k: {k} (tree size = {self.size})")
-        node_ind = i
-        flag_bit = 1
-        for level in range(k.bit_length()):
-            if node_ind < 0:
-                break
-            if k & flag_bit:
-                node_ind = self.ancestors[node_ind][level]
-            flag_bit <<= 1
-        return node_ind
-
-
-
-    def calc_LCA(self, u: int, v: int) -> int:
-        """
-        2 つの node を受け取り、その最小共通祖先を求める。(O(lgn))
-        なお、各ノードのルートからの距離と k 祖先は計算ずみであるとする。
-        Args:
-            u, v (int)
-        Returns:
-            lca (int)
-        """
-        # u は v と同じ深さかより深いノードとする
-        if self.dist_from_root[u] < self.dist_from_root[v]:
-            u, v = v, u
-        diff = self.dist_from_root[u] - self.dist_from_root[v]
-        u1 = self.kth_ancestor(u, diff)
-        v1 = v
-        # そもそも同じ枝に乗っていた場合、深さを合わせるだけで一致する
-        if u1 == v1:
-            return u1
-        # 別の枝に乗っていた場合
-        while self.ancestors[u1][0] != self.ancestors[v1][0]:
-            for level in range(self.size.bit_length()):
-                if self.ancestors[u1][level] == self.ancestors[v1][level]:
-                    # 合流せず遡れるギリギリまで遡る。
-                    # u1, v1 の深さはそろっているため同じレベルで両方初めて -1 を引くことになる。ancestors[u1][level-1] が -1 となることはない
-                    u1 = self.ancestors[u1][level-1]
-                    v1 = self.ancestors[v1][level-1]
-                    break
-        return self.ancestors[u1][0]
+from .doubling_ancestor import DoublingTree    # ダブリングと calc_LCA() の実装は doubling_ancestor.py にまとめている
 
 
 
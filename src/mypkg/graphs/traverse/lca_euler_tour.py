@@ -0,0 +1,237 @@
+"""
+(参考) Bender, Farach-Colton "The LCA Problem Revisited", <Algorithm Introduction vol.2 p.187-188 (Tarjan のオフライン最小共通祖先)>
+最小共通祖先 (least common ancestor, LCA) を求める
+    - EulerTourLCA: オイラーツアー + sparse table による LCA (前処理 O(nlgn), 各クエリに対し O(1))
+    - offline_lca: Tarjan のオフライン LCA (q 個のクエリをまとめて O((n+q)α(n)))
+
+lca_doubling.DoublingTree がクエリごとに O(lgn) かかるのに対し、大量のクエリに向く。
+いずれも再帰を用いず、頂点数分の情報は array('i') で持つ。
+
+
+<algorithm>
+EulerTourLCA
+木の DFS で頂点を訪れる順 (オイラーツアー) の上で、u から v までの区間で最も浅い頂点が LCA である (区間最小値クエリに帰着)。
+ここでは長さ 2n-1 のオイラーツアーの代わりに、長さ n の行きがけ順 (preorder) を用いてメモリを半分にしている。
+    - pre[u] < pre[v] のとき、行きがけ順の区間 (pre[u], pre[v]] の頂点は全て LCA の部分木に属し (LCA 自身は除く)、
+      その中に LCA の子で v の祖先であるものが含まれる。
+    - したがって区間 (pre[u], pre[v]] の各頂点 w について pre[parent[w]] の最小値をとると pre[LCA] となる (u が v の祖先の場合も同様)
+区間最小値は sparse table で求める。table[k][i] = min(key[i], ..., key[i + 2^k - 1]) とすれば、
+長さ len の区間は 2^k <= len < 2^(k+1) なる k について重なりを許す 2 区間 table[k][l], table[k][r - 2^k] の min で O(1) で求まる。
+各段は一つ前の段から内包表記で一度に作る。
+
+offline_lca (Tarjan)
+DFS の帰りがけに、子の集合を親の集合に Union-Find で併合し、併合後の集合の代表 ancestor を親とする。
+頂点 u の処理が終わったとき、クエリ (u, v) について v の処理が既に終わっていれば、v の属する集合の ancestor が LCA である。
+(v を含む集合は、根から u へのパス上で v の処理が終わった時点で DFS 中だった最も深い頂点を ancestor に持つため)
+"""
+
+
+from array import array
+from typing import Sequence, List, Tuple
+
+
+
+def _preorder(adj: Sequence[Sequence[int]], root: int) -> Tuple[array, array]:
+    """ 明示的な stack で木の行きがけ順と親を求める。根の親は -1 """
+    n = len(adj)
+    parent = array('i', [-1]) * n
+    order = array('i')
+    parent[root] = root
+    stack = [root]
+    while stack:
+        u = stack.pop()
+        order.append(u)
+        for v in adj[u]:
+            if parent[v] == -1:
+                parent[v] = u
+                stack.append(v)
+    parent[root] = -1
+    return order, parent
+
+
+
+class EulerTourLCA:
+    """
+    オイラーツアー (行きがけ順) + sparse table により、前処理 O(nlgn), 各クエリ O(1) で LCA を求める根付き木
+
+    Attributes:
+        size (int): 頂点数
+        root (int): 根のインデックス
+        order (array): order[i] は行きがけ順で i 番目の頂点
+        pre (array): pre[u] は頂点 u の行きがけ順
+        parent (array): parent[u] は頂点 u の親 (根は -1)
+        table (list): table[k][i] は行きがけ順の区間 [i, i + 2^k) の頂点 w についての pre[parent[w]] の最小値
+    """
+    def __init__(self, adj: Sequence[Sequence[int]], root: int):
+        self.size = n = len(adj)
+        self.root = root
+        self.order, self.parent = _preorder(adj, root)
+        self.pre = pre = array('i', bytes(4 * n))
+        for i, u in enumerate(self.order):
+            pre[u] = i
+        parent = self.parent
+        key = array('i', [pre[parent[u]] if u != root else -1 for u in self.order])
+        self.table = [key]
+        half = 1
+        while 2 * half <= n:
+            prev = self.table[-1]
+            self.table.append(array('i', [a if a < b else b for a, b in zip(prev, prev[half:])]))
+            half *= 2
+
+    def calc_LCA(self, u: int, v: int) -> int:
+        """ 2 つの node u, v の最小共通祖先を O(1) で求める """
+        if u == v:
+            return u
+        l, r = self.pre[u], self.pre[v]
+        if l > r:
+            l, r = r, l
+        # 区間 [l+1, r+1) の最小値
+        k = (r - l).bit_length() - 1
+        row = self.table[k]
+        a, b = row[l+1], row[r+1-(1<<k)]
+        return self.order[a if a < b else b]
+
+    def calc_LCA_batch(self, us: Sequence[int], vs: Sequence[int]) -> List[int]:
+        """ クエリ (us[i], vs[i]) それぞれの最小共通祖先のリストを返す """
+        pre, order, table = self.pre, self.order, self.table
+        res = []
+        for u, v in zip(us, vs):
+            if u == v:
+                res.append(u)
+                continue
+            l, r = pre[u], pre[v]
+            if l > r:
+                l, r = r, l
+            k = (r - l).bit_length() - 1
+            row = table[k]
+            a, b = row[l+1], row[r+1-(1<<k)]
+            res.append(order[a if a < b else b])
+        return res
+
+
+
+def offline_lca(adj: Sequence[Sequence[int]], root: int, queries: Sequence[Tuple[int, int]]) -> List[int]:
+    """
+    Tarjan のオフライン LCA により、queries の各 (u, v) の最小共通祖先を O((n+q)α(n)) でまとめて求める
+
+    Args:
+        adj (list): 木の隣接リスト
+        root (int): 根のインデックス
+        queries (list): (u, v) のタプルの列
+    Returns:
+        lca (list): lca[i] は queries[i] の最小共通祖先
+    """
+    n = len(adj)
+    q = len(queries)
+    # クエリを両端の頂点ごとに CSR 形式で並べる。頂点 u のクエリは (query_to[k], query_ind[k]) for k in range(head[u], head[u+1])
+    head = array('i', bytes(4 * (n + 1)))
+    for u, v in queries:
+        head[u+1] += 1
+        head[v+1] += 1
+    for u in range(n):
+        head[u+1] += head[u]
+    pos = head[:-1]
+    query_to = array('i', bytes(8 * q))
+    query_ind = array('i', bytes(8 * q))
+    for i, (u, v) in enumerate(queries):
+        query_to[pos[u]] = v
+        query_ind[pos[u]] = i
+        pos[u] += 1
+        query_to[pos[v]] = u
+        query_ind[pos[v]] = i
+        pos[v] += 1
+
+    uf = array('i', range(n))    # Union-Find の親
+    size = array('i', [1]) * n
+    ancestor = array('i', range(n))    # ancestor[r] は代表 r の集合に対応する DFS 中の頂点
+    done = bytearray(n)    # 帰りがけの処理が終わったか
+    visited = bytearray(n)
+    it = array('i', bytes(4 * n))
+    lca = [-1] * q
+
+    def find(x: int) -> int:
+        # path halving による経路圧縮
+        while uf[x] != x:
+            uf[x] = uf[uf[x]]
+            x = uf[x]
+        return x
+
+    visited[root] = 1
+    stack = [root]
+    while stack:
+        u = stack[-1]
+        adj_u = adj[u]
+        if it[u] < len(adj_u):
+            v = adj_u[it[u]]
+            it[u] += 1
+            if not visited[v]:
+                visited[v] = 1
+                stack.append(v)
+            continue
+        # u の帰りがけ
+        stack.pop()
+        done[u] = 1
+        for k in range(head[u], head[u+1]):
+            v = query_to[k]
+            if done[v]:
+                lca[query_ind[k]] = ancestor[find(v)]
+        if stack:
+            # u の集合を親 p の集合に併合する
+            p = stack[-1]
+            a, b = find(p), find(u)
+            if size[a] < size[b]:
+                a, b = b, a
+            uf[b] = a
+            size[a] += size[b]
+            ancestor[a] = p
+    return lca
+
+
+
+
+if __name__ == "__main__":
+    """
+                        0
+            1                        2
+        3    4   5                   6
+      7   8      9           10   11    12    13
+    14 15     16   17      18 19  20    21   22 23
+    24 25         26 27    28          29 30 31 32
+    という木を想定する。(lca_doubling.py と同じ)
+    """
+    n = 33
+    adj = [[] for _ in range(n)]
+    parent_child_ind_list = ((0, 1), (0, 2), (1, 3), (1, 4), (1, 5), (2, 6), (3, 7), (3, 8), (5, 9), (6, 10), (6, 11), (6, 12), (6, 13),
+                            (7, 14), (7, 15), (9, 16), (9, 17), (10, 18), (10, 19), (11, 20), (12, 21), (13, 22), (13, 23),
+                            (14, 24), (15, 25), (17, 26), (17, 27), (18, 28), (21, 29), (21, 30), (22, 31), (23, 32))
+    for p, c in parent_child_ind_list:
+        adj[p].append(c)
+        adj[c].append(p)
+
+    queries = [(0, 1), (0, 30), (1, 3), (1, 2), (4, 5), (18, 20), (31, 32), (3, 10), (4, 8), (14, 16), (10, 21), (25, 25)]
+    expected = [0, 0, 1, 0, 1, 6, 13, 0, 1, 1, 6, 25]
+    tree = EulerTourLCA(adj, 0)
+    assert([tree.calc_LCA(u, v) for u, v in queries] == expected)
+    assert(tree.calc_LCA_batch(*zip(*queries)) == expected)
+    assert(offline_lca(adj, 0, queries) == expected)
+    print(" * assertion test ok * ")
+
+    # ベンチマーク: 頂点数 10^6 のランダムな木と 10^6 個のクエリ
+    import time
+    from random import randrange
+    N = Q = 10**6
+    adj = [[] for _ in range(N)]
+    for v in range(1, N):
+        p = randrange(max(0, v - 10), v)    # 深い木になるように親を近くから選ぶ
+        adj[p].append(v)
+        adj[v].append(p)
+    queries = [(randrange(N), randrange(N)) for _ in range(Q)]
+    t0 = time.perf_counter()
+    tree = EulerTourLCA(adj, 0)
+    t1 = time.perf_counter()
+    res_sparse = tree.calc_LCA_batch(*zip(*queries))
+    t2 = time.perf_counter()
+    res_tarjan = offline_lca(adj, 0, queries)
+    t3 = time.perf_counter()
+    assert(res_sparse == res_tarjan)
+    print(f"N = Q = 10^6: sparse table build {t1 - t0:.2f} sec, query {t2 - t1:.2f} sec / Tarjan offline {t3 - t2:.2f} sec")
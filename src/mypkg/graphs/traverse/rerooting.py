@@ -0,0 +1,142 @@
+"""
+(参考) 全方位木 DP (rerooting)
+木の全ての頂点について、その頂点を根とした時の木 DP の値を O(n) でまとめて求める
+(頂点ごとに根を変えて DFS をし直すと O(n^2) かかる)
+
+木 DP は次の 3 つで定める
+    - merge(a, b): 子の部分木たちの値をまとめる結合的かつ可換な演算
+    - identity: merge の単位元 (子がない場合の値)
+    - add_root(x, v): 子の部分木たちをまとめた値 x に頂点 v を根として加え、v を根とする部分木の値とする
+すなわち dp(v を根とする部分木) = add_root(merge(dp(子 c_1), dp(子 c_2), ...), v)
+例: 各頂点の離心率 (最遠点までの距離) は merge=max, identity=0, add_root=lambda x, v: x + 1 とすると (値) - 1 となる
+
+
+<algorithm>
+1. 適当な根 root から BFS 順を求め、その逆順に通常の木 DP を行い down[v] (v を根とする部分木の値) を求める
+2. BFS 順に、各頂点 v について「親側の部分木を v の下にぶら下げた時の値」up[v] を求める
+   v の隣接頂点の値の列 [up[v], down[c_1], ..., down[c_k]] について、子 c_i を除いた merge は
+   prefix[i] (c_1 ... c_(i-1) の merge) と suffix[i+1] (c_(i+1) ... c_k の merge) と up[v] の merge で求まる
+   (merge に逆元を要求しないよう、左右からの累積を用いる)
+   これに v を加えた add_root(..., v) が up[c_i] となる
+3. v を根とした時の値は add_root(merge(up[v], down[c_1], ..., down[c_k]), v)
+各辺について merge, add_root を定数回呼ぶので全体で O(n)
+"""
+
+
+from typing import Sequence, List, Callable, Any
+
+
+
+def rerooting(adj: Sequence[Sequence[int]], merge: Callable[[Any, Any], Any], identity: Any,
+              add_root: Callable[[Any, int], Any], root: int=0) -> List[Any]:
+    """
+    全方位木 DP により、全ての頂点 v について v を根とした時の木 DP の値を O(n) で求める
+
+    Args:
+        adj (list): 木の隣接リスト
+        merge (function): 子の部分木たちの値をまとめる結合的かつ可換な二項演算
+        identity (object): merge の単位元
+        add_root (function): add_root(x, v) は子の部分木たちをまとめた値 x に頂点 v を根として加えた値
+        root (int): 最初の木 DP を行う際の根 (結果には影響しない)
+    Returns:
+        ans (list): ans[v] は v を根とした時の木全体の値
+    """
+    n = len(adj)
+    if n == 0:
+        return []
+    # BFS 順と親。u の子は order[child_begin[u]:child_end[u]] に連続して並ぶ
+    parent = [-1] * n
+    parent[root] = root
+    order = [root]
+    child_begin = [0] * n
+    child_end = [0] * n
+    for u in order:
+        child_begin[u] = len(order)
+        for v in adj[u]:
+            if parent[v] == -1:
+                parent[v] = u
+                order.append(v)
+        child_end[u] = len(order)
+    parent[root] = -1
+    # 1. BFS 順の逆順 (子が親より先に来る) に通常の木 DP
+    acc = [identity] * n
+    down = [identity] * n
+    for v in reversed(order):
+        down[v] = add_root(acc[v], v)
+        p = parent[v]
+        if p != -1:
+            acc[p] = merge(acc[p], down[v])
+    # 2. BFS 順 (親が子より先に来る) に親側の部分木の値 up を求め、3. 答えを求める
+    up = [identity] * n    # up[root] は親側の部分木が空なので単位元
+    ans = [identity] * n
+    for v in order:
+        children = order[child_begin[v]:child_end[v]]
+        k = len(children)
+        if k == 0:
+            ans[v] = add_root(up[v], v)
+            continue
+        # suffix[i] は children[i:] の down の merge
+        suffix = [identity] * (k + 1)
+        for i in range(k - 1, -1, -1):
+            suffix[i] = merge(down[children[i]], suffix[i+1])
+        prefix = up[v]    # up[v] と children[:i] の down の merge
+        for i, c in enumerate(children):
+            up[c] = add_root(merge(prefix, suffix[i+1]), v)
+            prefix = merge(prefix, down[c])
+        ans[v] = add_root(prefix, v)
+    return ans
+
+
+
+
+if __name__ == "__main__":
+    """
+                0
+        1               2
+    3               4   5   6
+     7             8 9     10
+      11          12  13
+                        14
+    という木を仮定する。(diameter_of_trees.py と同じ)
+    """
+    adjacent_list = ((1, 2),
+                     (0, 3),
+                     (0, 4, 5, 6),
+                     (1, 7),
+                     (2, 8, 9),
+                     (2,),
+                     (2, 10),
+                     (3, 11),
+                     (4, 12),
+                     (4, 13),
+                     (6,),
+                     (7,),
+                     (8,),
+                     (9, 14),
+                     (13,))
+    n = len(adjacent_list)
+    # 離心率: 部分木の値を「根から最も深い頂点までのパスの頂点数」とする
+    ecc = [x - 1 for x in rerooting(adjacent_list, max, 0, lambda x, v: x + 1)]
+    assert(ecc == [5, 6, 5, 7, 6, 6, 6, 8, 7, 7, 7, 9, 8, 8, 9])
+    assert(max(ecc) == 9)    # 直径
+    # 全頂点への距離の総和: 部分木の値を (頂点数, 部分木の根の親から部分木内の各頂点への距離の総和) とする
+    dist_sum = rerooting(adjacent_list, lambda a, b: (a[0] + b[0], a[1] + b[1]), (0, 0),
+                         lambda x, v: (x[0] + 1, x[1] + x[0] + 1))
+    dist_sum = [d - n for _, d in dist_sum]
+    assert(dist_sum[0] == 1 + 1 + 2 + 2 + 2 + 2 + 3 + 3 + 3 + 3 + 4 + 4 + 4 + 5)
+    assert(dist_sum[2] == min(dist_sum))    # 重心 (距離の総和が最小となる頂点)
+    print(" * assertion test ok * ")
+
+    # ベンチマーク: 頂点数 10^6 のランダムな木の全頂点の離心率
+    import time
+    from random import randrange
+    N = 10**6
+    adj = [[] for _ in range(N)]
+    for v in range(1, N):
+        p = randrange(v)
+        adj[p].append(v)
+        adj[v].append(p)
+    t0 = time.perf_counter()
+    ecc = rerooting(adj, max, 0, lambda x, v: x + 1)
+    t1 = time.perf_counter()
+    print(f"N = 10^6: eccentricities in {t1 - t0:.2f} sec")
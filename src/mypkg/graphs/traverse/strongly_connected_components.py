@@ -8,8 +8,19 @@
 
 
 <algorithm>
+(Kosaraju) scc()
 DFS(G) を行い、帰りがけの順の順序をメモ
 その降順をもとに DFS(transpose(G)) を行う。各 DFS が停止するごとに強連結成分が生成される。生成される順は DAG のトポロジカル順となる。
+
+(Tarjan) tarjan_scc()
+逆辺のグラフを必要とせず、DFS 一回で強連結成分分解を行う。
+DFS の行きがけ順 order[u] と、u の部分木から (後退辺・横断辺を一本まで使って) 到達できるスタック上の頂点の order の最小値 lowlink[u] を求める。
+訪問した頂点はスタックに積んでおき、帰りがけに lowlink[u] == order[u] となった頂点 u が強連結成分の根である。
+このときスタックの u より上に積まれた頂点が u の強連結成分となるのでまとめて取り除く。
+成分は DAG の逆トポロジカル順 (sink から) に確定するので、最後に番号を反転してトポロジカル順にする。
+
+condensation() は DAG の辺を重複を除いて CSR 形式 (head, dag) で作る。頂点をグループ番号でバケットソートしておき、
+グループごとにその頂点の出辺を走査して、同じ行き先グループが既に追加されていれば (mark[h] == g) 飛ばす。
 """
 
 
@@ -32,31 +43,42 @@ def scc(graph: Sequence[Sequence[int]], rgraph: Sequence[Sequence[int]]) -> Tupl
     n = len(graph)
     order = []
     visited = [False] * n
-    def dfs(current=0):
-        visited[current] = True
-        for v in graph[current]:
-            if not visited[v]:
-                dfs(v)
-        order.append(current)
-    vertex_to_group_num = [0] * n
-    def rdfs(u, group_num):
-        visited[u] = True
-        vertex_to_group_num[u] = group_num
-        for v in rgraph[u]:
-            if not visited[v]:
-                rdfs(v, group_num)
+    it = [0] * n    # it[u] は graph[u] のうち次に調べる辺のインデックス
     # DFS the graph and memorize the end time of visiting for each node
+    # 再帰だと長いパスを含むグラフで RecursionError となるため、明示的な stack で帰りがけの順を求める
     for i in range(n):
-        if not visited[i]:
-            dfs(i)
+        if visited[i]:
+            continue
+        visited[i] = True
+        stack = [i]
+        while stack:
+            u = stack[-1]
+            if it[u] < len(graph[u]):
+                v = graph[u][it[u]]
+                it[u] += 1
+                if not visited[v]:
+                    visited[v] = True
+                    stack.append(v)
+            else:
+                stack.pop()
+                order.append(u)
     # DFS the transposed graph
+    vertex_to_group_num = [0] * n
     cnt = -1
     visited = [False] * n    # 再初期化
     order.reverse()    # 訪問終了時刻が遅いものから
     for j in order:
         if not visited[j]:
             cnt += 1
-            rdfs(j, cnt)
+            visited[j] = True
+            stack = [j]
+            while stack:
+                u = stack.pop()
+                vertex_to_group_num[u] = cnt
+                for v in rgraph[u]:
+                    if not visited[v]:
+                        visited[v] = True
+                        stack.append(v)
     # 0 ... cnt までがグループ番号として使用されている。
     return cnt+1, vertex_to_group_num
             
@@ -88,6 +110,111 @@ def contract_from_group(graph: Sequence[Sequence[int]], group_num: int, vertex_t
 
 
 
+def tarjan_scc(graph: Sequence[Sequence[int]]) -> Tuple[int, List[int]]:
+    """
+    Tarjan 法により、graph のみをもとに強連結成分ごとのグルーピングを DFS 一回で行う。
+    戻り値は scc() と同じ形式で、グループ番号は強連結成分分解後の DAG におけるトポロジカル順序を表す。
+
+    Args:
+        graph (list): 隣接リスト
+
+    Returns:
+        group_numbers (int): トータルのグループ (強連結成分) 数
+        vertex_to_group_num (list): vertex_to_group_num[i] には i がどのグループ番号で表されるグループに属するかが int で入っているリスト
+    """
+    n = len(graph)
+    order = [-1] * n
+    lowlink = [0] * n
+    vertex_to_group_num = [-1] * n    # -1 の間は未確定 (訪問済みならスタック上にある)
+    it = [0] * n    # it[u] は graph[u] のうち次に調べる辺のインデックス
+    stack = []    # 成分が確定していない訪問済みの頂点
+    t = 0
+    cnt = 0
+    for i in range(n):
+        if order[i] != -1:
+            continue
+        order[i] = lowlink[i] = t
+        t += 1
+        stack.append(i)
+        call = [i]    # DFS の呼び出しスタック
+        while call:
+            u = call[-1]
+            adj_u = graph[u]
+            if it[u] < len(adj_u):
+                v = adj_u[it[u]]
+                it[u] += 1
+                if order[v] == -1:
+                    order[v] = lowlink[v] = t
+                    t += 1
+                    stack.append(v)
+                    call.append(v)
+                elif vertex_to_group_num[v] == -1 and order[v] < lowlink[u]:
+                    lowlink[u] = order[v]
+                continue
+            call.pop()
+            if call and lowlink[u] < lowlink[call[-1]]:
+                lowlink[call[-1]] = lowlink[u]
+            if lowlink[u] == order[u]:
+                # u が強連結成分の根
+                while True:
+                    w = stack.pop()
+                    vertex_to_group_num[w] = cnt
+                    if w == u:
+                        break
+                cnt += 1
+    # 成分は逆トポロジカル順に確定しているので反転する
+    for u in range(n):
+        vertex_to_group_num[u] = cnt - 1 - vertex_to_group_num[u]
+    return cnt, vertex_to_group_num
+
+
+
+def condensation(graph: Sequence[Sequence[int]], group_num: int, vertex_to_group_num: Sequence[int]) -> Tuple[List[int], List[int], List[int], List[int]]:
+    """
+    強連結成分のグルーピングをもとに、DAG とグループごとの頂点を CSR 形式で作成する (O(N+M))
+    contract_from_group() と異なり set を用いず、DAG の辺は重複を除いている
+
+    Args:
+        graph (list): 隣接リスト
+        group_num (int): トータルのグループ (強連結成分) 数
+        vertex_to_group_num (list): vertex_to_group_num[i] には i がどのグループ番号で表されるグループに属するかが int で入っているリスト
+
+    Returns:
+        head (list): グループ k から辺が伸びているグループの番号は dag[head[k]:head[k+1]]
+        dag (list): DAG の辺の行き先をグループ順に並べたリスト
+        member_head (list): グループ k に属する頂点は members[member_head[k]:member_head[k+1]]
+        members (list): 頂点をグループ番号順に並べたリスト
+    """
+    n = len(graph)
+    # 頂点をグループ番号でバケットソートする
+    member_head = [0] * (group_num + 1)
+    for g in vertex_to_group_num:
+        member_head[g+1] += 1
+    for g in range(group_num):
+        member_head[g+1] += member_head[g]
+    members = [0] * n
+    pos = member_head[:-1]
+    for u in range(n):
+        g = vertex_to_group_num[u]
+        members[pos[g]] = u
+        pos[g] += 1
+    # グループごとに出辺を走査し、重複を除いて DAG の辺を並べる
+    head = [0] * (group_num + 1)
+    dag = []
+    mark = [-1] * group_num    # mark[h] == g なら g -> h の辺は追加済み
+    for g in range(group_num):
+        mark[g] = g
+        for k in range(member_head[g], member_head[g+1]):
+            for v in graph[members[k]]:
+                h = vertex_to_group_num[v]
+                if mark[h] != g:
+                    mark[h] = g
+                    dag.append(h)
+        head[g+1] = len(dag)
+    return head, dag, member_head, members
+
+
+
 if __name__ == "__main__":
     adjacent_list = [[1,],
                      [2, 4, 5],
@@ -111,5 +238,12 @@ if __name__ == "__main__":
     assert(DAG == [{1, 2}, {2, 3}, {3}, set()])
     assert(strongly_connected == [[1, 4, 0], [3, 2], [6, 5], [7]])
 
+    # Tarjan 法 (逆辺のグラフは不要)
+    assert(tarjan_scc(adjacent_list) == (4, [0, 0, 1, 1, 0, 2, 2, 3]))
+    head, dag, member_head, members = condensation(adjacent_list, group_num, vertex_to_group_num)
+    assert(head == [0, 2, 4, 5, 5])
+    assert(dag == [1, 2, 2, 3, 3])
+    assert([members[member_head[k]:member_head[k+1]] for k in range(group_num)] == [[0, 1, 4], [2, 3], [5, 6], [7]])
+
     print(" * assertion test ok * ")
 
@@ -6,7 +6,7 @@ BFS (DFS も可能) を用いて DAG をトポロジカルソートする (O(V+E
 (閉路検出だけなら 3 の一部分のようにして DFS で order をふって後退辺検出でもいいけれど)
 
 また、DAG の単一始点最短経路問題 (負辺 OK) を求める問題も、
-トポロジカルソート -> その順にコストを緩和 により O(V+E) で計算することが可能！ cf. Bellman-Ford
+トポロジカルソート -> その順にコストを緩和 により O(V+E) で計算することが可能！ cf. Bellman-Ford (shortest_path/dag_shortest_path.py)
 
 
 <algorithm>
@@ -34,12 +34,27 @@ DAG ではないときもぶっ壊れたソート結果を返すので
 0      3  
   1  2
 のような閉路のある有向グラフについて DFS すると 5 4 3 2 1 0 -> 反転して 0 1 2 3 4 5 という結果になる。
+(topological_sort(method='dfs') では各頂点を 未訪問 / 探索中 (スタック上) / 探索済み の 3 色で管理し、
+ 探索中の頂点への辺 (後退辺) を見つけたら閉路ありとする。スタック上のその頂点から先が閉路そのものとなる)
+
+topological_sort
+上記をまとめた API。DAG なら (True, トポロジカル順) を、そうでなければ (False, 閉路をなす頂点の列) を返す。
+    - method='bfs': 入次数による BFS (Kahn のアルゴリズム)
+    - method='dfs': 明示的なスタックによる DFS
+    - method='lexicographic': BFS の queue を heap に替え、入次数が 0 の頂点のうち最小のものから取り出す。辞書順最小のトポロジカル順となる O(V lgV + E)
+BFS で全ての頂点を取り出せなかった場合、残った頂点は閉路を含むので、DFS で閉路を探して返す。
+
+topological_levels
+入次数が 0 の頂点を一度に全て取り除くことを繰り返し、各回に取り除いた頂点の集合 (レベル) のリストを返す。
+同じレベルの頂点の間には依存関係 (パス) がないので、同時に処理できる (DAG のタスクのスケジューリングに使える)。
+レベル数は最長パスの頂点数に等しい。
 """
 
 
 # verified @ABC139E
 from collections import deque
-from typing import Sequence, List
+from heapq import heapify, heappush, heappop
+from typing import Sequence, List, Tuple
 
 
 def topological_bfs(adj: Sequence[Sequence[int]]) -> List[int]:
@@ -63,9 +78,7 @@ def topological_bfs(adj: Sequence[Sequence[int]]) -> List[int]:
     sorted_vertice = []
     # BFS
     while q:
-        top = q.popleft()
-        if dimensions[top] != 0:
-            break
+        top = q.popleft()    # q に積まれる頂点の入次数は必ず 0
         sorted_vertice.append(top)
         for v in adj[top]:
             dimensions[v] -= 1
@@ -86,21 +99,143 @@ def topological_dfs(adj: Sequence[Sequence[int]]) -> List[int]:
     """
     n = len(adj)
     visited = [False] * n    # 複数回 DFS する。前回訪問ずみの頂点を判定し探索先から外す必要がある
+    it = [0] * n    # it[u] は adj[u] のうち次に調べる辺のインデックス (再帰の代わりに明示的な stack を用いる)
     buf = []
-    def dfs(current=0):
-        visited[current] = True
-        for v in adj[current]:
-            if not visited[v]:
-                dfs(v)
-        buf.append(current)    # 帰りがけの順で後ろに追加
     for i in range(n):
-        if not visited[i]:
-            dfs(i)
+        if visited[i]:
+            continue
+        visited[i] = True
+        stack = [i]
+        while stack:
+            u = stack[-1]
+            if it[u] < len(adj[u]):
+                v = adj[u][it[u]]
+                it[u] += 1
+                if not visited[v]:
+                    visited[v] = True
+                    stack.append(v)
+            else:
+                stack.pop()
+                buf.append(u)    # 帰りがけの順で後ろに追加
     buf.reverse()
     return buf
 
 
 
+
+def _in_degrees(adj: Sequence[Sequence[int]]) -> List[int]:
+    indeg = [0] * len(adj)
+    for edge in adj:
+        for v in edge:
+            indeg[v] += 1
+    return indeg
+
+
+def _dfs_order_or_cycle(adj: Sequence[Sequence[int]]) -> Tuple[bool, List[int]]:
+    """
+    明示的なスタックによる DFS でトポロジカルソートし、後退辺があれば閉路を返す
+    """
+    n = len(adj)
+    state = bytearray(n)    # 0: 未訪問, 1: 探索中 (スタック上), 2: 探索済み
+    it = [0] * n
+    buf = []
+    for i in range(n):
+        if state[i]:
+            continue
+        state[i] = 1
+        stack = [i]
+        while stack:
+            u = stack[-1]
+            if it[u] < len(adj[u]):
+                v = adj[u][it[u]]
+                it[u] += 1
+                if state[v] == 0:
+                    state[v] = 1
+                    stack.append(v)
+                elif state[v] == 1:
+                    # 後退辺 u -> v。スタック上の v から u までが閉路
+                    return False, stack[stack.index(v):]
+            else:
+                stack.pop()
+                state[u] = 2
+                buf.append(u)    # 帰りがけの順で後ろに追加
+    buf.reverse()
+    return True, buf
+
+
+
+def topological_sort(adj: Sequence[Sequence[int]], method: str='bfs') -> Tuple[bool, List[int]]:
+    """
+    有向グラフをトポロジカルソートする。閉路がある場合はその証拠となる閉路を返す
+
+    Args:
+        adj (list): 隣接リスト
+        method (str): 'bfs' (入次数による BFS), 'dfs' (非再帰 DFS), 'lexicographic' (辞書順最小、O(V lgV + E)) のいずれか
+    Returns:
+        (True, order): DAG の場合。order はトポロジカル順に並べた頂点のリスト
+        (False, cycle): 閉路がある場合。cycle = [v_0, v_1, ..., v_(k-1)] は v_0 -> v_1 -> ... -> v_(k-1) -> v_0 なる閉路
+    """
+    if method == 'dfs':
+        return _dfs_order_or_cycle(adj)
+    if method not in ('bfs', 'lexicographic'):
+        raise ValueError(f"topological_sort(): method must be 'bfs', 'dfs' or 'lexicographic', got {method}")
+    n = len(adj)
+    indeg = _in_degrees(adj)
+    order = [u for u in range(n) if indeg[u] == 0]
+    if method == 'bfs':
+        # order 自体を queue として使う
+        for u in order:
+            for v in adj[u]:
+                indeg[v] -= 1
+                if indeg[v] == 0:
+                    order.append(v)
+    else:
+        heap = order
+        heapify(heap)
+        order = []
+        while heap:
+            u = heappop(heap)
+            order.append(u)
+            for v in adj[u]:
+                indeg[v] -= 1
+                if indeg[v] == 0:
+                    heappush(heap, v)
+    if len(order) < n:
+        return _dfs_order_or_cycle(adj)
+    return True, order
+
+
+
+def topological_levels(adj: Sequence[Sequence[int]]) -> Tuple[bool, List[List[int]]]:
+    """
+    有向グラフの頂点を、同時に処理できる頂点の集合 (レベル) に分ける O(V+E)
+    レベル k の頂点は、レベル k-1 以前の頂点からのみ辺が入り、かつレベル k-1 の頂点のいずれかから辺が入る (レベル 0 は入次数 0)
+
+    Returns:
+        (True, levels): DAG の場合。levels[k] はレベル k の頂点のリスト (昇順)
+        (False, cycle): 閉路がある場合。topological_sort と同じ閉路
+    """
+    n = len(adj)
+    indeg = _in_degrees(adj)
+    level = [u for u in range(n) if indeg[u] == 0]
+    levels = []
+    count = 0
+    while level:
+        levels.append(level)
+        count += len(level)
+        next_level = []
+        for u in level:
+            for v in adj[u]:
+                indeg[v] -= 1
+                if indeg[v] == 0:
+                    next_level.append(v)
+        next_level.sort()
+        level = next_level
+    if count < n:
+        return _dfs_order_or_cycle(adj)
+    return True, levels
+
+
 if __name__ == "__main__":
     adjacent_list = ((1, 3),
                     (3,),
@@ -115,6 +250,16 @@ if __name__ == "__main__":
     
     dfs_result = topological_dfs(adjacent_list)
     assert(dfs_result == [2, 4, 5, 0, 1, 3])
+
+    assert(topological_sort(adjacent_list) == (True, bfs_result))
+    assert(topological_sort(adjacent_list, 'dfs') == (True, dfs_result))
+    assert(topological_sort(adjacent_list, 'lexicographic') == (True, [0, 1, 2, 3, 4, 5]))
+    assert(topological_levels(adjacent_list) == (True, [[0, 2], [1, 4], [3, 5]]))
+    # 1 -> 3 -> 4 -> 1 の閉路を作る
+    cyclic = ((1, 3), (3,), (3, 4), (4,), (5, 1), tuple())
+    for method in ('bfs', 'dfs', 'lexicographic'):
+        assert(topological_sort(cyclic, method) == (False, [1, 3, 4]))
+    assert(topological_levels(cyclic) == (False, [1, 3, 4]))
     print(" * assertion test ok * ")
     
     
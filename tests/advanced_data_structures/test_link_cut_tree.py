@@ -0,0 +1,104 @@
+import pytest
+from random import randint, choice
+import networkx as nx
+from mypkg.advanced_data_structures.link_cut_tree import LinkCutTree
+
+
+
+def test_link_cut_tree():
+    """
+    最大ノード数 M の辺のない森に対し、ランダムな操作 (link, cut, connected, path_query, set_value, lca, find_root) を
+    Iteration 回繰り返すことを Iteration 回行う。
+    それぞれの結果を、同じ森を networkx.Graph で管理した場合の愚直な計算と照合する。
+    """
+    Iteration = 100
+    M = 30
+    for _ in range(Iteration):
+        n = randint(1, M)
+        values = [randint(-10, 10) for _ in range(n)]
+        lct = LinkCutTree(n, values, func=lambda a, b: a + b, identity=0)
+        G = nx.Graph()
+        G.add_nodes_from(range(n))
+        for _ in range(Iteration):
+            u, v = randint(0, n-1), randint(0, n-1)
+            op = randint(0, 5)
+            connected = nx.has_path(G, u, v)
+            if op == 0:
+                if connected:
+                    with pytest.raises(ValueError):
+                        lct.link(u, v)
+                else:
+                    lct.link(u, v)
+                    G.add_edge(u, v)
+            elif op == 1:
+                if G.number_of_edges() == 0:
+                    continue
+                a, b = choice(list(G.edges()))
+                if randint(0, 1):
+                    a, b = b, a
+                lct.cut(a, b)
+                G.remove_edge(a, b)
+                if u != v and not G.has_edge(u, v):
+                    with pytest.raises(ValueError):
+                        lct.cut(u, v)
+            elif op == 2:
+                assert lct.connected(u, v) == connected
+                assert (lct.find_root(u) in nx.node_connected_component(G, u))
+            elif op == 3:
+                expected = sum(values[w] for w in nx.shortest_path(G, u, v)) if connected else None
+                assert lct.path_query(u, v) == expected
+            elif op == 4:
+                values[u] = randint(-10, 10)
+                lct.set_value(u, values[u])
+                assert lct.get_value(u) == values[u]
+            else:
+                root = randint(0, n-1)
+                if connected and nx.has_path(G, u, root):
+                    T = nx.bfs_tree(G, root)
+                    assert lct.lca(u, v, root) == nx.lowest_common_ancestor(T, u, v)
+                    assert lct.find_root(u) == root
+                else:
+                    assert lct.lca(u, v, root) is None
+
+
+
+def test_link_cut_tree_max_and_add_node():
+    """ 集約が max の場合と add_node で頂点を追加した場合、長いパスでも正しく求まるか """
+    n = 10**4
+    lct = LinkCutTree(n, values=list(range(n)))
+    for v in range(1, n):
+        lct.link(v-1, v)
+    assert lct.path_query(0, n-1) == n-1
+    assert lct.path_query(10, 20) == 20
+    x = lct.add_node(10**9)
+    assert x == n and not lct.connected(x, 0)
+    lct.link(x, n // 2)
+    assert lct.path_query(0, x) == 10**9
+    assert lct.lca(0, n-1, x) == n // 2
+    lct.cut(n // 2, n // 2 + 1)
+    assert lct.path_query(0, n-1) is None
+
+
+
+
+def test_link_cut_tree_out_of_range():
+    """ 範囲外の頂点 (番兵を指してしまう -1 を含む) を渡すと IndexError となり、森が変わらないか """
+    lct = LinkCutTree(3, values=[1, 2, 3], func=lambda a, b: a + b, identity=0)
+    lct.link(0, 1)
+    for u in (-1, 3):
+        for op in (lambda: lct.link(2, u), lambda: lct.link(u, 2), lambda: lct.cut(u, 0),
+                   lambda: lct.connected(u, 0), lambda: lct.connected(0, u), lambda: lct.path_query(0, u),
+                   lambda: lct.lca(0, 1, u), lambda: lct.find_root(u), lambda: lct.evert(u),
+                   lambda: lct.get_value(u), lambda: lct.set_value(u, 10)):
+            with pytest.raises(IndexError):
+                op()
+    assert lct.path_query(0, 1) == 3 and not lct.connected(0, 2)
+    x = lct.add_node(4)
+    lct.link(x, 2)
+    assert lct.path_query(2, x) == 7
+
+
+
+
+if __name__ == "__main__":
+    pytest.main(['-v', __file__])
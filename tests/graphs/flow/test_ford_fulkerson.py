@@ -57,6 +57,54 @@ def test_ford_fulkerson():
 
 
 
+def test_ford_fulkerson_incremental():
+    """
+    最大ノード数 M でランダムな重み付き有向グラフを作成し、最大フローを流した後に辺の容量変更、辺の追加を繰り返す。
+    reset() の結果、および現在のフローから再最適化した結果を scipy.sparse.csgraph.maximum_flow と照合するストレステストを行う。
+    """
+    Iteration = 30
+    M = 15
+    for _ in range(Iteration):
+        n = randint(2, M)
+        source, sink = 0, n-1
+        # 多重辺を持たない行列を scipy 用に、辺番号を FordFulkerson 用に管理する
+        mat = np.full((n, n), 0)
+        edge_ind = dict()
+        FF = FordFulkerson(n)
+
+        def add(a, b, c):
+            mat[a, b] = c
+            edge_ind[a, b] = FF.add_edge(a, b, c)
+
+        for _ in range(2 * n):
+            a, b = randint(0, n-1), randint(0, n-1)
+            if a != b and mat[b, a] == 0 and (a, b) not in edge_ind:    # 逆平行有向グラフにしたいので
+                add(a, b, randint(1, M))
+        flow = FF.ford_fulkerson(source, sink)
+        assert flow == cs.maximum_flow(csr_matrix(mat), source, sink).flow_value
+
+        for _ in range(10):
+            a, b = randint(0, n-1), randint(0, n-1)
+            if (a, b) in edge_ind:
+                c = randint(0, M)
+                mat[a, b] = c
+                flow -= FF.change_capacity(edge_ind[a, b], c, source, sink)
+            elif a != b and mat[b, a] == 0:
+                add(a, b, randint(1, M))
+            else:
+                continue
+            flow += FF.edmonds_karp(source, sink)
+            assert flow == cs.maximum_flow(csr_matrix(mat), source, sink).flow_value
+            # 各辺の流量が容量を超えていないか
+            for (x, y), i in edge_ind.items():
+                assert 0 <= FF.get_flow(i) <= mat[x, y]
+
+        FF.reset()
+        assert all(FF.get_flow(i) == 0 for i in edge_ind.values())
+        assert FF.ford_fulkerson(source, sink) == cs.maximum_flow(csr_matrix(mat), source, sink).flow_value
+
+
+
 
 if __name__ == "__main__":
     pytest.main(['-v', __file__])
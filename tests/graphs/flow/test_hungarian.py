@@ -0,0 +1,35 @@
+import pytest
+from random import randint
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+from mypkg.graphs.flow.hungarian import hungarian
+
+
+
+def test_hungarian():
+    """
+    最大サイズ M * M のランダムなコスト行列 (長方形、負の値を含みうる) を作成することを Iteration 回行う。
+    それぞれについて割当問題を解き、scipy.optimize.linear_sum_assignment の結果と照合するストレステストを行う。
+    """
+    Iteration = 100
+    M = 30
+    for _ in range(Iteration):
+        n, m = randint(1, M), randint(1, M)
+        mat = np.random.randint(-M, M * M, size=(n, n if randint(0, 1) else m))
+        rows, cols = linear_sum_assignment(mat)
+        expected_cost = mat[rows, cols].sum()
+
+        for use_numpy in (False, True):
+            for given in (mat.tolist(), mat):
+                assignment, total_cost = hungarian(given, use_numpy=use_numpy)
+                assert total_cost == expected_cost
+                # 割り当てが相異なり、コストの総和と一致しているか
+                assigned = [j for j in assignment if j != -1]
+                assert len(assigned) == min(mat.shape) == len(set(assigned))
+                assert sum(mat[i, j] for i, j in enumerate(assignment) if j != -1) == total_cost
+
+
+
+
+if __name__ == "__main__":
+    pytest.main(['-v', __file__])
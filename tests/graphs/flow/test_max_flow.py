@@ -0,0 +1,66 @@
+import pytest
+from random import randint
+import numpy as np
+import scipy.sparse.csgraph as cs
+from scipy.sparse import csr_matrix
+from mypkg.graphs.flow.max_flow import MaxFlow
+
+
+
+def test_max_flow():
+    """
+    最大ノード数 M, 最大重み M, 最大辺数ノード数 * 3 で重み付き有向グラフ (逆平行辺を含みうる) をランダム作成することを Iteration 回行う。
+    それぞれに対し、ソースとシンクを選んで Dinic 法と push-relabel 法でフローを流すことをノード数だけ行い、
+    scipy.sparse.csgraph.maximum_flow と結果を照合するストレステストを行う。
+    また流した後のフローが容量制約とフロー保存則を満たしているか確かめる。
+    """
+    Iteration = 50
+    M = 30
+    for _ in range(Iteration):
+        n = randint(2, M)
+
+        # ---- ndarray, csr_matrix, エッジを張った MaxFlow インスタンス生成 ----
+        mat = np.full((n, n), 0)
+        for _ in range(3 * n):
+            a, b = randint(0, n-1), randint(0, n-1)
+            if a == b:    # 自己ループはだめ
+                continue
+            mat[a, b] = randint(1, M)    # 上書きすることも多々あるだろう
+        G = csr_matrix(mat)
+        mf = MaxFlow(n)
+        for i in range(n):
+            for j in range(n):
+                if mat[i, j] != 0:
+                    mf.add_edge(i, j, int(mat[i, j]))
+        initial_cap = mf.cap[:]
+
+        # ---- source, sink を決定しフローを流して比較 ----
+        for i in range(n):
+            while True:
+                source, sink = randint(0, n-1), randint(0, n-1)
+                if source != sink:
+                    break
+            expected_max_flow = cs.maximum_flow(G, source, sink).flow_value
+            mf.cap = initial_cap[:]
+            got_max_flow = mf.dinic(source, sink) if i % 2 == 0 else mf.push_relabel(source, sink)
+            assert got_max_flow == expected_max_flow
+
+            balance = [0] * n
+            for e in range(0, len(mf.to), 2):
+                here, to, capacity, flow = mf.get_edge(e)
+                assert 0 <= flow <= capacity
+                balance[here] -= flow
+                balance[to] += flow
+            for v in range(n):
+                if v == source:
+                    assert balance[v] == -got_max_flow
+                elif v == sink:
+                    assert balance[v] == got_max_flow
+                else:
+                    assert balance[v] == 0
+
+
+
+
+if __name__ == "__main__":
+    pytest.main(['-v', __file__])
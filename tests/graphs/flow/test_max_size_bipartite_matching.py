@@ -2,7 +2,7 @@ import pytest
 from random import sample, randint, randrange
 import networkx as nx
 from networkx.algorithms import bipartite
-from mypkg.graphs.flow.max_size_bipartite_matching import bipartite_max_matching
+from mypkg.graphs.flow.max_size_bipartite_matching import bipartite_max_matching, hopcroft_karp, bipartite_vertex_cover, bipartite_independent_set
 
 
 
@@ -38,6 +38,55 @@ def test_bipartite_max_matching():
 
 
 
+def test_hopcroft_karp():
+    """
+    最大ノード数 M で (左右のサイズが異なりうる) 二部グラフ作成を Iteration 回行う。
+    それぞれに対し Hopcroft-Karp 法で最大マッチングを求め、networkx.bipartite.hopcroft_karp_matching とサイズを照合する。
+    また最小点被覆、最大独立集合が条件を満たしているか確かめるストレステストを行う。
+    """
+    Iteration = 100
+    M = 60
+    for _ in range(Iteration):
+        n = randint(2, M)
+        l = randint(1, n-1)
+        group1 = list(range(l))
+        group2 = list(range(l, n))
+        # 左右の頂点を混ぜたインデックスでも動くか確かめるためにシャッフルした番号を振る
+        perm = sample(range(n), n)
+        left = [perm[i] for i in group1]
+        right = [perm[i] for i in group2]
+
+        # ---- 辺を張った networkx グラフインスタンス、隣接リストを生成 ----
+        adj = [[] for _ in range(n)]
+        G = nx.Graph()
+        G.add_nodes_from(left, bipartite=0)
+        G.add_nodes_from(right, bipartite=1)
+        for i in left:
+            for j in sample(right, randint(0, min(len(right), 4))):
+                G.add_edge(i, j)
+                adj[i].append(j)
+                adj[j].append(i)
+
+        # ---- 最大マッチングの結果を比較 ----
+        expected = len(bipartite.hopcroft_karp_matching(G, top_nodes=left)) // 2    # 両方向の辞書が返ってくる
+        for greedy in (True, False):
+            pairs = hopcroft_karp(adj, left, right, greedy=greedy)
+            assert len(pairs) == expected
+            assert len(set(u for u, _ in pairs)) == len(set(v for _, v in pairs)) == len(pairs)
+            assert all(G.has_edge(u, v) and u in left for u, v in pairs)
+
+        # ---- König の定理 ----
+        cover = bipartite_vertex_cover(adj, left, right)
+        assert len(cover) == expected
+        cover_set = set(cover)
+        assert all(u in cover_set or v in cover_set for u, v in G.edges())
+        independent = bipartite_independent_set(adj, left, right, pairs)
+        assert len(independent) == n - expected
+        independent_set = set(independent)
+        assert not any(u in independent_set and v in independent_set for u, v in G.edges())
+
+
+
 
 
 
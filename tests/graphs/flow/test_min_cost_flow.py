@@ -0,0 +1,82 @@
+import pytest
+from random import randint
+import networkx as nx
+from mypkg.graphs.flow.min_cost_flow import MinCostFlow
+
+
+
+def test_min_cost_flow():
+    """
+    最大ノード数 M, 最大容量 M, 最大コスト M の重み付き有向グラフをランダム作成することを Iteration 回行う。
+    それぞれに対し、最大流を流した時の最小費用と、上限 limit を指定して流した時の最小費用を求め、
+    networkx.max_flow_min_cost, networkx.min_cost_flow の結果と照合するストレステストを行う。
+    """
+    Iteration = 50
+    M = 15
+    for _ in range(Iteration):
+        n = randint(2, M)
+        source, sink = 0, n-1
+
+        # ---- networkx グラフインスタンス、エッジを張った MinCostFlow インスタンス生成 ----
+        G = nx.DiGraph()
+        G.add_nodes_from(range(n))
+        edges = dict()
+        for _ in range(3 * n):
+            a, b = randint(0, n-1), randint(0, n-1)
+            if a != b:
+                edges[a, b] = (randint(1, M), randint(0, M))    # 上書きすることも多々あるだろう
+        mcf = MinCostFlow(n)
+        for (a, b), (c, w) in edges.items():
+            G.add_edge(a, b, capacity=c, weight=w)
+            mcf.add_edge(a, b, c, w)
+        initial_cap = mcf.cap[:]
+
+        # ---- 最大流を流した時の最小費用 ----
+        flow_dict = nx.max_flow_min_cost(G, source, sink)
+        expected_flow = sum(flow_dict[source].values()) - sum(flow_dict[v][source] for v in G.predecessors(source))
+        expected_cost = nx.cost_of_flow(G, flow_dict)
+        points = mcf.slope(source, sink)
+        assert points[-1] == (expected_flow, expected_cost)
+        # 折れ線の傾きが狭義単調増加か
+        slopes = [(c2 - c1) / (f2 - f1) for (f1, c1), (f2, c2) in zip(points, points[1:])]
+        assert all(s1 < s2 for s1, s2 in zip(slopes, slopes[1:]))
+
+        # ---- 流量の上限を指定した時の最小費用 ----
+        if expected_flow > 0:
+            limit = randint(1, expected_flow)
+            mcf.cap = initial_cap[:]
+            G.nodes[source]['demand'] = -limit
+            G.nodes[sink]['demand'] = limit
+            got = mcf.flow(source, sink, limit)
+            assert got == (limit, nx.cost_of_flow(G, nx.min_cost_flow(G)))
+            # 折れ線を線形補間した値とも一致するか
+            for (f1, c1), (f2, c2) in zip(points, points[1:]):
+                if f1 <= limit <= f2:
+                    assert c1 + (c2 - c1) * (limit - f1) / (f2 - f1) == pytest.approx(got[1])
+
+
+
+def test_min_cost_flow_negative_cost():
+    """ 負のコストの辺を含む (負サイクルは含まない) DAG について、networkx.max_flow_min_cost の結果と照合する """
+    Iteration = 50
+    M = 15
+    for _ in range(Iteration):
+        n = randint(2, M)
+        G = nx.DiGraph()
+        G.add_nodes_from(range(n))
+        mcf = MinCostFlow(n)
+        for _ in range(3 * n):
+            a, b = randint(0, n-1), randint(0, n-1)
+            if a < b and not G.has_edge(a, b):    # a < b のみ張れば DAG となり負サイクルはできない
+                c, w = randint(1, M), randint(-M, M)
+                G.add_edge(a, b, capacity=c, weight=w)
+                mcf.add_edge(a, b, c, w)
+        flow_dict = nx.max_flow_min_cost(G, 0, n-1)
+        expected_flow = sum(flow_dict[0].values())
+        assert mcf.flow(0, n-1) == (expected_flow, nx.cost_of_flow(G, flow_dict))
+
+
+
+
+if __name__ == "__main__":
+    pytest.main(['-v', __file__])
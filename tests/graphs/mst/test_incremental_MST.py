@@ -0,0 +1,66 @@
+import pytest
+from random import randint
+from mypkg.graphs.mst.incremental_MST import IncrementalMST
+from mypkg.graphs.mst.kruskal_MST import kruskal_edges
+
+
+
+def test_incremental_mst():
+    """
+    最大ノード数 M のグラフに、ランダムな辺 (自己ループ、多重辺、重みの等しい辺を含む) を一本ずつ追加することを Iteration 回行う。
+    追加のたびに、それまでに追加した辺全体に対する kruskal_MST.kruskal_edges の結果と
+    辺の集合、重みの総和、add_edge の戻り値が一致するかを確かめる。
+    """
+    Iteration = 50
+    M = 30
+    for _ in range(Iteration):
+        n = randint(1, M)
+        mst = IncrementalMST(n)
+        us, vs, ws = [], [], []
+        prev = set()
+        for i in range(4 * n):
+            u, v, w = randint(0, n-1), randint(0, n-1), randint(1, 10)
+            used = mst.add_edge(u, v, w)
+            us.append(u)
+            vs.append(v)
+            ws.append(w)
+            expected = sorted(kruskal_edges(n, us, vs, ws))
+            assert mst.edges() == expected
+            assert mst.weight == sum(ws[j] for j in expected)
+            assert used == (i in expected) == mst.in_mst(i)
+            # 追加された辺以外で MST から外れるのは高々 1 本
+            assert len(prev - set(expected)) <= 1
+            prev = set(expected)
+
+
+
+def test_incremental_mst_long_path():
+    """ パスグラフを作った後に両端を結ぶ軽い辺を追加すると、パス上の最も重い辺と入れ替わるか """
+    n = 10**4
+    mst = IncrementalMST(n)
+    for v in range(1, n):
+        mst.add_edge(v-1, v, v)
+    assert mst.weight == n * (n - 1) // 2
+    assert mst.add_edge(0, n-1, 0)
+    assert not mst.in_mst(n-2)
+    assert mst.weight == n * (n - 1) // 2 - (n - 1)
+
+
+
+
+def test_incremental_mst_out_of_range():
+    """ 範囲外の頂点を含む辺は IndexError となり、MST (内部の辺の頂点を含む) が壊れないか """
+    mst = IncrementalMST(3)
+    assert mst.add_edge(0, 1, 5)
+    for u, v in ((3, 2), (0, -1), (4, 4)):
+        with pytest.raises(IndexError):
+            mst.add_edge(u, v, 1)
+    assert mst.weight == 5 and mst.edges() == [0]
+    assert mst.add_edge(0, 2, 7)
+    assert mst.weight == 12 and mst.edges() == [0, 1]
+
+
+
+
+if __name__ == "__main__":
+    pytest.main(['-v', __file__])
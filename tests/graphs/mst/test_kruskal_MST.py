@@ -2,7 +2,9 @@ import pytest
 from random import randint
 import numpy as np
 import scipy.sparse.csgraph as cs
-from mypkg.graphs.mst.kruskal_MST import kruskal
+from array import array
+import networkx as nx
+from mypkg.graphs.mst.kruskal_MST import kruskal, kruskal_edges, boruvka
 
 
 
@@ -45,6 +47,54 @@ def test_kruskal():
 
 
 
+def test_kruskal_edges_and_boruvka():
+    """
+    最大ノード数 M の (非連結でありうる、多重辺を含みうる) 重み付き無向グラフを辺の配列としてランダム生成することを Iteration 回行う。
+    重みの等しい辺が多くなるよう重みの範囲を狭くし、kruskal_edges (ソート / presorted / NumPy) と boruvka の返す辺の添字が
+    全域森をなし、重みの総和が networkx.minimum_spanning_tree と一致するかを確かめる。
+    """
+    Iteration = 100
+    M = 40
+    for _ in range(Iteration):
+        n = randint(1, M)
+        m = randint(0, 3 * n)
+        us = array('i', [randint(0, n-1) for _ in range(m)])
+        vs = array('i', [randint(0, n-1) for _ in range(m)])
+        ws = [randint(1, 5) for _ in range(m)]
+        G = nx.MultiGraph()
+        G.add_nodes_from(range(n))
+        for u, v, w in zip(us, vs, ws):
+            G.add_edge(u, v, weight=w)
+        T = nx.minimum_spanning_tree(G)
+        expected_total = T.size(weight='weight')
+        order = sorted(range(m), key=ws.__getitem__)
+        results = [kruskal_edges(n, us, vs, ws),
+                   kruskal_edges(n, us, vs, ws, use_numpy=True),
+                   [order[i] for i in kruskal_edges(n, array('i', [us[i] for i in order]),
+                                                    array('i', [vs[i] for i in order]),
+                                                    [ws[i] for i in order], presorted=True)],
+                   boruvka(n, us, vs, ws)]
+        for mst in results:
+            assert len(mst) == T.number_of_edges() == len(set(mst))
+            assert sum(ws[i] for i in mst) == expected_total
+            F = nx.Graph()
+            F.add_nodes_from(range(n))
+            F.add_edges_from((us[i], vs[i]) for i in mst)
+            assert nx.is_forest(F)
+        assert sorted(results[0]) == results[3]    # 重みが等しい辺は添字の小さい方を優先するので一致する
+
+
+
+def test_boruvka_process_pool():
+    """ プロセスプールで並列に計算しても、逐次版と同じ辺の集合が得られるか """
+    n, m = 2000, 20000
+    us = array('i', [randint(0, n-1) for _ in range(m)])
+    vs = array('i', [randint(0, n-1) for _ in range(m)])
+    ws = [randint(1, 100) for _ in range(m)]
+    assert boruvka(n, us, vs, ws, processes=2) == boruvka(n, us, vs, ws) == sorted(kruskal_edges(n, us, vs, ws))
+
+
+
 
 
 if __name__ == "__main__":
@@ -2,7 +2,8 @@ import pytest
 from random import randint
 import numpy as np
 import scipy.sparse.csgraph as cs
-from mypkg.graphs.mst.prim_MST import prim_mst
+import networkx as nx
+from mypkg.graphs.mst.prim_MST import prim_mst, prim_mst_indexed, prim_mst_dense, prim_mst_matrix
 
 
 
@@ -44,6 +45,41 @@ def test_prim():
 
 
 
+def test_prim_indexed_and_dense():
+    """
+    最大ノード数 M の (非連結でありうる) 重み付き無向グラフをランダム生成することを Iteration 回行う。
+    それぞれについて prim_mst_indexed, prim_mst_dense (Python 版 / NumPy 版), prim_mst_matrix の結果が
+    始点を含む連結成分の networkx.minimum_spanning_tree と同じ重みの全域木になっているかを確かめる。
+    辺の少ないグラフも生成し、prim_mst_matrix が疎なグラフとして扱う場合も確かめる。
+    """
+    Iteration = 100
+    M = 150
+    for _ in range(Iteration):
+        n = randint(1, M)
+        m = randint(0, n * n // 4) if randint(0, 1) else randint(0, n // 2)
+        G = nx.Graph()
+        G.add_nodes_from(range(n))
+        for _ in range(m):
+            a, b = randint(0, n-1), randint(0, n-1)
+            if a != b:
+                G.add_edge(a, b, weight=randint(1, 20))
+        start = randint(0, n-1)
+        component = nx.node_connected_component(G, start)
+        expected_total = nx.minimum_spanning_tree(G.subgraph(component)).size(weight='weight')
+        adj = [[(v, G[u][v]['weight']) for v in G.neighbors(u)] for u in range(n)]
+        mat = [[float('inf')] * n for _ in range(n)]
+        for u, v, w in G.edges(data='weight'):
+            mat[u][v] = mat[v][u] = w
+        for total, parent in (prim_mst_indexed(adj, start),
+                              prim_mst_dense(mat, start),
+                              prim_mst_dense(np.array(mat), start, use_numpy=True),
+                              prim_mst_matrix(mat, start),
+                              prim_mst_matrix(mat, start, use_numpy=True)):
+            assert total == expected_total
+            assert {v for v in range(n) if parent[v] is not None} == component - {start}
+            assert sum(G[v][parent[v]]['weight'] for v in component - {start}) == expected_total
+
+
 
 
 if __name__ == "__main__":
@@ -3,7 +3,7 @@ from pytest import approx
 from random import randint
 import numpy as np
 import scipy.sparse.csgraph as cs
-from mypkg.graphs.shortest_path.bellman_ford import NegativeCycleError, Edge, bellman
+from mypkg.graphs.shortest_path.bellman_ford import NegativeCycleError, Edge, bellman, spfa
 
 
 
@@ -48,6 +48,63 @@ def test_bellman():
 
 
 
+def test_spfa():
+    """
+    最大ノード数 M の (負サイクルを含みうる) 重み付き有向グラフをランダム生成することを Iteration 回行う。
+    それぞれについて単一始点最短距離を求め、愚直な Bellman-Ford (V-1 回の緩和 + 負サイクルからの到達判定) の結果と照合するストレステストを行う。
+    """
+    Iteration = 100
+    M = 30
+    inf = float('inf')
+    for _ in range(Iteration):
+        v = randint(2, M)
+        e = randint(v, 3 * v)
+        here, to, weight = [], [], []
+        for _ in range(e):
+            a, b = randint(0, v-1), randint(0, v-1)
+            here.append(a)
+            to.append(b)
+            weight.append(randint(-M // 3, M))
+
+        for start in range(v):
+            # ---- 愚直解 ----
+            cost = [inf] * v
+            cost[start] = 0
+            for _ in range(v-1):
+                for a, b, w in zip(here, to, weight):
+                    if cost[a] + w < cost[b]:
+                        cost[b] = cost[a] + w
+            negative = set(b for a, b, w in zip(here, to, weight) if cost[a] + w < cost[b])
+            stack = list(negative)
+            while stack:
+                a = stack.pop()
+                for x, y in zip(here, to):
+                    if x == a and y not in negative:
+                        negative.add(y)
+                        stack.append(y)
+            for a in negative:
+                cost[a] = -inf
+
+            # ---- 結果の比較 ----
+            got_cost, got_prev, got_negative = spfa(here, to, weight, v, start)
+            assert got_negative == negative
+            assert got_cost == cost
+            # 経路復元した結果のコストが最短コストと一致するか
+            for goal in range(v):
+                if goal == start or abs(got_cost[goal]) == inf:
+                    assert got_prev[goal] == -1
+                    continue
+                w = {}
+                for a, b, c in zip(here, to, weight):
+                    w[a, b] = min(w.get((a, b), inf), c)
+                total, cur = 0, goal
+                while cur != start:
+                    total += w[got_prev[cur], cur]
+                    cur = got_prev[cur]
+                assert total == got_cost[goal]
+
+
+
 
 
 if __name__ == "__main__":
@@ -0,0 +1,100 @@
+import pytest
+from random import randint, sample, shuffle
+from mypkg.graphs.shortest_path.bellman_ford import Edge, bellman
+from mypkg.graphs.shortest_path.dag_shortest_path import dag_shortest_path, dag_longest_path, critical_path
+from mypkg.graphs.traverse.topological_sort import topological_bfs
+
+
+
+def _random_dag(n, M):
+    """ 頂点の番号をランダムに並べ替えた上で、前から後ろへの辺だけを張った重みつき DAG (多重辺を含む) """
+    perm = list(range(n))
+    shuffle(perm)
+    adj = [[] for _ in range(n)]
+    for _ in range(randint(0, n * (n - 1) // 2)):
+        i, j = sorted(sample(range(n), 2)) if n >= 2 else (0, 0)
+        if i == j:
+            break
+        adj[perm[i]].append((perm[j], randint(-M, M)))
+    return adj
+
+
+
+def test_dag_shortest_and_longest_path():
+    """
+    最大ノード数 M の重みつき DAG (負辺を含む) をランダム生成することを Iteration 回行う。
+    それぞれについてランダムな始点からの dag_shortest_path, dag_longest_path の結果を、
+    bellman_ford.bellman (最長経路は重みを反転したグラフに対する結果の符号を反転したもの) と照合する。
+    親の列が最短 (最長) 経路木をなしているかも確かめる。
+    """
+    Iteration = 300
+    M = 20
+    inf = float('inf')
+    for _ in range(Iteration):
+        n = randint(1, M)
+        adj = _random_dag(n, M)
+        edges = [Edge(u, v, w) for u in range(n) for v, w in adj[u]]
+        negated = [Edge(u, v, -w) for u in range(n) for v, w in adj[u]]
+        start = randint(0, n-1)
+        order = topological_bfs([[v for v, _ in row] for row in adj]) if randint(0, 1) else None
+        for func, expected in ((dag_shortest_path, bellman(edges, n, start)),
+                               (dag_longest_path, [-c for c in bellman(negated, n, start)])):
+            cost, parent = func(adj, start, order)
+            assert cost == expected
+            for v in range(n):
+                if v == start or abs(cost[v]) == inf:
+                    assert parent[v] == -1
+                else:
+                    u = parent[v]
+                    ws = [w for x, w in adj[u] if x == v]
+                    assert cost[u] + (min(ws) if func is dag_shortest_path else max(ws)) == cost[v]
+
+
+
+def test_critical_path():
+    """
+    最大ノード数 M の DAG と各タスクの所要時間をランダム生成することを Iteration 回行う。
+    それぞれについて critical_path の結果を、辺 u -> v の重みを -duration[u] とし、
+    超始点 S -> v (重み 0) と v -> 超終点 T (重み -duration[v]) を加えたグラフに対する bellman_ford.bellman の結果と照合する。
+    (S から v への最長距離が最早開始時刻、v から T への最長距離を makespan から引いたものが最遅開始時刻)
+    """
+    Iteration = 200
+    M = 20
+    for _ in range(Iteration):
+        n = randint(1, M)
+        adj = [[v for v, _ in row] for row in _random_dag(n, M)]
+        duration = [randint(0, M) for _ in range(n)]
+        S, T = n, n + 1
+        edges = [Edge(u, v, -duration[u]) for u in range(n) for v in adj[u]]
+        edges += [Edge(S, v, 0) for v in range(n)] + [Edge(v, T, -duration[v]) for v in range(n)]
+        from_S = bellman(edges, n + 2, S)
+        makespan, earliest, slack, path = critical_path(adj, duration)
+        assert makespan == -from_S[T]
+        assert earliest == [-from_S[v] for v in range(n)]
+        for v in range(n):
+            to_T = -bellman(edges, n + 2, v)[T]
+            assert earliest[v] + slack[v] == makespan - to_T
+        # クリティカルパスは入次数 0 のタスクから始まる余裕 0 のタスクのパスで、所要時間の和が makespan
+        assert all(path[0] not in adj[u] for u in range(n))
+        assert all(slack[v] == 0 for v in path)
+        assert all(path[i+1] in adj[path[i]] for i in range(len(path) - 1))
+        assert sum(duration[v] for v in path) == makespan
+
+
+
+def test_dag_errors():
+    """ 閉路がある場合やトポロジカル順、所要時間の長さが合わない場合に ValueError となるか """
+    with pytest.raises(ValueError):
+        dag_shortest_path([[(1, 1)], [(2, 1)], [(0, 1)]])
+    with pytest.raises(ValueError):
+        dag_longest_path([[(1, 1)], []], 0, [0])
+    with pytest.raises(ValueError):
+        critical_path([[1], [0]], [1, 1])
+    with pytest.raises(ValueError):
+        critical_path([[1], []], [1])
+
+
+
+
+if __name__ == "__main__":
+    pytest.main(['-v', __file__])
@@ -0,0 +1,62 @@
+import pytest
+from pytest import approx
+from random import randint
+import numpy as np
+import scipy.sparse.csgraph as cs
+from mypkg.graphs.shortest_path.bellman_ford import NegativeCycleError
+from mypkg.graphs.shortest_path.johnson import johnson
+
+
+
+def test_johnson():
+    """
+    最大ノード数 M の (負サイクルを含みうる) 重み付き有向グラフをランダム生成することを Iteration 回行う。
+    それぞれについて全点対間最短距離を求め、 scipy.sparce.csgraph.johnson の結果と照合するストレステストを行う。
+    """
+    Iteration = 50
+    M = 30
+    inf = float('inf')
+    for _ in range(Iteration):
+        v = randint(2, M)
+        e = randint(v, 3 * v)
+
+        # ---- ndarray, csr_matrix, 隣接リスト生成 ----
+        mat = np.full((v, v), inf)
+        for i in range(e):
+            a, b = randint(0, v-1), randint(0, v-1)
+            if a == b:    # 自己ループはだめ
+                continue
+            mat[a, b] = randint(-M // 4, M)
+        csr = cs.csgraph_from_dense(mat, null_value=inf)
+        adj = [[] for _ in range(v)]
+        for i in range(v):
+            for j in range(v):
+                if mat[i, j] != inf:
+                    adj[i].append((j, int(mat[i, j])))
+
+        # ---- 結果の比較 ----
+        try:
+            dist_mat = cs.johnson(csr)
+            assert johnson(adj) == approx(dist_mat)
+        except cs._shortest_path.NegativeCycleError:
+            with pytest.raises(NegativeCycleError):
+                johnson(adj)
+
+
+
+def test_johnson_processes():
+    """ プロセスプールで並列に計算した結果が逐次計算の結果と一致するか """
+    M = 60
+    v = M
+    adj = [[] for _ in range(v)]
+    for _ in range(3 * v):
+        a, b = randint(0, v-1), randint(0, v-1)
+        if a != b:
+            adj[a].append((b, randint(0, M)))
+    assert johnson(adj, processes=2) == johnson(adj)
+
+
+
+
+if __name__ == "__main__":
+    pytest.main(['-v', __file__])
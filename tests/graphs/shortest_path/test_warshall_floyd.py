@@ -3,7 +3,8 @@ from pytest import approx
 from random import randint
 import numpy as np
 import scipy.sparse.csgraph as cs
-from mypkg.graphs.shortest_path.warshall_floyd import warshall_floyd
+from mypkg.graphs.shortest_path.bellman_ford import NegativeCycleError
+from mypkg.graphs.shortest_path.warshall_floyd import warshall_floyd, warshall_floyd_np
 
 
 
@@ -40,7 +41,39 @@ def test_warshall_floyd():
         # ---- 結果の比較 ----
         dist_mat = cs.floyd_warshall(csr, directed=False)
         assert warshall_floyd(adj_mat) == approx(dist_mat)
-            
+
+
+
+def test_warshall_floyd_np():
+    """
+    最大ノード数 M の (負サイクルを含みうる) 重み付き有向グラフをランダム生成することを Iteration 回行う。
+    それぞれについて全点対間最短距離を求め、 scipy.sparce.csgraph.floyd_warshall の結果と照合するストレステストを行う。
+    """
+    Iteration = 50
+    M = 30
+    inf = float('inf')
+    for _ in range(Iteration):
+        v = randint(2, M)
+        e = randint(v, v**2)
+
+        # ---- ndarray, csr_matrix 生成 ----
+        mat = np.full((v, v), inf)
+        for i in range(e):
+            a, b = randint(0, v-1), randint(0, v-1)
+            if a == b:    # 自己ループはだめ
+                continue
+            mat[a, b] = randint(-M // 4, M)
+        csr = cs.csgraph_from_dense(mat, null_value=inf)
+
+        # ---- 結果の比較 ----
+        try:
+            dist_mat = cs.floyd_warshall(csr)
+            assert warshall_floyd_np(mat) == approx(dist_mat)
+            assert warshall_floyd_np(mat.tolist()) == approx(dist_mat)
+        except cs._shortest_path.NegativeCycleError:
+            with pytest.raises(NegativeCycleError):
+                warshall_floyd_np(mat)
+
 
 
 
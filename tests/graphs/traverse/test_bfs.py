@@ -0,0 +1,68 @@
+import pytest
+from random import randint, sample
+from array import array
+import networkx as nx
+from mypkg.graphs.traverse.bfs import adj_to_csr, bfs, bfs_frontiers
+
+
+
+def test_bfs():
+    """
+    最大ノード数 M の有向グラフをランダム生成することを Iteration 回行う。
+    それぞれについてランダムな複数の始点からの BFS を (Python 版 / NumPy 版) x (top-down のみ / 方向最適化) で行い、
+    距離を networkx.multi_source_dijkstra_path_length と照合する。
+    また BFS 木の親が辺で結ばれていて距離が 1 小さいか、フロンティアが距離ごとに yield されるかも確かめる。
+    """
+    Iteration = 100
+    M = 60
+    for _ in range(Iteration):
+        n = randint(1, M)
+        G = nx.DiGraph()
+        G.add_nodes_from(range(n))
+        adj = [[] for _ in range(n)]
+        radj = [[] for _ in range(n)]
+        for _ in range(randint(0, 4 * n)):
+            a, b = randint(0, n-1), randint(0, n-1)
+            G.add_edge(a, b)
+            adj[a].append(b)
+            radj[b].append(a)
+        head, to = adj_to_csr(adj)
+        rhead, rto = adj_to_csr(radj)
+        sources = sample(range(n), randint(1, min(n, 3)))
+        lengths = nx.multi_source_dijkstra_path_length(G, sources)
+        expected = [lengths.get(v, -1) for v in range(n)]
+        for use_numpy in (False, True):
+            for direction_optimizing in (False, True):
+                dist, parent = bfs(head, to, sources, rhead, rto, direction_optimizing, use_numpy)
+                dist, parent = list(dist), list(parent)
+                assert dist == expected
+                for v in range(n):
+                    if dist[v] > 0:
+                        assert G.has_edge(parent[v], v) and dist[parent[v]] == dist[v] - 1
+                    else:
+                        assert parent[v] == -1
+
+        dist = array('i', [-1]) * n
+        parent = array('i', [-1]) * n
+        frontiers = [sorted(f) for f in bfs_frontiers(head, to, sources, dist, parent, rhead, rto)]
+        assert frontiers == [sorted(v for v in range(n) if expected[v] == d) for d in range(len(frontiers))]
+        assert sum(map(len, frontiers)) == sum(d >= 0 for d in expected)
+
+
+
+def test_bfs_undirected_low_diameter():
+    """ 無向グラフ (逆辺の CSR を省略) で、bottom-up に切り替わるような小直径のグラフでも正しく求まるか """
+    n = 2000
+    G = nx.gnm_random_graph(n, 10 * n, seed=1)
+    adj = [list(G.neighbors(v)) for v in range(n)]
+    head, to = adj_to_csr(adj)
+    lengths = nx.single_source_shortest_path_length(G, 0)
+    expected = [lengths.get(v, -1) for v in range(n)]
+    assert list(bfs(head, to, [0])[0]) == expected
+    assert bfs(head, to, [0], use_numpy=True)[0].tolist() == expected
+
+
+
+
+if __name__ == "__main__":
+    pytest.main(['-v', __file__])
@@ -0,0 +1,90 @@
+import pytest
+from random import randint
+import networkx as nx
+from mypkg.graphs.traverse.bipartite_predicate import bipartite_predicate, bipartite_coloring, BipartiteUnionFind
+
+
+
+def test_bipartite_coloring():
+    """
+    最大ノード数 M の (非連結でありうる) 単純無向グラフをランダム生成することを Iteration 回行う。
+    それぞれについて二部グラフ判定を networkx.is_bipartite と照合し、
+    二部グラフなら返された彩色が正しいか、そうでなければ返された頂点列が奇閉路になっているかを確かめる。
+    """
+    Iteration = 300
+    M = 20
+    for _ in range(Iteration):
+        n = randint(1, M)
+        G = nx.Graph()
+        G.add_nodes_from(range(n))
+        for _ in range(randint(0, n + 2)):
+            a, b = randint(0, n-1), randint(0, n-1)
+            if a != b:
+                G.add_edge(a, b)
+        adj = [list(G.neighbors(v)) for v in range(n)]
+        expected = nx.is_bipartite(G)
+        assert bipartite_predicate(adj) == expected
+        is_bipartite, res = bipartite_coloring(adj)
+        assert is_bipartite == expected
+        if is_bipartite:
+            assert all(res[u] != res[v] for u, v in G.edges())
+        else:
+            assert len(res) % 2 == 1 and len(set(res)) == len(res)
+            assert all(G.has_edge(res[i], res[i-1]) for i in range(len(res)))
+
+
+
+def test_bipartite_union_find():
+    """
+    最大ノード数 M のグラフに辺をランダムに一本ずつ追加することを Iteration 回行う。
+    追加のたびに BipartiteUnionFind の判定を networkx.is_bipartite と照合し、
+    二部グラフである間は same_color が networkx.bipartite.color の彩色と整合するかも確かめる。
+    """
+    Iteration = 100
+    M = 20
+    for _ in range(Iteration):
+        n = randint(1, M)
+        G = nx.Graph()
+        G.add_nodes_from(range(n))
+        uf = BipartiteUnionFind(n)
+        for _ in range(2 * n):
+            a, b = randint(0, n-1), randint(0, n-1)
+            G.add_edge(a, b)
+            ok = uf.add_edge(a, b)
+            expected = nx.is_bipartite(G)
+            assert uf.is_bipartite == expected
+            if not expected:
+                break
+            assert ok
+            color = nx.bipartite.color(G)
+            components = {v: i for i, c in enumerate(nx.connected_components(G)) for v in c}
+            for _ in range(10):
+                u, v = randint(0, n-1), randint(0, n-1)
+                if components[u] != components[v]:
+                    assert uf.same_color(u, v) is None
+                else:
+                    assert uf.same_color(u, v) == (color[u] == color[v])
+
+
+
+def test_bipartite_high_degree():
+    """ 次数の大きい頂点があっても O(V+E) で終わるか (星グラフ + 長いパス) """
+    n = 2 * 10**5
+    adj = [[] for _ in range(n)]
+    for v in range(1, n // 2):
+        adj[0].append(v)
+        adj[v].append(0)
+    for v in range(n // 2, n - 1):
+        adj[v].append(v+1)
+        adj[v+1].append(v)
+    assert bipartite_predicate(adj)
+    adj[n-1].append(n-3)
+    adj[n-3].append(n-1)
+    is_bipartite, cycle = bipartite_coloring(adj)
+    assert not is_bipartite and sorted(cycle) == [n-3, n-2, n-1]
+
+
+
+
+if __name__ == "__main__":
+    pytest.main(['-v', __file__])
@@ -0,0 +1,184 @@
+import pytest
+from random import randint, shuffle
+import networkx as nx
+from mypkg.graphs.traverse.bridge_joint import bridge_detect, articulation_detect, contract_from_cycle, LowlinkDecomposition
+
+
+
+def test_bridge_detect():
+    """
+    最大ノード数 M の連結な単純無向グラフをランダム生成することを Iteration 回行う。
+    それぞれについて橋を検出し、networkx.bridges の結果と照合する。
+    また、二重連結成分分解の結果が 2-edge-connected components と一致するか確かめる。
+    """
+    Iteration = 100
+    M = 30
+    for _ in range(Iteration):
+        n = randint(2, M)
+        G = nx.Graph()
+        G.add_nodes_from(range(n))
+        # 連結を保証
+        for v in range(1, n):
+            G.add_edge(randint(0, v-1), v)
+        for _ in range(randint(0, n)):
+            a, b = randint(0, n-1), randint(0, n-1)
+            if a != b:
+                G.add_edge(a, b)
+        adj = [list(G.neighbors(v)) for v in range(n)]
+        for a in adj:
+            shuffle(a)
+
+        bridge, cycle_graph = bridge_detect(adj, randint(0, n-1))
+        assert set(frozenset(e) for e in bridge) == set(frozenset(e) for e in nx.bridges(G))
+        vertex_to_group_num, bi_connected = contract_from_cycle(bridge, cycle_graph)
+        got = dict()
+        for v, g in enumerate(vertex_to_group_num):
+            got.setdefault(g, set()).add(v)
+        assert set(frozenset(c) for c in got.values()) == set(frozenset(c) for c in nx.k_edge_components(G, 2))
+        assert sum(map(len, bi_connected)) == 2 * len(bridge)
+
+
+
+def test_articulation_detect():
+    """
+    最大ノード数 M の連結な単純無向グラフをランダム生成することを Iteration 回行う。
+    それぞれについて関節点を検出し、networkx.articulation_points の結果と照合する。
+    """
+    Iteration = 100
+    M = 30
+    for _ in range(Iteration):
+        n = randint(2, M)
+        G = nx.Graph()
+        G.add_nodes_from(range(n))
+        for v in range(1, n):
+            G.add_edge(randint(0, v-1), v)
+        for _ in range(randint(0, n // 2)):
+            a, b = randint(0, n-1), randint(0, n-1)
+            if a != b:
+                G.add_edge(a, b)
+        adj = [list(G.neighbors(v)) for v in range(n)]
+        for a in adj:
+            shuffle(a)
+        assert sorted(articulation_detect(adj, randint(0, n-1))) == sorted(nx.articulation_points(G))
+
+
+
+def test_long_path():
+    """ 再帰を用いていないので、長いパスグラフでも RecursionError とならないか """
+    n = 2 * 10**5
+    adj = [[1]] + [[i-1, i+1] for i in range(1, n-1)] + [[n-2]]
+    bridge, cycle_graph = bridge_detect(adj, 0)
+    assert len(bridge) == n-1
+    assert sorted(articulation_detect(adj, 0)) == list(range(1, n-1))
+    vertex_to_group_num, _ = contract_from_cycle(bridge, cycle_graph)
+    assert vertex_to_group_num == list(range(n))
+
+
+
+
+def _partition(labels):
+    """ ラベルの列を、同じラベルを持つ添字の集合の集合にする (ラベル -1 は除く) """
+    groups = dict()
+    for i, g in enumerate(labels):
+        if g != -1:
+            groups.setdefault(g, set()).add(i)
+    return set(frozenset(c) for c in groups.values())
+
+
+def _csr_edges(head, adj):
+    """ CSR 形式の無向グラフの辺を (小さい方, 大きい方) のリストにする (各辺は両方向に現れるので 2 回ずつ含まれる) """
+    return sorted((min(x, y), max(x, y)) for x in range(len(head) - 1) for y in adj[head[x]:head[x+1]])
+
+
+def test_lowlink_decomposition():
+    """
+    最大ノード数 M の非連結な無向グラフ (多重辺、自己ループ、孤立点を含む) をランダム生成することを Iteration 回行う。
+    それぞれについて LowlinkDecomposition の結果を、
+    橋と関節点は 1 本の辺 (1 つの頂点) を取り除いた時の連結成分数の増加と、
+    二重辺連結成分は橋を取り除いたグラフの連結成分と、
+    ブロックは多重辺と自己ループを除いた単純グラフに対する networkx.biconnected_component_edges と照合する。
+    bridge tree と block-cut tree が期待する辺を持つ森であることも確かめる。
+    """
+    Iteration = 200
+    M = 20
+    for _ in range(Iteration):
+        n = randint(1, M)
+        m = randint(0, 2 * n)
+        us = [randint(0, n-1) for _ in range(m)]
+        vs = [randint(0, n-1) if randint(0, 2) else max(0, us[i] - randint(0, 2)) for i in range(m)]
+        G = nx.MultiGraph()
+        G.add_nodes_from(range(n))
+        G.add_edges_from((us[i], vs[i], i) for i in range(m))
+        d = LowlinkDecomposition(n, us, vs)
+        count = nx.number_connected_components(G)
+
+        bridges = []
+        for i in range(m):
+            H = G.copy()
+            H.remove_edge(us[i], vs[i], i)
+            if nx.number_connected_components(H) > count:
+                bridges.append(i)
+        assert list(d.bridges) == bridges
+        articulation = []
+        for v in range(n):
+            H = G.copy()
+            H.remove_node(v)
+            if nx.number_connected_components(H) > count - (G.degree(v) == 2 * G.number_of_edges(v, v)):
+                articulation.append(v)
+        assert list(d.articulation) == articulation
+
+        H = G.copy()
+        H.remove_edges_from((us[i], vs[i], i) for i in bridges)
+        assert _partition(d.two_edge_id) == set(frozenset(c) for c in nx.connected_components(H))
+        assert d.two_edge_count == nx.number_connected_components(H)
+        assert _csr_edges(d.bridge_tree_head, d.bridge_tree_adj) == sorted(
+            tuple(sorted((d.two_edge_id[us[i]], d.two_edge_id[vs[i]]))) for i in bridges for _ in range(2))
+
+        simple = nx.Graph(G)
+        simple.remove_edges_from(list(nx.selfloop_edges(simple)))
+        # 多重辺は同じブロックに属するので、ブロックを単純グラフの辺の集合として比べる
+        assert all(d.block_id[i] == -1 for i in range(m) if us[i] == vs[i])
+        got = [frozenset(frozenset((us[i], vs[i])) for i in c) for c in _partition(d.block_id)]
+        assert len(got) == d.block_count and len(set(got)) == d.block_count
+        expected = set(frozenset(frozenset(e) for e in c) for c in nx.biconnected_component_edges(simple))
+        assert set(got) == expected
+
+        # block-cut tree: ブロック b と関節点 articulation[k] (頂点 block_count + k) が結ばれる <=> 関節点がブロックに含まれる
+        B = d.block_count
+        tree_edges = []
+        for c in _partition(d.block_id):
+            b = d.block_id[next(iter(c))]
+            vertices = set(us[i] for i in c) | set(vs[i] for i in c)
+            for k, v in enumerate(articulation):
+                if v in vertices:
+                    tree_edges += [(b, B + k)] * 2
+            for v in vertices:
+                assert d.vertex_node[v] == (B + articulation.index(v) if v in articulation else b)
+        assert _csr_edges(d.block_cut_head, d.block_cut_adj) == sorted(tree_edges)
+        T = nx.Graph()
+        T.add_nodes_from(range(B + len(articulation)))
+        T.add_edges_from(tree_edges)
+        assert len(T) == 0 or nx.is_forest(T)
+        assert all(d.vertex_node[v] == -1 for v in range(n) if simple.degree(v) == 0)
+
+
+
+def test_lowlink_decomposition_long_path():
+    """ 長いパスグラフ (全ての辺が橋) と、多重辺で 2 重にしたパスグラフ (橋なし) でも RecursionError とならず正しく求まるか """
+    n = 10**5
+    us, vs = list(range(n-1)), list(range(1, n))
+    d = LowlinkDecomposition(n, us, vs)
+    assert list(d.bridges) == list(range(n-1))
+    assert list(d.articulation) == list(range(1, n-1))
+    assert d.two_edge_count == n and d.block_count == n-1
+    d = LowlinkDecomposition(n, us + vs, vs + us)
+    assert len(d.bridges) == 0 and d.two_edge_count == 1
+    assert list(d.articulation) == list(range(1, n-1)) and d.block_count == n-1
+    with pytest.raises(ValueError):
+        LowlinkDecomposition(3, [0, 1], [1])
+
+
+
+
+if __name__ == "__main__":
+    pytest.main(['-v', __file__])
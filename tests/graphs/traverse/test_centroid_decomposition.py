@@ -0,0 +1,71 @@
+import pytest
+from random import randint
+from collections import deque
+from mypkg.graphs.traverse.centroid_decomposition import CentroidDecomposition
+
+
+
+def _bfs_dist(adj, s):
+    dist = [-1] * len(adj)
+    dist[s] = 0
+    q = deque([s])
+    while q:
+        u = q.popleft()
+        for v in adj[u]:
+            if dist[v] < 0:
+                dist[v] = dist[u] + 1
+                q.append(v)
+    return dist
+
+
+
+def test_centroid_decomposition():
+    """
+    最大ノード数 M の木をランダム生成することを Iteration 回行う。
+    それぞれについて distance, count_within, および mark を挟みながらの nearest_marked を、
+    各頂点からの BFS による愚直な計算と照合する。また centroid tree の深さが O(lgn) に収まるかも確かめる。
+    """
+    Iteration = 100
+    M = 60
+    for _ in range(Iteration):
+        n = randint(1, M)
+        adj = [[] for _ in range(n)]
+        for v in range(1, n):
+            p = randint(0, v-1)
+            adj[p].append(v)
+            adj[v].append(p)
+        dist = [_bfs_dist(adj, s) for s in range(n)]
+        cd = CentroidDecomposition(adj)
+        assert max(cd.level) < n.bit_length()
+        marked = []
+        for _ in range(30):
+            u, v = randint(0, n-1), randint(0, n-1)
+            assert cd.distance(u, v) == dist[u][v]
+            d = randint(0, n)
+            assert cd.count_within(v, d) == sum(x <= d for x in dist[v])
+            if randint(0, 2) == 0:
+                cd.mark(u)
+                marked.append(u)
+            assert cd.nearest_marked(v) == min((dist[v][w] for w in marked), default=float('inf'))
+
+
+
+def test_centroid_decomposition_long_path():
+    """ 再帰を用いていないので、長いパスグラフでも RecursionError とならないか """
+    n = 10**5
+    adj = [[] for _ in range(n)]
+    for v in range(1, n):
+        adj[v-1].append(v)
+        adj[v].append(v-1)
+    cd = CentroidDecomposition(adj)
+    assert max(cd.level) < n.bit_length()
+    assert cd.count_within(0, 10) == 11
+    assert cd.distance(0, n-1) == n-1
+    cd.mark(n-1)
+    assert cd.nearest_marked(0) == n-1
+
+
+
+
+if __name__ == "__main__":
+    pytest.main(['-v', __file__])
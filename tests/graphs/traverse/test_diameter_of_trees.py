@@ -0,0 +1,40 @@
+import pytest
+from random import randint
+import networkx as nx
+from mypkg.graphs.traverse.diameter_of_trees import diameter_of_tree
+
+
+
+def test_diameter_of_tree():
+    """
+    最大ノード数 M の木をランダム生成することを Iteration 回行う。
+    それぞれについて木の直径を求め、networkx.diameter の結果と照合する。
+    """
+    Iteration = 100
+    M = 50
+    for _ in range(Iteration):
+        n = randint(2, M)
+        G = nx.Graph()
+        adj = [[] for _ in range(n)]
+        for v in range(1, n):
+            p = randint(0, v-1)
+            G.add_edge(p, v)
+            adj[p].append(v)
+            adj[v].append(p)
+        (u, v), d = diameter_of_tree(adj, randint(0, n-1))
+        assert d == nx.diameter(G)
+        assert nx.shortest_path_length(G, u, v) == d
+
+
+
+def test_diameter_of_tree_long_path():
+    """ 再帰を用いていないので、長いパスグラフでも RecursionError とならないか """
+    n = 2 * 10**5
+    adj = [[1]] + [[i-1, i+1] for i in range(1, n-1)] + [[n-2]]
+    assert diameter_of_tree(adj, 0) == ((n-1, 0), n-1)
+
+
+
+
+if __name__ == "__main__":
+    pytest.main(['-v', __file__])
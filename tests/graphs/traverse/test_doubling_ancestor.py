@@ -0,0 +1,63 @@
+import pytest
+from random import randint
+import networkx as nx
+from mypkg.graphs.traverse.doubling_ancestor import DoublingTree
+
+
+
+def test_doubling_tree():
+    """
+    最大ノード数 M の木をランダム生成し、ランダムな根をとることを Iteration 回行う。
+    それぞれについて kth_ancestor, kth_ancestor_batch (NumPy 版含む), calc_LCA の結果を
+    親を一つずつ遡る愚直な計算および networkx.tree_all_pairs_lowest_common_ancestor と照合する。
+    """
+    Iteration = 100
+    M = 50
+    for _ in range(Iteration):
+        n = randint(1, M)
+        root = randint(0, n-1)
+        adj = [[] for _ in range(n)]
+        G = nx.Graph()
+        G.add_node(0)
+        for v in range(1, n):
+            p = randint(0, v-1)
+            adj[p].append(v)
+            adj[v].append(p)
+            G.add_edge(p, v)
+        T = nx.bfs_tree(G, root)
+        parent = {v: u for u, v in T.edges()}
+
+        tree = DoublingTree(adj, root)
+        assert DoublingTree(adj, root, use_numpy=True).up == tree.up
+        queries = [(randint(0, n-1), randint(0, n-1)) for _ in range(30)]
+        expected = []
+        for i, k in queries:
+            v = i
+            for _ in range(k):
+                v = parent.get(v, -1)
+                if v == -1:
+                    break
+            expected.append(v)
+            assert tree.kth_ancestor(i, k) == v
+        nodes, ks = [i for i, _ in queries], [k for _, k in queries]
+        assert tree.kth_ancestor_batch(nodes, ks) == expected
+        assert tree.kth_ancestor_batch(nodes, ks, use_numpy=True).tolist() == expected
+
+        lca = dict(nx.tree_all_pairs_lowest_common_ancestor(T, root, pairs=queries))
+        assert [tree.calc_LCA(u, v) for u, v in queries] == [lca[pair] for pair in queries]
+
+
+
+def test_kth_ancestor_too_large():
+    """ k が頂点数以上の場合 ValueError があげられるか """
+    tree = DoublingTree([[1], [0]], 0)
+    with pytest.raises(ValueError):
+        tree.kth_ancestor(1, 2)
+    with pytest.raises(ValueError):
+        tree.kth_ancestor_batch([0, 1], [0, 2])
+
+
+
+
+if __name__ == "__main__":
+    pytest.main(['-v', __file__])
@@ -0,0 +1,129 @@
+import pytest
+from random import randint, sample
+from array import array
+import networkx as nx
+from mypkg.graphs.traverse.grid_graph import grid_bfs, grid_01bfs, grid_dijkstra, grid_connected_components
+
+
+
+def _random_grid(H, W):
+    """ 値が 0 (壁), 1, 2, ... のランダムなグリッド。bytearray と array('i') のどちらかで返す """
+    values = [0 if randint(0, 3) == 0 else randint(1, 9) for _ in range(H * W)]
+    return bytearray(values) if randint(0, 1) else array('i', values)
+
+
+def _grid_digraph(grid, H, W, neighborhood, wall, cost):
+    """ マス u から隣接する壁でないマス v に重み cost(grid[v]) の辺を張った networkx.DiGraph """
+    G = nx.DiGraph()
+    G.add_nodes_from(range(H * W))
+    moves = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+    if neighborhood == 8:
+        moves += [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+    for r in range(H):
+        for c in range(W):
+            for dr, dc in moves:
+                rr, cc = r + dr, c + dc
+                if 0 <= rr < H and 0 <= cc < W and not wall(grid[rr*W+cc]):
+                    G.add_edge(r*W+c, rr*W+cc, weight=cost(grid[rr*W+cc]))
+    return G
+
+
+
+def test_grid_shortest_paths():
+    """
+    最大 M×M のランダムなグリッドを生成することを Iteration 回行う。
+    それぞれについて 4 近傍と 8 近傍で、壁でないランダムな複数の始点からの grid_bfs, grid_01bfs, grid_dijkstra の結果を、
+    同じグリッドを明示的に有向グラフにしたものに対する networkx.multi_source_dijkstra_path_length と照合する。
+    """
+    Iteration = 100
+    M = 12
+    wall = lambda c: c == 0
+    for _ in range(Iteration):
+        H, W = randint(1, M), randint(1, M)
+        grid = _random_grid(H, W)
+        open_cells = [i for i in range(H * W) if grid[i] != 0]
+        if not open_cells:
+            continue
+        sources = sample(open_cells, randint(1, min(3, len(open_cells))))
+        for neighborhood in (4, 8):
+            for func, cost in ((grid_bfs, lambda c: 1),
+                               (grid_01bfs, lambda c: c % 2),
+                               (grid_dijkstra, lambda c: c)):
+                G = _grid_digraph(grid, H, W, neighborhood, wall, cost)
+                lengths = nx.multi_source_dijkstra_path_length(G, sources)
+                if func is grid_bfs:
+                    dist = func(grid, H, W, sources, wall, neighborhood)
+                else:
+                    dist = func(grid, H, W, sources, cost, wall, neighborhood)
+                unreachable = float('inf') if func is grid_dijkstra else -1
+                assert list(dist) == [lengths.get(i, unreachable) for i in range(H * W)]
+
+
+
+def test_grid_connected_components():
+    """
+    最大 M×M のランダムなグリッドを生成することを Iteration 回行う。
+    それぞれについて 4 近傍と 8 近傍での連結成分のラベリングを networkx.connected_components と照合し、
+    NumPy 版が Python 版と全く同じラベルを返すかも確かめる。
+    """
+    Iteration = 200
+    M = 15
+    wall = lambda c: c == 0
+    for _ in range(Iteration):
+        H, W = randint(1, M), randint(1, M)
+        grid = _random_grid(H, W)
+        for neighborhood in (4, 8):
+            G = _grid_digraph(grid, H, W, neighborhood, wall, lambda c: 1).to_undirected()
+            G.remove_nodes_from([i for i in range(H * W) if grid[i] == 0])
+            components = sorted(sorted(c) for c in nx.connected_components(G))
+            count, label = grid_connected_components(grid, H, W, wall, neighborhood)
+            assert count == len(components)
+            assert [label[c[0]] for c in components] == list(range(count))
+            assert all(label[v] == k for k, c in enumerate(components) for v in c)
+            assert all(label[i] == -1 for i in range(H * W) if grid[i] == 0)
+            count_np, label_np = grid_connected_components(grid, H, W, wall, neighborhood, use_numpy=True)
+            assert count_np == count and label_np.tolist() == list(label)
+
+
+
+def test_grid_snake_maze():
+    """ 蛇行した一本道の迷路 (直径が非常に大きい) でも BFS と NumPy 版のラベリングが正しく求まるか """
+    H, W = 201, 200
+    rows = []
+    for r in range(H):
+        if r % 2 == 0:
+            rows.append("." * W)
+        elif r % 4 == 1:
+            rows.append("#" * (W - 1) + ".")
+        else:
+            rows.append("." + "#" * (W - 1))
+    grid = bytearray("".join(rows).encode())
+    wall = lambda c: c == ord('#')
+    dist = grid_bfs(grid, H, W, [0], wall)
+    assert max(dist) == dist[(H - 1) * W + W - 1] == (H // 2 + 1) * W - 1 + H // 2
+    count, label = grid_connected_components(grid, H, W, wall, use_numpy=True)
+    assert count == 1 and set(label.tolist()) == {0, -1}
+    with pytest.raises(ValueError):
+        grid_bfs(grid, H, W, [0], wall, neighborhood=6)
+
+
+
+
+def test_grid_wall_source():
+    """ 壁のマスを始点に含めても、そこから探索が広がらず (壁のマスは到達不能のまま)、範囲外の始点は ValueError となるか """
+    grid, H, W = bytearray(b"#..#."), 1, 5
+    wall = lambda c: c == ord('#')
+    assert list(grid_bfs(grid, H, W, [0], wall)) == [-1] * 5
+    assert list(grid_bfs(grid, H, W, [0, 2], wall)) == [-1, 1, 0, -1, -1]
+    assert list(grid_01bfs(grid, H, W, [3], lambda c: 1, wall)) == [-1] * 5
+    assert grid_dijkstra(grid, H, W, [3, 4], lambda c: 1, wall) == [float('inf')] * 4 + [0]
+    for func, args in ((grid_bfs, ()), (grid_01bfs, (lambda c: 1,)), (grid_dijkstra, (lambda c: 1,))):
+        for s in (-1, H * W):
+            with pytest.raises(ValueError):
+                func(grid, H, W, [s], *args, wall)
+
+
+
+
+if __name__ == "__main__":
+    pytest.main(['-v', __file__])
@@ -0,0 +1,132 @@
+import pytest
+import operator as op
+from random import randint
+from mypkg.graphs.traverse.heavy_light_decomposition import HeavyLightDecomposition, HLDSegTree
+
+
+
+def _random_tree(n):
+    adj = [[] for _ in range(n)]
+    for v in range(1, n):
+        p = randint(0, v-1)
+        adj[p].append(v)
+        adj[v].append(p)
+    return adj
+
+
+def _naive_path(adj, root, u, v):
+    """ 根からの BFS で親と深さを求め、u-v パス上の頂点のリストと LCA を愚直に求める """
+    n = len(adj)
+    parent = [-1] * n
+    depth = [0] * n
+    order = [root]
+    seen = [False] * n
+    seen[root] = True
+    for x in order:
+        for y in adj[x]:
+            if not seen[y]:
+                seen[y] = True
+                parent[y] = x
+                depth[y] = depth[x] + 1
+                order.append(y)
+    path = []
+    while depth[u] > depth[v]:
+        path.append(u)
+        u = parent[u]
+    while depth[v] > depth[u]:
+        path.append(v)
+        v = parent[v]
+    while u != v:
+        path.append(u)
+        path.append(v)
+        u, v = parent[u], parent[v]
+    return path, u
+
+
+
+def test_heavy_light_decomposition():
+    """
+    最大ノード数 M の木をランダム生成し、ランダムな根をとることを Iteration 回行う。
+    それぞれについて path_ranges, calc_LCA, subtree_range の結果を愚直な計算と照合する。
+    """
+    Iteration = 100
+    M = 50
+    for _ in range(Iteration):
+        n = randint(1, M)
+        adj = _random_tree(n)
+        root = randint(0, n-1)
+        hld = HeavyLightDecomposition(adj, root)
+        assert sorted(hld.pos) == list(range(n))
+        for _ in range(20):
+            u, v = randint(0, n-1), randint(0, n-1)
+            path, lca = _naive_path(adj, root, u, v)
+            assert hld.calc_LCA(u, v) == lca
+            got = [hld.order[i] for l, r in hld.path_ranges(u, v) for i in range(l, r)]
+            assert sorted(got) == sorted(path + [lca])
+            got = [hld.order[i] for l, r in hld.path_ranges(u, v, edge=True) for i in range(l, r)]
+            assert sorted(got) == sorted(path)
+        for u in range(n):
+            l, r = hld.subtree_range(u)
+            assert all(_naive_path(adj, root, hld.order[i], u)[1] == u for i in range(l, r))
+            assert r - l == sum(_naive_path(adj, root, w, u)[1] == u for w in range(n))
+
+
+
+def test_hld_segtree():
+    """
+    最大ノード数 M の木と頂点の値をランダム生成することを Iteration 回行う。
+    path_query (和、最大値), subtree_query, path_update, update を愚直な計算と照合する。
+    """
+    Iteration = 50
+    M = 50
+    for _ in range(Iteration):
+        n = randint(1, M)
+        adj = _random_tree(n)
+        root = randint(0, n-1)
+        values = [randint(-100, 100) for _ in range(n)]
+        path_sum = HLDSegTree(adj, root, values, 0, op.add)
+        path_max = HLDSegTree(adj, root, values, float('-inf'), max)
+        for _ in range(30):
+            u, v = randint(0, n-1), randint(0, n-1)
+            path, lca = _naive_path(adj, root, u, v)
+            t = randint(0, 3)
+            if t == 0:
+                assert path_sum.path_query(u, v) == sum(values[w] for w in path + [lca])
+                assert path_max.path_query(u, v) == max(values[w] for w in path + [lca])
+                assert path_sum.path_query(u, v, edge=True) == sum(values[w] for w in path)
+            elif t == 1:
+                members = [w for w in range(n) if _naive_path(adj, root, w, u)[1] == u]
+                assert path_sum.subtree_query(u) == sum(values[w] for w in members)
+                assert path_max.subtree_query(u) == max(values[w] for w in members)
+            elif t == 2:
+                x = randint(-100, 100)
+                path_sum.path_update(u, v, x)
+                path_max.path_update(u, v, x)
+                for w in path + [lca]:
+                    values[w] = x
+            else:
+                x = randint(-100, 100)
+                path_sum.update(u, x)
+                path_max.update(u, x)
+                values[u] = x
+            assert [path_sum.get(w) for w in range(n)] == values
+
+
+
+def test_hld_long_path():
+    """ 再帰を用いていないので、長いパスグラフでも RecursionError とならないか """
+    n = 2 * 10**5
+    adj = [[] for _ in range(n)]
+    for v in range(1, n):
+        adj[v-1].append(v)
+        adj[v].append(v-1)
+    hld = HLDSegTree(adj, 0, list(range(n)), 0, op.add)
+    assert hld.path_query(0, n-1) == n * (n - 1) // 2
+    assert hld.calc_LCA(n-1, n//2) == n//2
+    assert len(hld.path_ranges(0, n-1)) == 1
+
+
+
+
+if __name__ == "__main__":
+    pytest.main(['-v', __file__])
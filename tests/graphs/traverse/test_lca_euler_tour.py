@@ -0,0 +1,56 @@
+import pytest
+from random import randint
+import networkx as nx
+from mypkg.graphs.traverse.lca_euler_tour import EulerTourLCA, offline_lca
+
+
+
+def test_lca():
+    """
+    最大ノード数 M の木をランダム生成し、ランダムな根をとることを Iteration 回行う。
+    それぞれについて Q 個のクエリの最小共通祖先を EulerTourLCA と offline_lca で求め、
+    networkx.tree_all_pairs_lowest_common_ancestor の結果と照合する。
+    """
+    Iteration = 100
+    M = 50
+    Q = 50
+    for _ in range(Iteration):
+        n = randint(1, M)
+        root = randint(0, n-1)
+        adj = [[] for _ in range(n)]
+        G = nx.Graph()
+        G.add_node(0)
+        for v in range(1, n):
+            p = randint(0, v-1)
+            adj[p].append(v)
+            adj[v].append(p)
+            G.add_edge(p, v)
+        queries = [(randint(0, n-1), randint(0, n-1)) for _ in range(Q)]
+        T = nx.bfs_tree(G, root)
+        expected = dict(nx.tree_all_pairs_lowest_common_ancestor(T, root, pairs=queries))
+        expected = [expected[pair] for pair in queries]
+
+        tree = EulerTourLCA(adj, root)
+        assert [tree.calc_LCA(u, v) for u, v in queries] == expected
+        assert tree.calc_LCA_batch([u for u, _ in queries], [v for _, v in queries]) == expected
+        assert offline_lca(adj, root, queries) == expected
+
+
+
+def test_lca_long_path():
+    """ 再帰を用いていないので、長いパスグラフでも RecursionError とならないか """
+    n = 2 * 10**5
+    adj = [[] for _ in range(n)]
+    for v in range(1, n):
+        adj[v-1].append(v)
+        adj[v].append(v-1)
+    queries = [(n-1, n//2), (0, n-1), (n//3, n//3)]
+    expected = [n//2, 0, n//3]
+    assert EulerTourLCA(adj, 0).calc_LCA_batch(*zip(*queries)) == expected
+    assert offline_lca(adj, 0, queries) == expected
+
+
+
+
+if __name__ == "__main__":
+    pytest.main(['-v', __file__])
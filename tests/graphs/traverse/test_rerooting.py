@@ -0,0 +1,55 @@
+import pytest
+from random import randint
+import networkx as nx
+from mypkg.graphs.traverse.rerooting import rerooting
+
+
+
+def test_rerooting():
+    """
+    最大ノード数 M の木をランダム生成することを Iteration 回行う。
+    それぞれについて全方位木 DP で全頂点の離心率と全頂点への距離の総和を求め、
+    networkx.eccentricity および networkx.shortest_path_length による結果と照合する。
+    また、最初の根をどこにとっても結果が変わらないかも確かめる。
+    """
+    Iteration = 100
+    M = 50
+    for _ in range(Iteration):
+        n = randint(1, M)
+        adj = [[] for _ in range(n)]
+        G = nx.Graph()
+        G.add_node(0)
+        for v in range(1, n):
+            p = randint(0, v-1)
+            adj[p].append(v)
+            adj[v].append(p)
+            G.add_edge(p, v)
+        root = randint(0, n-1)
+
+        ecc = rerooting(adj, max, 0, lambda x, v: x + 1, root)
+        expected = nx.eccentricity(G)
+        assert [x - 1 for x in ecc] == [expected[v] for v in range(n)]
+
+        dist_sum = rerooting(adj, lambda a, b: (a[0] + b[0], a[1] + b[1]), (0, 0),
+                             lambda x, v: (x[0] + 1, x[1] + x[0] + 1), root)
+        lengths = dict(nx.shortest_path_length(G))
+        assert [d - n for _, d in dist_sum] == [sum(lengths[v].values()) for v in range(n)]
+        assert all(s == n for s, _ in dist_sum)
+
+
+
+def test_rerooting_long_path():
+    """ 再帰を用いていないので、長いパスグラフでも RecursionError とならないか """
+    n = 2 * 10**5
+    adj = [[] for _ in range(n)]
+    for v in range(1, n):
+        adj[v-1].append(v)
+        adj[v].append(v-1)
+    ecc = rerooting(adj, max, 0, lambda x, v: x + 1)
+    assert [x - 1 for x in ecc] == [max(v, n-1-v) for v in range(n)]
+
+
+
+
+if __name__ == "__main__":
+    pytest.main(['-v', __file__])
@@ -0,0 +1,93 @@
+import pytest
+from random import randint
+import networkx as nx
+from mypkg.graphs.traverse.strongly_connected_components import scc, contract_from_group, tarjan_scc, condensation
+
+
+
+def test_scc():
+    """
+    最大ノード数 M の有向グラフをランダム生成することを Iteration 回行う。
+    それぞれについて強連結成分分解を行い、networkx.strongly_connected_components の結果と照合する。
+    また、グループ番号がトポロジカル順になっているかも確かめる。
+    """
+    Iteration = 100
+    M = 30
+    for _ in range(Iteration):
+        n = randint(1, M)
+        G = nx.DiGraph()
+        G.add_nodes_from(range(n))
+        adj = [[] for _ in range(n)]
+        radj = [[] for _ in range(n)]
+        for _ in range(randint(0, 2 * n)):
+            a, b = randint(0, n-1), randint(0, n-1)
+            G.add_edge(a, b)
+            adj[a].append(b)
+            radj[b].append(a)
+
+        group_num, vertex_to_group_num = scc(adj, radj)
+        expected = set(frozenset(c) for c in nx.strongly_connected_components(G))
+        got = [set() for _ in range(group_num)]
+        for v, g in enumerate(vertex_to_group_num):
+            got[g].add(v)
+        assert set(frozenset(c) for c in got) == expected
+        DAG, _ = contract_from_group(adj, group_num, vertex_to_group_num)
+        assert all(i < j for i in range(group_num) for j in DAG[i])
+
+
+
+def test_tarjan_scc():
+    """
+    最大ノード数 M の有向グラフをランダム生成することを Iteration 回行う。
+    それぞれについて Tarjan 法で強連結成分分解を行い、networkx の結果と照合する。
+    また、condensation() による DAG が networkx.condensation と一致し、辺に重複がないかも確かめる。
+    """
+    Iteration = 100
+    M = 30
+    for _ in range(Iteration):
+        n = randint(1, M)
+        G = nx.DiGraph()
+        G.add_nodes_from(range(n))
+        adj = [[] for _ in range(n)]
+        for _ in range(randint(0, 2 * n)):
+            a, b = randint(0, n-1), randint(0, n-1)
+            G.add_edge(a, b)
+            adj[a].append(b)
+
+        group_num, vertex_to_group_num = tarjan_scc(adj)
+        expected = set(frozenset(c) for c in nx.strongly_connected_components(G))
+        head, dag, member_head, members = condensation(adj, group_num, vertex_to_group_num)
+        got = [frozenset(members[member_head[k]:member_head[k+1]]) for k in range(group_num)]
+        assert set(got) == expected and len(got) == len(expected)
+        assert all(vertex_to_group_num[v] == k for k in range(group_num) for v in got[k])
+        edges = [(got[k], got[dag[i]]) for k in range(group_num) for i in range(head[k], head[k+1])]
+        assert len(edges) == len(set(edges))
+        assert all(k < dag[i] for k in range(group_num) for i in range(head[k], head[k+1]))
+        C = nx.condensation(G)
+        members_of = C.graph['mapping']
+        expected_edges = set()
+        for a, b in C.edges():
+            expected_edges.add((frozenset(v for v in range(n) if members_of[v] == a),
+                                frozenset(v for v in range(n) if members_of[v] == b)))
+        assert set(edges) == expected_edges
+
+
+
+def test_scc_long_path():
+    """ 再帰を用いていないので、長いパスグラフでも RecursionError とならないか """
+    n = 2 * 10**5
+    adj = [[i+1] for i in range(n-1)] + [[0]]    # 一つの大きなサイクル
+    radj = [[n-1]] + [[i-1] for i in range(1, n)]
+    assert scc(adj, radj) == (1, [0] * n)
+    adj[-1] = []
+    radj[0] = []
+    assert scc(adj, radj) == (n, list(range(n)))
+    assert tarjan_scc(adj) == (n, list(range(n)))
+    adj[-1] = [0]
+    assert tarjan_scc(adj) == (1, [0] * n)
+
+
+
+
+if __name__ == "__main__":
+    pytest.main(['-v', __file__])
@@ -0,0 +1,97 @@
+import pytest
+from random import randint, sample
+import networkx as nx
+from mypkg.graphs.traverse.topological_sort import topological_bfs, topological_dfs, topological_sort, topological_levels
+
+
+
+def test_topological_sort():
+    """
+    最大ノード数 M の DAG をランダム生成することを Iteration 回行う。
+    それぞれについてトポロジカルソートを行い、全ての辺が順方向になっているか確かめる。
+    """
+    Iteration = 100
+    M = 30
+    for _ in range(Iteration):
+        n = randint(1, M)
+        perm = sample(range(n), n)    # perm の順に辺を張れば DAG となる
+        adj = [[] for _ in range(n)]
+        for _ in range(randint(0, 2 * n)):
+            a, b = randint(0, n-1), randint(0, n-1)
+            if a < b:
+                adj[perm[a]].append(perm[b])
+        for result in (topological_bfs(adj), topological_dfs(adj)):
+            assert sorted(result) == list(range(n))
+            position = [0] * n
+            for i, v in enumerate(result):
+                position[v] = i
+            assert all(position[u] < position[v] for u in range(n) for v in adj[u])
+
+
+
+def test_topological_sort_and_levels():
+    """
+    最大ノード数 M の (閉路を含みうる) 有向グラフをランダム生成することを Iteration 回行う。
+    それぞれについて topological_sort (3 つの method) と topological_levels の DAG 判定を networkx.is_directed_acyclic_graph と照合し、
+    DAG なら順序の正しさ、辞書順最小性 (networkx.lexicographical_topological_sort)、各レベルが最長パスの長さと一致するかを、
+    そうでなければ返された頂点列が閉路になっているかを確かめる。
+    """
+    Iteration = 300
+    M = 15
+    for _ in range(Iteration):
+        n = randint(1, M)
+        perm = sample(range(n), n)
+        adj = [[] for _ in range(n)]
+        for _ in range(randint(0, 2 * n)):
+            a, b = randint(0, n-1), randint(0, n-1)
+            if a < b or randint(0, 20) == 0:    # まれに閉路ができる
+                adj[perm[a]].append(perm[b])
+        G = nx.DiGraph()
+        G.add_nodes_from(range(n))
+        G.add_edges_from((u, v) for u in range(n) for v in adj[u])
+        is_dag = nx.is_directed_acyclic_graph(G)
+        results = [topological_sort(adj, method) for method in ('bfs', 'dfs', 'lexicographic')]
+        results.append(topological_levels(adj))
+        for ok, res in results:
+            assert ok == is_dag
+            if not ok:
+                assert len(set(res)) == len(res) > 0
+                assert all(G.has_edge(res[i-1], res[i]) for i in range(len(res)))
+        if not is_dag:
+            continue
+        for ok, order in results[:3]:
+            position = [0] * n
+            for i, v in enumerate(order):
+                position[v] = i
+            assert sorted(order) == list(range(n))
+            assert all(position[u] < position[v] for u in range(n) for v in adj[u])
+        assert results[2][1] == list(nx.lexicographical_topological_sort(G))
+        # レベルは「その頂点で終わる最長パスの辺の本数」
+        depth = [0] * n
+        for u in results[0][1]:
+            for v in adj[u]:
+                depth[v] = max(depth[v], depth[u] + 1)
+        levels = results[3][1]
+        assert levels == [sorted(v for v in range(n) if depth[v] == k) for k in range(len(levels))]
+        assert sum(map(len, levels)) == n
+    with pytest.raises(ValueError):
+        topological_sort([[]], method='kahn')
+
+
+
+def test_topological_dfs_long_path():
+    """ 再帰を用いていないので、長いパスグラフでも RecursionError とならないか """
+    n = 2 * 10**5
+    adj = [[i+1] for i in range(n-1)] + [[]]
+    assert topological_dfs(adj) == list(range(n))
+    assert topological_dfs([[i-1] if i else [] for i in range(n)]) == list(range(n-1, -1, -1))
+    assert topological_sort(adj, 'dfs') == (True, list(range(n)))
+    adj[-1].append(0)    # 全頂点を通る閉路
+    ok, cycle = topological_sort(adj, 'dfs')
+    assert not ok and cycle == list(range(n))
+
+
+
+
+if __name__ == "__main__":
+    pytest.main(['-v', __file__])
@@ -0,0 +1,48 @@
+import pytest
+from itertools import product
+from random import randint, random
+from mypkg.graphs.traverse.two_sat import TwoSat
+
+
+
+def test_two_sat():
+    """
+    変数の数が最大 N の 2-SAT をランダム生成することを Iteration 回行う。
+    節を一つずつ追加しながら solve() し、全探索による充足可能性の判定と照合する。
+    充足可能な場合は、返された割り当てが全ての節を満たすかも確かめる。
+    """
+    Iteration = 100
+    N = 8
+    for _ in range(Iteration):
+        n = randint(1, N)
+        ts = TwoSat(n)
+        clauses = []
+        for _ in range(randint(1, 3 * n)):
+            clause = (randint(0, n-1), random() < 0.5, randint(0, n-1), random() < 0.5)
+            ts.add_clause(*clause)
+            clauses.append(clause)
+            expected = any(all(x[i] == f or x[j] == g for i, f, j, g in clauses)
+                           for x in product((False, True), repeat=n))
+            assignment = ts.solve()
+            assert (assignment is not None) == expected
+            if assignment is not None:
+                assert all(assignment[i] == f or assignment[j] == g for i, f, j, g in clauses)
+
+
+
+def test_two_sat_long_chain():
+    """ 長い含意の連鎖 x0 -> x1 -> ... -> x_{n-1} でも RecursionError とならないか """
+    n = 2 * 10**5
+    ts = TwoSat(n)
+    for i in range(n - 1):
+        ts.add_implication(i, True, i + 1, True)
+    ts.add_clause(0, True, 0, True)
+    assert ts.solve() == [True] * n
+    ts.add_clause(n - 1, False, n - 1, False)
+    assert ts.solve() is None
+
+
+
+
+if __name__ == "__main__":
+    pytest.main(['-v', __file__])